@@ -124,5 +124,11 @@ APPLICATION_OPTIONAL_IMPORT_EXEMPTIONS = frozenset(
         # The current supported Gemini path does not require this legacy SDK,
         # and the PyInstaller spec excludes it deliberately.
         ("src/gemini_transcribe.py", "google.generativeai"),
+        # ``src.web_api`` encodes REST responses and WebSocket broadcasts with
+        # orjson when a developer environment has it. Packaged builds do not
+        # ship it and always use stdlib json.
+        ("src/web_api.py", "orjson"),
+        # uvloop only backs the POSIX development server; Windows has no build.
+        ("src/web_api.py", "uvloop"),
     }
 )
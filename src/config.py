@@ -877,8 +877,8 @@ ${output}"""
         add("ASSEMBLYAI_API_KEY", cls.ASSEMBLYAI_API_KEY or "")
         add("ELEVENLABS_API_KEY", cls.ELEVENLABS_API_KEY or "")
         add("GOOGLE_APPLICATION_CREDENTIALS", cls.GOOGLE_APPLICATION_CREDENTIALS or "")
-        add("GOOGLE_API_KEY", getattr(cls, "GOOGLE_API_KEY", "") or "")
-        add("YOUTUBE_API_KEY", getattr(cls, "YOUTUBE_API_KEY", "") or "")
+        add("GOOGLE_API_KEY", cls.GOOGLE_API_KEY or "")
+        add("YOUTUBE_API_KEY", cls.YOUTUBE_API_KEY or "")
         add("DEEPGRAM_API_KEY", cls.DEEPGRAM_API_KEY or "")
         add("OPENAI_API_KEY", cls.OPENAI_API_KEY or "")
         add("OPENROUTER_API_KEY", cls.OPENROUTER_API_KEY or "")
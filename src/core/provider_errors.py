@@ -516,18 +516,21 @@ def _normalize_provider(provider: str | None, raw: str) -> str:
     return normalized
 
 
+_PROVIDER_FAMILIES = {
+    "soniox": "soniox",
+    "soniox_async": "soniox",
+    "azure_mai": "azure",
+    "mistral": "mistral",
+    "mistral_async": "mistral",
+    "smallest": "smallest",
+    "smallest_async": "smallest",
+    "modulate": "modulate",
+    "modulate_async": "modulate",
+}
+
+
 def _provider_family(provider: str) -> str:
-    if provider in {"soniox", "soniox_async"}:
-        return "soniox"
-    if provider == "azure_mai":
-        return "azure"
-    if provider in {"mistral", "mistral_async"}:
-        return "mistral"
-    if provider in {"smallest", "smallest_async"}:
-        return "smallest"
-    if provider in {"modulate", "modulate_async"}:
-        return "modulate"
-    return provider
+    return _PROVIDER_FAMILIES.get(provider, provider)
 
 
 def _provider_label(provider: str) -> str:
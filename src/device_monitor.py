@@ -79,6 +79,10 @@ _EXCLUDE_PATTERNS = (
 )
 _OUTPUT_HINTS = ("output", "speaker", "lautsprecher", "headphone", "pc-lautsprecher")
 _GENERIC_INPUT_RE = re.compile(r"^\s*input\s*\(\s*\)\s*$", re.IGNORECASE)
+_VIRTUAL_OR_OUTPUT_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in (*_EXCLUDE_PATTERNS, *_OUTPUT_HINTS)),
+    re.IGNORECASE,
+)
 _WINDOWS_ENDPOINT_FLOW_RE = re.compile(r"\{0\.0\.(\d+)\.", re.IGNORECASE)
 _E_RENDER = 0
 _E_CAPTURE = 1
@@ -172,10 +176,7 @@ def _looks_virtual_or_output(name: str) -> bool:
         return True
     if _GENERIC_INPUT_RE.match(name):
         return True
-    lowered = name.lower()
-    if any(pattern in lowered for pattern in _EXCLUDE_PATTERNS):
-        return True
-    return any(pattern in lowered for pattern in _OUTPUT_HINTS)
+    return _VIRTUAL_OR_OUTPUT_RE.search(name) is not None
 
 
 def _pick_primary_hostapi(
@@ -727,8 +728,10 @@ class DeviceMonitor:
         with self._state_lock:
             if force or signature != self._signature:
                 changed = True
-            self._devices = devices
-            self._signature = signature
+                self._devices = devices
+                self._signature = signature
+            # An unchanged poll keeps the already formatted list; readers keep
+            # copying the same entries instead of a fresh identical rebuild.
 
         if changed:
             with self._state_lock:
@@ -1652,6 +1652,9 @@ class MicrophoneInput(BaseInputTransport):
         self._channel_selection_interval_frames = 10
         self._last_audio_level_at = 0.0
         self._audio_level_interval = 1.0 / 60.0
+        # Reused float32 scratch for level RMS so the callback does not allocate
+        # two temporary arrays per metered block. Sized up on first use.
+        self._audio_level_scratch = np.empty(0, dtype=np.float32)
         self._last_observed_rms = 0.0
         self._max_observed_rms = 0.0
         self._audio_level_sample_count = 0
@@ -2077,8 +2080,15 @@ class MicrophoneInput(BaseInputTransport):
                 # Optimized RMS: use int16 view directly, compute in float32 for speed
                 # Use the exact frame we send downstream (after channel selection/downmix).
                 samples = np.asarray(output_data).astype(np.int16, copy=False).ravel()
-                # Use float32 for faster computation than float64
-                rms = np.sqrt(np.mean(samples.astype(np.float32) ** 2)) / 32768.0
+                # Use float32 for faster computation than float64, converted into
+                # the reused scratch buffer and reduced with one dot product.
+                sample_count = samples.size
+                scratch = self._audio_level_scratch
+                if scratch.size < sample_count:
+                    scratch = self._audio_level_scratch = np.empty(sample_count, dtype=np.float32)
+                levels = scratch[:sample_count]
+                np.copyto(levels, samples)
+                rms = np.sqrt(np.dot(levels, levels) / sample_count) / 32768.0 if sample_count else 0.0
 
                 # Speech-focused gating (dynamic noise floor + hysteresis)
                 db = 20.0 * float(np.log10(rms + 1e-6))
@@ -28,12 +28,16 @@ _OVERLAY_STATUS_TIMEOUT_SECONDS = 0.75
 _OVERLAY_AUDIO_TIMEOUT_SECONDS = 0.35
 
 
+_OVERLAY_COMMAND_TIMEOUTS = {
+    "overlayPrepare": _OVERLAY_TRANSITION_TIMEOUT_SECONDS,
+    "overlayShow": _OVERLAY_TRANSITION_TIMEOUT_SECONDS,
+    "overlayHide": _OVERLAY_TRANSITION_TIMEOUT_SECONDS,
+    "overlayAudioLevel": _OVERLAY_AUDIO_TIMEOUT_SECONDS,
+}
+
+
 def _overlay_command_timeout_seconds(command: str) -> float:
-    if command in {"overlayPrepare", "overlayShow", "overlayHide"}:
-        return _OVERLAY_TRANSITION_TIMEOUT_SECONDS
-    if command == "overlayAudioLevel":
-        return _OVERLAY_AUDIO_TIMEOUT_SECONDS
-    return _OVERLAY_STATUS_TIMEOUT_SECONDS
+    return _OVERLAY_COMMAND_TIMEOUTS.get(command, _OVERLAY_STATUS_TIMEOUT_SECONDS)
 
 
 def _tauri_overlay_enabled() -> bool:
@@ -121,7 +125,12 @@ def _hide_overlay() -> dict[str, Any]:
 
 
 class _OverlayAudioLevelPump:
-    """Coalesce RMS updates onto a low-rate native overlay fallback channel."""
+    """Coalesce RMS updates onto a low-rate native overlay fallback channel.
+
+    The audio reader publishes far faster than the 20 Hz native channel. Keep
+    the loudest block RMS seen since the last send instead of only the newest
+    one so short syllable peaks still reach the overlay.
+    """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
@@ -132,7 +141,8 @@ class _OverlayAudioLevelPump:
     def publish(self, rms: float) -> None:
         level = max(0.0, min(1.0, float(rms)))
         with self._lock:
-            self._latest = level
+            latest = self._latest
+            self._latest = level if latest is None or level > latest else latest
             worker = self._worker
             if worker is None or not worker.is_alive():
                 worker = threading.Thread(
@@ -151,10 +161,7 @@ class _OverlayAudioLevelPump:
             delay = _OVERLAY_AUDIO_INTERVAL_SECONDS - (time.monotonic() - last_sent_at)
             if delay > 0:
                 time.sleep(delay)
-            with self._lock:
-                level = self._latest
-                self._latest = None
-                self._wake.clear()
+            level = self._take_pending()
             if level is None:
                 continue
             _call_overlay_response(
@@ -164,6 +171,13 @@ class _OverlayAudioLevelPump:
             )
             last_sent_at = time.monotonic()
 
+    def _take_pending(self) -> float | None:
+        with self._lock:
+            level = self._latest
+            self._latest = None
+            self._wake.clear()
+        return level
+
 
 _audio_level_pump = _OverlayAudioLevelPump()
 
@@ -248,6 +248,25 @@ class _AnalyzerCache:
         except Exception as exc:
             logger.debug(f"Unused {label} analyzer cleanup failed: {exc}")
 
+    @classmethod
+    def _empty_slots_needed_locked(
+        cls,
+        *,
+        include_vad: bool,
+        include_smart_turn: bool,
+    ) -> tuple[bool, bool]:
+        """Return which warm slots are worth constructing; caller holds the lock."""
+        # Warm analyzers are only ever claimed by VAD-segmented sessions. With
+        # the setting off nothing consumes their output, so skip the ONNX model
+        # load entirely instead of building one and discarding it afterwards.
+        if not bool(Config.SEGMENT_SPEECH_WITH_VAD):
+            return False, False
+        needs_vad = bool(include_vad and HAS_SILERO_VAD and SileroVADAnalyzer and cls._vad_analyzer is None)
+        needs_smart_turn = bool(
+            include_smart_turn and HAS_SMART_TURN and LocalSmartTurnAnalyzerV3 and cls._smart_turn_analyzer is None
+        )
+        return needs_vad, needs_smart_turn
+
     @classmethod
     def prewarm(
         cls,
@@ -259,9 +278,9 @@ class _AnalyzerCache:
         with cls._lock:
             vad_generation = cls._vad_generation
             smart_turn_generation = cls._smart_turn_generation
-            needs_vad = bool(include_vad and HAS_SILERO_VAD and SileroVADAnalyzer and cls._vad_analyzer is None)
-            needs_smart_turn = bool(
-                include_smart_turn and HAS_SMART_TURN and LocalSmartTurnAnalyzerV3 and cls._smart_turn_analyzer is None
+            needs_vad, needs_smart_turn = cls._empty_slots_needed_locked(
+                include_vad=include_vad,
+                include_smart_turn=include_smart_turn,
             )
 
         # Model construction stays outside the lock. A hotkey arriving during
@@ -309,9 +328,9 @@ class _AnalyzerCache:
     ) -> bool:
         """Refill empty warm slots on a daemon thread after session teardown."""
         with cls._lock:
-            needs_vad = bool(include_vad and HAS_SILERO_VAD and SileroVADAnalyzer and cls._vad_analyzer is None)
-            needs_smart_turn = bool(
-                include_smart_turn and HAS_SMART_TURN and LocalSmartTurnAnalyzerV3 and cls._smart_turn_analyzer is None
+            needs_vad, needs_smart_turn = cls._empty_slots_needed_locked(
+                include_vad=include_vad,
+                include_smart_turn=include_smart_turn,
             )
             if cls._refill_in_progress or not (needs_vad or needs_smart_turn):
                 return False
@@ -515,10 +534,39 @@ def _analyzer_warmup_enabled() -> bool:
     return bool(Config.MIC_ALWAYS_ON) or explicit in {"1", "true", "yes", "on"}
 
 
+def _coalesce_sub_window_vad_audio(vad_analyzer: Any) -> None:
+    """Dispatch Silero work once per full model window instead of per frame.
+
+    Pipecat 1.5 hops to the analyzer executor for every audio frame, even when
+    the frame only tops up its pending window buffer. Silero is recurrent, so
+    windows cannot be batched into one inference call; short capture blocks are
+    instead appended on the loop and the executor runs once a window is ready.
+    """
+
+    analyze_audio = getattr(vad_analyzer, "analyze_audio", None)
+    if not callable(analyze_audio) or not isinstance(getattr(vad_analyzer, "_vad_buffer", None), bytes):
+        return
+
+    async def analyze_coalesced(buffer: bytes):
+        # The window size and state exist only after Pipecat's StartFrame sets
+        # the sample rate; before that, defer to the stock implementation.
+        window_bytes = getattr(vad_analyzer, "_vad_frames_num_bytes", 0)
+        pending = vad_analyzer._vad_buffer
+        if window_bytes and len(pending) + len(buffer) < window_bytes:
+            # Pipecat awaits each analysis before the next frame, so no
+            # executor call can be mutating this buffer concurrently.
+            vad_analyzer._vad_buffer = pending + buffer
+            return vad_analyzer._vad_state
+        return await analyze_audio(buffer)
+
+    vad_analyzer.analyze_audio = analyze_coalesced
+
+
 def _create_vad_analyzer(*, quiet_mic: bool = False):
     vad_analyzer = _AnalyzerCache.acquire_vad_analyzer()
     if not vad_analyzer:
         return None
+    _coalesce_sub_window_vad_audio(vad_analyzer)
     if quiet_mic and VADParams:
         try:
             vad_analyzer.set_sample_rate(Config.SAMPLE_RATE)
@@ -1614,6 +1662,29 @@ class ConnectionErrorHandlerProcessor(FrameProcessor):
 class PipecatVadSpeechObserver(FrameProcessor):
     """Tracks Pipecat VAD speech events for diagnostics and silent-session skips."""
 
+    # Concrete frame type -> "audio" / "started" / "stopped" / None. Every
+    # audio frame of a live session passes through here, so classify each
+    # type once with isinstance semantics and then dispatch on ``type(frame)``.
+    _frame_kinds: dict[type, str | None] = {}
+
+    @classmethod
+    def _frame_kind(cls, frame_type: type) -> str | None:
+        kinds = cls._frame_kinds
+        try:
+            return kinds[frame_type]
+        except KeyError:
+            pass
+        if issubclass(frame_type, InputAudioRawFrame):
+            kind = "audio"
+        elif issubclass(frame_type, (VADUserStartedSpeakingFrame, UserStartedSpeakingFrame)):
+            kind = "started"
+        elif issubclass(frame_type, (VADUserStoppedSpeakingFrame, UserStoppedSpeakingFrame)):
+            kind = "stopped"
+        else:
+            kind = None
+        kinds[frame_type] = kind
+        return kind
+
     def __init__(self, *, enabled: bool):
         super().__init__()
         self.enabled = bool(enabled)
@@ -1632,18 +1703,18 @@ class PipecatVadSpeechObserver(FrameProcessor):
         # canonical downstream VAD path so a downstream UserTurnProcessor's
         # generic frames cannot double the diagnostics on their upstream leg.
         if self.enabled and direction == FrameDirection.DOWNSTREAM:
-            now = time.monotonic()
-            if isinstance(frame, InputAudioRawFrame):
+            kind = self._frame_kind(type(frame))
+            if kind == "audio":
                 self._audio_frame_count += 1
-            elif isinstance(frame, (VADUserStartedSpeakingFrame, UserStartedSpeakingFrame)):
+            elif kind == "started":
                 self._started_count += 1
                 self._speaking = True
                 self._speech_observed = True
-                self._last_started_at = now
-            elif isinstance(frame, (VADUserStoppedSpeakingFrame, UserStoppedSpeakingFrame)):
+                self._last_started_at = time.monotonic()
+            elif kind == "stopped":
                 self._stopped_count += 1
                 self._speaking = False
-                self._last_stopped_at = now
+                self._last_stopped_at = time.monotonic()
 
         await self.push_frame(frame, direction)
 
@@ -3680,11 +3751,15 @@ class ScriberPipeline:
                 )
 
                 if needs_vad:
-                    vad_analyzer = _create_vad_analyzer(
+                    # Pipecat already runs Silero inference on the analyzer's
+                    # own single-thread executor. A warm-slot miss still loads
+                    # the ONNX session here, so keep that off the event loop.
+                    vad_analyzer = await asyncio.to_thread(
+                        _create_vad_analyzer,
                         quiet_mic=(
                             self.service_name == "onnx_local"
                             or _live_service_uses_async_finalization(self.service_name)
-                        )
+                        ),
                     )
                     if not vad_analyzer:
                         logger.warning(
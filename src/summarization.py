@@ -6,10 +6,13 @@ Supports OpenAI, Google Gemini, and OpenRouter models.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib
 import json
 import math
 import os
 import re
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Any, Literal
 
@@ -105,6 +108,25 @@ _HTML_OUTPUT_GUARDRAIL = (
     "- Do not create links. Preserve a source URL as plain text only when it materially supports the summary."
 )
 
+# Exact-match memo of recent summaries keyed by model, budget and prompt, so an
+# identical transcript is not re-sent to the provider (e.g. a re-imported
+# video). Bounded LRU; entries hold only the normalized HTML summary.
+_SUMMARY_CACHE_MAX_ENTRIES = 32
+_summary_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _summary_cache_key(model: str, max_output_tokens: int, prompt: str) -> str:
+    digest = hashlib.sha256(f"{model}\0{max_output_tokens}\0".encode())
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _remember_summary(key: str, summary: str) -> None:
+    _summary_cache[key] = summary
+    _summary_cache.move_to_end(key)
+    while len(_summary_cache) > _SUMMARY_CACHE_MAX_ENTRIES:
+        _summary_cache.popitem(last=False)
+
 
 def _normalized_language_hint(value: Any) -> str:
     """Return a bounded BCP-47-ish hint without treating it as authority.
@@ -737,6 +759,7 @@ async def summarize_text(
     *,
     duration: str | None = None,
     fallback_language: str | None = None,
+    reuse_cached: bool = False,
 ) -> str:
     """
     Summarize text using the configured LLM model.
@@ -744,6 +767,7 @@ async def summarize_text(
     Args:
         text: The transcript text to summarize
         model: Optional override for the model (uses Config.SUMMARIZATION_MODEL if not provided)
+        reuse_cached: Return a recent summary of the identical prompt instead of calling the model
 
     Returns:
         The summarized text
@@ -755,7 +779,7 @@ async def summarize_text(
     if not text or not text.strip():
         return ""
 
-    model = model or getattr(Config, "SUMMARIZATION_MODEL", Config.DEFAULT_SUMMARIZATION_MODEL)
+    model = model or Config.SUMMARIZATION_MODEL or Config.DEFAULT_SUMMARIZATION_MODEL
     if _is_openrouter_model(model):
         model = _openrouter_nitro_model(model)
     base_prompt = Config.SUMMARIZATION_PROMPT or "Summarize the following transcript:"
@@ -771,6 +795,13 @@ async def summarize_text(
         f"{base_prompt}\n\n{language_instruction}\n\n{length_instruction}\n\n"
         f"{_HTML_OUTPUT_GUARDRAIL}\n\nUNTRUSTED_TRANSCRIPT_TEXT:\n{text}"
     )
+    cache_key = _summary_cache_key(model, output_tokens, full_prompt)
+    if reuse_cached:
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            _summary_cache.move_to_end(cache_key)
+            logger.info("Reusing cached summary for identical transcript input ({})", model)
+            return cached
 
     logger.info(
         "Summarizing transcript with {} ({} chars, ~{} words, target ~{} words, duration_s={}, max_output_tokens={})",
@@ -878,6 +909,7 @@ async def summarize_text(
                 raise
         else:
             raise
+    _remember_summary(cache_key, summary)
     return summary
 
 
@@ -896,7 +928,7 @@ async def generate_text_with_model(
     if not prompt or not prompt.strip():
         return ""
 
-    selected_model = model or getattr(Config, "SUMMARIZATION_MODEL", Config.DEFAULT_SUMMARIZATION_MODEL)
+    selected_model = model or Config.SUMMARIZATION_MODEL or Config.DEFAULT_SUMMARIZATION_MODEL
     if _is_openrouter_model(selected_model):
         selected_model = _openrouter_nitro_model(selected_model)
     model_key = _openrouter_nitro_model(selected_model) if _is_openrouter_model(selected_model) else selected_model
@@ -944,7 +976,8 @@ async def _summarize_openai(prompt: str, model: str, max_output_tokens: int) ->
         raise ValueError("OpenAI API key not configured. Please add it in Settings.")
 
     try:
-        import openai
+        # The first import of the SDK takes over a second; keep it off the event loop.
+        openai = await asyncio.to_thread(importlib.import_module, "openai")
     except ImportError as exc:
         raise RuntimeError("openai library not installed. Run: pip install openai") from exc
 
@@ -8,15 +8,17 @@ import ipaddress
 import json
 import os
 import re
+import secrets
 import shutil
 import signal
 import threading
 import time
 import weakref
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal
 from urllib.parse import quote, urljoin, urlparse
@@ -258,6 +260,18 @@ from src.youtube_download import (
     download_youtube_transcript,
 )
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    # Hand datetimes and dataclasses back to the stdlib fallback so they fail
+    # the same way with and without orjson.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+    _ORJSON_OPTIONS = 0
+
 TranscriptStatus = Literal["completed", "processing", "failed", "recording", "stopped"]
 TranscriptType = Literal["mic", "youtube", "file", "meeting"]
 SummaryStatus = Literal["idle", "pending", "completed", "failed"]
@@ -554,15 +568,22 @@ _WEB_PORT_ENV = "SCRIBER_WEB_PORT"
 _DISABLE_HOTKEYS_ENV = "SCRIBER_DISABLE_HOTKEYS"
 _SESSION_TOKEN_ENV = "SCRIBER_SESSION_TOKEN"
 _FRONTEND_DIST_DIR_ENV = "SCRIBER_FRONTEND_DIST_DIR"
-_DEFAULT_ALLOWED_HOSTS = {"localhost", "127.0.0.1", "::1", "tauri.localhost"}
-_DEFAULT_ALLOWED_CUSTOM_ORIGINS = {"tauri://localhost"}
+_DEFAULT_ALLOWED_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "tauri.localhost"})
+_DEFAULT_ALLOWED_CUSTOM_ORIGINS = frozenset({"tauri://localhost"})
+_DEFAULT_ALLOWED_ORIGIN_SCHEMES = frozenset({"http", "https"})
 _PRIVATE_NETWORK_ACCESS_REQUEST_HEADER = "Access-Control-Request-Private-Network"
 _PRIVATE_NETWORK_ACCESS_ALLOW_HEADER = "Access-Control-Allow-Private-Network"
-_YOUTUBE_THUMBNAIL_ALLOWED_HOSTS = {"i.ytimg.com", "img.youtube.com"}
+_YOUTUBE_THUMBNAIL_ALLOWED_HOSTS = frozenset({"i.ytimg.com", "img.youtube.com"})
 _YOUTUBE_THUMBNAIL_MAX_BYTES = 2 * 1024 * 1024
 _allowed_origins_cache_lock = threading.Lock()
 _allowed_origins_cache_raw: str | None = None
-_allowed_origins_cache: tuple[str, ...] = ()
+_allowed_origins_cache: frozenset[str] = frozenset()
+# Verdicts for the built-in loopback origin policy. Browsers send the same
+# handful of Origin values on every request, so urlparse runs once per origin.
+_DEFAULT_ORIGIN_VERDICTS_MAX = 64
+_default_origin_verdicts: dict[str, bool] = {}
+_upload_limit_override_cache_raw: tuple[str, str] | None = None
+_upload_limit_override_cache: int | None = None
 _RUST_AUDIO_PROTOTYPE_AVAILABLE = False
 _AUDIO_DIAGNOSTIC_IMPORTS = (
     "pyloudnorm",
@@ -576,6 +597,20 @@ _AUDIO_DIAGNOSTIC_IMPORT_CACHE: dict[str, dict[str, Any]] | None = None
 _SESSION_TOKEN_HEADER = "X-Scriber-Token"
 _SESSION_TOKEN_QUERY = "scriberToken"
 _WS_SEND_TIMEOUT_SECONDS = 1.0
+# The audio-level writer outlives single ticks so a 60 Hz meter reuses one
+# task; it retires after this long without a new level (recording stopped).
+_AUDIO_BROADCAST_WRITER_IDLE_SECONDS = 0.25
+_AUDIO_LEVEL_BROADCAST_INTERVAL_SECONDS = 1.0 / 60.0
+_HOTKEY_POLL_INTERVAL_SECONDS = 0.05
+# Idle pollers wake on the keyboard hook, but still poll at this pace in case
+# hook delivery stalls the same way add_hotkey callbacks can.
+_HOTKEY_IDLE_POLL_BACKSTOP_SECONDS = 1.0
+# Direct PortAudio enumeration (device monitor disabled or still empty) is
+# reused this long; GET /api/microphones?refresh=1 forces a fresh listing.
+_DIRECT_MICROPHONE_LIST_TTL_SECONDS = 5.0
+# The settings debounce restarts on every mutation; a continuous burst of
+# saves still reaches disk once the first unsaved change is this old.
+_SETTINGS_PERSIST_MAX_DELAY_SECONDS = 2.0
 # Shared by the app-owned HTTP session and background Outlook maintenance.
 # A bare aiohttp ClientSession defaults to a roughly five-minute total timeout,
 # which can otherwise hold the Outlook mutation lane and delay Disconnect.
@@ -888,33 +923,36 @@ def _meeting_stt_cost_estimate(provider: str, mode: str) -> dict[str, Any]:
     }
 
 
-_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_FILENAME_TRANSLATE = str.maketrans({char: "_" for char in '<>:"/\\|?*'} | {code: "_" for code in range(0x20)})
 _MAX_UPLOAD_FILENAME_CHARS = 180
 _MAX_DELETED_TRANSCRIPT_TOMBSTONES = 4096
-_WINDOWS_RESERVED_NAMES = {
-    "CON",
-    "PRN",
-    "AUX",
-    "NUL",
-    "COM1",
-    "COM2",
-    "COM3",
-    "COM4",
-    "COM5",
-    "COM6",
-    "COM7",
-    "COM8",
-    "COM9",
-    "LPT1",
-    "LPT2",
-    "LPT3",
-    "LPT4",
-    "LPT5",
-    "LPT6",
-    "LPT7",
-    "LPT8",
-    "LPT9",
-}
+_WINDOWS_RESERVED_NAMES = frozenset(
+    {
+        "CON",
+        "PRN",
+        "AUX",
+        "NUL",
+        "COM1",
+        "COM2",
+        "COM3",
+        "COM4",
+        "COM5",
+        "COM6",
+        "COM7",
+        "COM8",
+        "COM9",
+        "LPT1",
+        "LPT2",
+        "LPT3",
+        "LPT4",
+        "LPT5",
+        "LPT6",
+        "LPT7",
+        "LPT8",
+        "LPT9",
+    }
+)
+_WINDOWS_RESERVED_NAME_MAX_CHARS = max(map(len, _WINDOWS_RESERVED_NAMES))
 
 
 def _normalize_input_warning_actions(actions: list[dict[str, Any]] | None) -> list[dict[str, str]]:
@@ -947,7 +985,7 @@ def _input_warning_actions_for_code(code: str) -> list[dict[str, str]]:
 def _safe_upload_filename(name: str) -> str:
     raw = (name or "").strip()
     base = Path(raw).name
-    base = _INVALID_FILENAME_CHARS.sub("_", base).rstrip(" .")
+    base = base.translate(_FILENAME_TRANSLATE).rstrip(" .")
     if not base or base in {".", ".."}:
         return "uploaded_file"
     if len(base) > _MAX_UPLOAD_FILENAME_CHARS:
@@ -955,8 +993,9 @@ def _safe_upload_filename(name: str) -> str:
         suffix = path.suffix
         stem_limit = max(1, _MAX_UPLOAD_FILENAME_CHARS - len(suffix))
         base = f"{path.stem[:stem_limit]}{suffix}"
-    stem = Path(base).stem
-    if stem.upper() in _WINDOWS_RESERVED_NAMES:
+    # Same stem as Path(base).stem; only short stems can be reserved names.
+    stem = base.rpartition(".")[0] or base
+    if len(stem) <= _WINDOWS_RESERVED_NAME_MAX_CHARS and stem.upper() in _WINDOWS_RESERVED_NAMES:
         base = f"_{base}"
     return base
 
@@ -1322,7 +1361,7 @@ def _frontend_file_for_request(frontend_root: Path, request_path: str) -> Path |
     return root / "index.html"
 
 
-def _parse_allowed_origins() -> tuple[str, ...]:
+def _parse_allowed_origins() -> frozenset[str]:
     global _allowed_origins_cache_raw, _allowed_origins_cache
     raw = os.getenv(_ALLOWED_ORIGINS_ENV, "")
     if raw == _allowed_origins_cache_raw:
@@ -1337,7 +1376,7 @@ def _parse_allowed_origins() -> tuple[str, ...]:
                 if val:
                     cleaned.append(val)
         _allowed_origins_cache_raw = raw
-        _allowed_origins_cache = tuple(cleaned)
+        _allowed_origins_cache = frozenset(cleaned)
         return _allowed_origins_cache
 
 
@@ -1350,10 +1389,20 @@ def _origin_allowed(origin: str) -> bool:
         return True
     if allowed:
         return origin in allowed
+    verdict = _default_origin_verdicts.get(origin)
+    if verdict is None:
+        verdict = _default_origin_allowed(origin)
+        if len(_default_origin_verdicts) >= _DEFAULT_ORIGIN_VERDICTS_MAX:
+            _default_origin_verdicts.clear()
+        _default_origin_verdicts[origin] = verdict
+    return verdict
+
+
+def _default_origin_allowed(origin: str) -> bool:
     if origin.rstrip("/") in _DEFAULT_ALLOWED_CUSTOM_ORIGINS:
         return True
     parsed = urlparse(origin)
-    if parsed.scheme not in {"http", "https"}:
+    if parsed.scheme not in _DEFAULT_ALLOWED_ORIGIN_SCHEMES:
         return False
     host = parsed.hostname
     if not host:
@@ -1530,6 +1579,93 @@ def _payload_bool(payload: dict[str, Any], key: str) -> bool | None:
     return value if isinstance(value, bool) else None
 
 
+# Settings fields that need no validation or side effects beyond their Config
+# setter, applied table-driven by update_settings. Setters are looked up by
+# name at apply time so patched Config methods are honored.
+_SETTINGS_PLAIN_SETTERS: tuple[tuple[str, str], ...] = (
+    ("language", "set_language"),
+    ("summarizationPrompt", "set_summarization_prompt"),
+    ("postProcessingPrompt", "set_post_processing_prompt"),
+    ("openaiSttModel", "set_openai_stt_model"),
+    ("openaiRealtimeSttModel", "set_openai_realtime_stt_model"),
+)
+_SETTINGS_BOOL_SETTERS: tuple[tuple[str, str], ...] = (
+    ("debug", "set_debug"),
+    ("meetingSmartTurnEnabled", "set_meeting_smart_turn_enabled"),
+    ("meetingAutoAnalyze", "set_meeting_auto_analyze"),
+    ("meetingAecEnabled", "set_meeting_aec_enabled"),
+    ("speakerDiarizationFallbackEnabled", "set_speaker_diarization_fallback_enabled"),
+    ("youtubePreferCaptions", "set_youtube_prefer_captions"),
+    ("postProcessingEnabled", "set_post_processing_enabled"),
+    ("onnxUseGpu", "set_onnx_use_gpu"),
+)
+# Text fields without a Config setter: (payload key, Config attribute, env var).
+_SETTINGS_TEXT_ATTRIBUTES: tuple[tuple[str, str, str], ...] = (
+    ("sonioxAsyncModel", "SONIOX_ASYNC_MODEL", "SCRIBER_SONIOX_ASYNC_MODEL"),
+    ("customVocab", "CUSTOM_VOCAB", "SCRIBER_CUSTOM_VOCAB"),
+)
+# apiKeys entries persisted through Config.set_api_key, keyed by service name.
+_SETTINGS_API_KEY_SERVICES: tuple[str, ...] = (
+    "soniox",
+    "mistral",
+    "smallest",
+    "assemblyai",
+    "deepgram",
+    "openai",
+    "openrouter",
+    "cerebras",
+    "celeris",
+    "gladia",
+    "groq",
+    "speechmatics",
+    "modulate",
+    "elevenlabs",
+)
+# apiKeys entries stored directly: (payload key, Config attribute, env var, value used when blank).
+_SETTINGS_API_KEY_ATTRIBUTES: tuple[tuple[str, str, str, str], ...] = (
+    ("azureMaiSpeechKey", "AZURE_MAI_SPEECH_KEY", "AZURE_MAI_SPEECH_KEY", ""),
+    ("azureMaiRegion", "AZURE_MAI_REGION", "SCRIBER_AZURE_MAI_REGION", "northeurope"),
+    ("azureMaiModel", "AZURE_MAI_MODEL", "SCRIBER_AZURE_MAI_MODEL", "mai-transcribe-1.5"),
+    ("googleApiKey", "GOOGLE_API_KEY", "GOOGLE_API_KEY", ""),
+    ("googleApplicationCredentials", "GOOGLE_APPLICATION_CREDENTIALS", "GOOGLE_APPLICATION_CREDENTIALS", ""),
+    ("youtubeApiKey", "YOUTUBE_API_KEY", "YOUTUBE_API_KEY", ""),
+)
+# Fields that always take the full update path: saving them re-checks
+# provider/model readiness, or get_settings() shows a resolved value (the
+# favorite or first available mic, a default model or prompt) rather than the
+# stored one, so matching the snapshot does not mean Config already holds it.
+_SETTINGS_NOOP_RECHECK_KEYS = frozenset(
+    {
+        "defaultSttService",
+        "postProcessingEngine",
+        "localPolishingVariant",
+        "micDevice",
+        "favoriteMic",
+        "summarizationModel",
+        "postProcessingModel",
+        "postProcessingPrompt",
+    }
+)
+# apiKeys entries that get_settings() shows with a default when unset.
+_SETTINGS_NOOP_RECHECK_API_KEYS = frozenset(key for key, _attr, _env, blank in _SETTINGS_API_KEY_ATTRIBUTES if blank)
+
+
+def _settings_payload_is_noop(payload: dict[str, Any], current: dict[str, Any]) -> bool:
+    """Return True when every payload field already equals the current settings snapshot."""
+    for key, value in payload.items():
+        if key in _SETTINGS_NOOP_RECHECK_KEYS or key not in current:
+            return False
+        if key == "apiKeys":
+            current_keys = current["apiKeys"]
+            if not isinstance(value, dict) or any(
+                k in _SETTINGS_NOOP_RECHECK_API_KEYS or current_keys.get(k) != v for k, v in value.items()
+            ):
+                return False
+        elif current[key] != value:
+            return False
+    return True
+
+
 def _normalize_upload_provider(provider: str | None) -> str:
     return (provider or "").strip().lower()
 
@@ -1542,7 +1678,16 @@ def _configured_file_upload_provider() -> str:
 
 
 def _get_upload_limit_override_bytes() -> int | None:
-    raw_bytes = os.getenv(_UPLOAD_MAX_BYTES_ENV, "").strip()
+    global _upload_limit_override_cache_raw, _upload_limit_override_cache
+    raw = (os.getenv(_UPLOAD_MAX_BYTES_ENV, ""), os.getenv(_UPLOAD_MAX_MB_ENV, ""))
+    if raw != _upload_limit_override_cache_raw:
+        _upload_limit_override_cache = _parse_upload_limit_override(*raw)
+        _upload_limit_override_cache_raw = raw
+    return _upload_limit_override_cache
+
+
+def _parse_upload_limit_override(raw_bytes: str, raw_mb: str) -> int | None:
+    raw_bytes = raw_bytes.strip()
     if raw_bytes:
         try:
             value = int(raw_bytes)
@@ -1550,7 +1695,7 @@ def _get_upload_limit_override_bytes() -> int | None:
                 return value
         except Exception:
             pass
-    raw_mb = os.getenv(_UPLOAD_MAX_MB_ENV, "").strip()
+    raw_mb = raw_mb.strip()
     if raw_mb:
         try:
             value = float(raw_mb)
@@ -1776,13 +1921,20 @@ async def _extract_audio_from_video(video_path: Path, output_dir: Path) -> Path:
     return audio_path
 
 
+# Multipart file uploads are read in 4 MiB chunks; disk writes are batched
+# to the larger size and run in a worker thread so the event loop never
+# blocks on file I/O.
+_UPLOAD_READ_CHUNK_BYTES = 4 * 1024 * 1024
+_UPLOAD_WRITE_BATCH_BYTES = 8 * 1024 * 1024
+
+
 async def _write_upload_stream_to_disk(
     file_field: Any,
     save_path: Path,
     *,
     max_bytes: int,
-    chunk_size: int = 1024 * 1024,
-    write_batch_size: int = 8 * 1024 * 1024,
+    chunk_size: int = _UPLOAD_READ_CHUNK_BYTES,
+    write_batch_size: int = _UPLOAD_WRITE_BATCH_BYTES,
 ) -> tuple[int, bool]:
     bytes_read = 0
     too_large = False
@@ -1964,12 +2116,14 @@ async def _render_transcript_export_async(
 
 
 def _format_duration(seconds: float) -> str:
-    total = max(0, int(seconds))
+    total = int(seconds) if seconds > 0 else 0
+    if total < 3600:
+        # Most recordings are under an hour; skip the hours split.
+        minutes, secs = divmod(total, 60)
+        return f"{minutes:02d}:{secs:02d}"
     hours, remainder = divmod(total, 3600)
     minutes, secs = divmod(remainder, 60)
-    if hours:
-        return f"{hours:d}:{minutes:02d}:{secs:02d}"
-    return f"{minutes:02d}:{secs:02d}"
+    return f"{hours:d}:{minutes:02d}:{secs:02d}"
 
 
 def _resolved_media_duration_seconds(
@@ -2010,8 +2164,34 @@ def _validate_provider_media_duration(
     )
 
 
+# Upload ingest and the transcription job both probe the same file; keep
+# successful ffprobe results keyed by path and stat identity.
+_MEDIA_DURATION_CACHE_MAX = 256
+_media_duration_cache: dict[tuple[str, int, int], float] = {}
+_media_duration_cache_lock = threading.Lock()
+
+
 def _probe_media_duration_seconds(file_path: Path) -> float | None:
     """Best-effort media duration probe via ffprobe."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+    with _media_duration_cache_lock:
+        cached = _media_duration_cache.get(key)
+    if cached is not None:
+        return cached
+    seconds = _run_ffprobe_duration_seconds(file_path)
+    if seconds is not None:
+        with _media_duration_cache_lock:
+            if len(_media_duration_cache) >= _MEDIA_DURATION_CACHE_MAX:
+                _media_duration_cache.pop(next(iter(_media_duration_cache)))
+            _media_duration_cache[key] = seconds
+    return seconds
+
+
+def _run_ffprobe_duration_seconds(file_path: Path) -> float | None:
     import math
     import subprocess
 
@@ -2050,25 +2230,83 @@ def _probe_media_duration_seconds(file_path: Path) -> float | None:
     return seconds
 
 
+_NOW_ISO_REUSE_SECONDS = 0.1
+_now_iso_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def _now_iso() -> str:
+    # Transcript progress stamps updated_at on every fragment and tick; within
+    # a short burst the same local timestamp string is reused.
+    global _now_iso_cache
+    stamp, text = _now_iso_cache
+    now = time.monotonic()
+    if now - stamp < _NOW_ISO_REUSE_SECONDS:
+        return text
+    text = datetime.now().isoformat()
+    _now_iso_cache = (now, text)
+    return text
+
+
+def _encode_json_bytes(payload: Any) -> bytes:
+    """Encode a JSON payload to UTF-8 bytes, using orjson when it is installed.
+
+    orjson is an optional development speedup and not a declared dependency,
+    so packaged builds always take the stdlib path. That path keeps json's
+    default ASCII escaping, as ``web.json_response`` did: a lone surrogate in a
+    title is escaped instead of failing the UTF-8 encode. The one remaining
+    difference is non-finite floats, which orjson writes as ``null``.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects non-str keys, oversized ints and lone surrogates
+            # that json accepts.
+            pass
+    return json.dumps(payload).encode("ascii")
+
+
+def _json_response(data: Any, *, status: int = 200) -> web.Response:
+    """``web.json_response`` replacement that encodes through ``_encode_json_bytes``."""
+    return web.Response(
+        body=_encode_json_bytes(data),
+        status=status,
+        content_type="application/json",
+        charset="utf-8",
+    )
+
+
+_DATE_LABEL_TODAY_REUSE_SECONDS = 1.0
+_date_label_today_cache: tuple[float, tzinfo | None, date, date] = (float("-inf"), None, date.min, date.min)
+
+
+def _date_label_days(tz: tzinfo | None) -> tuple[date, date]:
+    # History listings label every record; resolve today/yesterday once per second.
+    global _date_label_today_cache
+    stamp, cached_tz, today, yesterday = _date_label_today_cache
+    now = time.monotonic()
+    if now - stamp >= _DATE_LABEL_TODAY_REUSE_SECONDS or cached_tz is not tz:
+        today = datetime.now(tz).date()
+        yesterday = today - timedelta(days=1)
+        _date_label_today_cache = (now, tz, today, yesterday)
+    return today, yesterday
+
+
 def _format_date_label(ts: datetime) -> str:
-    now = datetime.now(ts.tzinfo)
-    today = now.date()
-    if ts.date() == today:
-        return f"Today, {ts.strftime('%H:%M')}"
-    if ts.date() == (today - timedelta(days=1)):
+    today, yesterday = _date_label_days(ts.tzinfo)
+    ts_date = ts.date()
+    if ts_date == today:
+        return f"Today, {ts.isoformat(timespec='minutes')[11:16]}"
+    if ts_date == yesterday:
         return "Yesterday"
-    return ts.strftime("%Y-%m-%d")
+    return ts_date.isoformat()
 
 
 def _preview_words(text: str, max_words: int = 5) -> list[str]:
     if max_words <= 0:
         return []
-    words: list[str] = []
-    for match in re.finditer(r"\S+", text or ""):
-        words.append(match.group(0))
-        if len(words) >= max_words:
-            break
-    return words
+    # split() stops after max_words cuts; the trailing element is the unsplit rest.
+    return (text or "").split(None, max_words)[:max_words]
 
 
 def _preview_from_words(words: list[str], max_words: int = 5, *, has_more: bool = False) -> str:
@@ -2173,53 +2411,60 @@ def _pipeline_stop_timeout_error(exc: BaseException) -> bool:
     return "transcription did not finish within" in str(exc or "").casefold()
 
 
+_HOTKEY_BACKEND_KEYS = {
+    "control": "ctrl",
+    "ctrl": "ctrl",
+    "shift": "shift",
+    "alt": "alt",
+    "option": "alt",
+    "meta": "windows",
+    "cmd": "windows",
+    "command": "windows",
+    "win": "windows",
+    "windows": "windows",
+}
+_HOTKEY_DISPLAY_KEYS = {
+    "ctrl": "Ctrl",
+    "alt": "Alt",
+    "shift": "Shift",
+    "windows": "Meta",
+    "win": "Meta",
+}
+
+
 def _normalize_hotkey_for_backend(display_hotkey: str) -> str:
     # Frontend records like "Ctrl + Shift + D"; keyboard expects "ctrl+shift+d".
     hotkey = (display_hotkey or "").strip()
     if not hotkey:
         return ""
-    parts = [p.strip() for p in hotkey.split("+")]
     mapped: list[str] = []
-    for part in parts:
+    for part in hotkey.split("+"):
         key = part.strip().lower()
-        if not key:
-            continue
-        if key in {"control", "ctrl"}:
-            mapped.append("ctrl")
-        elif key == "shift":
-            mapped.append("shift")
-        elif key in {"alt", "option"}:
-            mapped.append("alt")
-        elif key in {"meta", "cmd", "command", "win", "windows"}:
-            mapped.append("windows")
-        else:
-            mapped.append(key.lower())
+        if key:
+            mapped.append(_HOTKEY_BACKEND_KEYS.get(key, key))
     return "+".join(mapped)
 
 
 def _hotkey_to_display(hotkey: str) -> str:
     # Backend stores like "ctrl+shift+d"; render like "Ctrl + Shift + D".
-    parts = [p.strip() for p in (hotkey or "").split("+") if p.strip()]
     out: list[str] = []
-    for p in parts:
-        if p == "ctrl":
-            out.append("Ctrl")
-        elif p == "alt":
-            out.append("Alt")
-        elif p == "shift":
-            out.append("Shift")
-        elif p in {"windows", "win"}:
-            out.append("Meta")
-        else:
-            out.append(p.upper() if len(p) == 1 else p)
-    return " + ".join(out) if out else ""
+    for part in (hotkey or "").split("+"):
+        p = part.strip()
+        if not p:
+            continue
+        display = _HOTKEY_DISPLAY_KEYS.get(p)
+        if display is None:
+            display = p.upper() if len(p) == 1 else p
+        out.append(display)
+    return " + ".join(out)
 
 
 def _normalize_device_name(name: str) -> str:
     return normalize_device_name(name)
 
 
-@dataclass
+# History loads construct one record per stored transcript; slots drop the per-instance __dict__.
+@dataclass(slots=True)
 class TranscriptRecord:
     id: str
     title: str
@@ -2253,24 +2498,86 @@ class TranscriptRecord:
     _youtube_prefer_captions: bool | None = None
     _youtube_stt_provider_used: str = ""
     _persistence_failed: bool = False
+    _created_at_parsed: tuple[str, datetime | None] = ("", None)
+    _public_light: tuple[tuple[Any, ...], dict[str, Any]] | None = field(default=None, repr=False, compare=False)
+
+    def _public_light_key(self) -> tuple[Any, ...]:
+        # Every input of the list payload except the date label. Unchanged
+        # fields keep their objects, so the comparison short-circuits on identity.
+        return (
+            self.id,
+            self.title,
+            self.duration,
+            self.status,
+            self.type,
+            self.language,
+            self.step,
+            self.source_url,
+            self.channel,
+            self.thumbnail_url,
+            self.created_at,
+            self.updated_at,
+            self.processing_started_at,
+            self.summary_status,
+            self.summary_error,
+            self.summary_updated_at,
+            self.summary_format,
+            bool(self.summary),
+            self._preview,
+            self.content,
+            len(self._pending_content_segments),
+        )
+
+    def _created_timestamp(self) -> datetime | None:
+        # History broadcasts serialize every record; parse created_at only when it changes.
+        raw, parsed = self._created_at_parsed
+        if raw != self.created_at:
+            try:
+                parsed = datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))
+            except ValueError, TypeError:
+                parsed = None
+            self._created_at_parsed = (self.created_at, parsed)
+        return parsed
 
     def content_text(self) -> str:
         if self._pending_content_segments:
-            pending = "\n\n".join(self._pending_content_segments)
-            self.content = f"{self.content}\n\n{pending}" if self.content else pending
+            if self.content:
+                self._pending_content_segments.insert(0, self.content)
+            # One join copies the materialized text and the new segments once.
+            self.content = "\n\n".join(self._pending_content_segments)
             self._pending_content_segments.clear()
         return self.content
 
-    def to_public(self, *, include_content: bool) -> dict[str, Any]:
+    def _display_date(self) -> str:
         # Dynamically calculate date label based on created_at to ensure
         # "Today" and "Yesterday" are always accurate relative to current time
-        display_date = self.date
         if self.created_at:
-            try:
-                created_ts = datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))
-                display_date = _format_date_label(created_ts)
-            except ValueError, TypeError:
-                pass  # Fall back to stored date if parsing fails
+            created_ts = self._created_timestamp()
+            if created_ts is not None:
+                return _format_date_label(created_ts)
+            # Otherwise fall back to the stored date if parsing fails
+        return self.date
+
+    def to_public(self, *, include_content: bool) -> dict[str, Any]:
+        if include_content:
+            return self._build_public(include_content=True)
+        # History lists serialize every record on each GET and broadcast; reuse
+        # the list payload until one of its inputs changes. The date label is
+        # relative to now, so it is refreshed on every call.
+        key = self._public_light_key()
+        memo = self._public_light
+        if memo is not None and memo[0] == key:
+            light = memo[1]
+        else:
+            light = self._build_public(include_content=False)
+            # Building may materialize pending segments; key the memo on the result.
+            self._public_light = (self._public_light_key(), light)
+        data = dict(light)
+        data["date"] = self._display_date()
+        return data
+
+    def _build_public(self, *, include_content: bool) -> dict[str, Any]:
+        display_date = self._display_date()
 
         step_value = self.step
         # If summary already exists, avoid showing a stale "Summarizing..." badge.
@@ -2356,7 +2663,7 @@ class TranscriptRecord:
         if self._started_at_monotonic is not None:
             elapsed = time.monotonic() - self._started_at_monotonic
         self.duration = _format_duration(elapsed)
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
 
     def append_final_text(self, text: str) -> None:
         cleaned = (text or "").strip()
@@ -2384,7 +2691,7 @@ class TranscriptRecord:
                 max_words=_TRANSCRIPT_PREVIEW_WORDS,
                 has_more=self._preview_has_more,
             )
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
 
     def replace_content(self, text: str) -> None:
         self.content = ""
@@ -3549,14 +3856,21 @@ class ScriberWebController:
         local_polisher: LocalPolishing | None = None,
     ):
         self._loop = loop
+        # Only touched from coroutines on self._loop, so no lock is needed.
         self._clients: set[web.WebSocketResponse] = set()
-        self._clients_lock = asyncio.Lock()
         self._clients_snapshot: tuple[web.WebSocketResponse, ...] = ()
         self._clients_dirty = False
         self._client_count = 0
         self._client_send_locks: dict[web.WebSocketResponse, asyncio.Lock] = {}
         self._audio_broadcast_task: asyncio.Task | None = None
+        self._audio_broadcast_wakeup = asyncio.Event()
         self._pending_audio_payload: dict[str, Any] | None = None
+        # Written by the audio callback thread; at most one loop wakeup is
+        # outstanding and it always picks up the newest level. The lock makes
+        # the inbox swap and the wakeup flag change together.
+        self._audio_level_inbox_lock = threading.Lock()
+        self._audio_level_inbox: dict[str, Any] | None = None
+        self._audio_level_wakeup_pending = False
         self._transcript_broadcast_task: asyncio.Task | None = None
         self._pending_transcript_partial: dict[str, Any] | None = None
         self._pending_transcript_finals: deque[dict[str, Any]] = deque()
@@ -3565,6 +3879,7 @@ class ScriberWebController:
         self._device_change_task: asyncio.Task | None = None
         self._pending_device_change_devices: list[dict[str, str]] | None = None
         self._pending_device_change_reason = ""
+        self._direct_microphones_cache: tuple[float, int, int, list[dict[str, str]]] | None = None
         self._device_monitor_startup_ready = asyncio.Event()
 
         self._pipeline: Any | None = None
@@ -3643,6 +3958,10 @@ class ScriberWebController:
             "True",
         }
         self._keyboard = None
+        # Raw keyboard hook that wakes the hotkey pollers on key activity; None
+        # means the pollers fall back to a fixed tick.
+        self._keyboard_hook: Any | None = None
+        self._hotkey_key_event = asyncio.Event()
 
         self._is_listening = False
         self._is_stopping = False  # Track if stop is in progress
@@ -3696,6 +4015,7 @@ class ScriberWebController:
         self._ignore_toggle_stop_until = 0.0
         self._last_duplicate_start_toggle_log = 0.0
         self._status = "Stopped"
+        self._last_status_payload: dict[str, Any] | None = None
         self._started_at_iso = datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
         self._started_at_monotonic = time.monotonic()
         self._session_id: str | None = None
@@ -3714,8 +4034,8 @@ class ScriberWebController:
 
         self._current: TranscriptRecord | None = None
         self._current_lock = threading.Lock()
-        self._history: list[TranscriptRecord] = []
-        self._history_by_id: dict[str, TranscriptRecord] = {}
+        # Keyed by transcript ID, newest first.
+        self._history: OrderedDict[str, TranscriptRecord] = OrderedDict()
         self._history_cache_limit = max(
             25,
             _env_int("SCRIBER_HISTORY_CACHE_LIMIT", 250, minimum=25, maximum=1000),
@@ -3725,6 +4045,8 @@ class ScriberWebController:
         )
         self._deleted_transcript_ids: dict[str, None] = {}
         self._last_audio_broadcast = 0.0
+        # Session whose first-audio hot-path markers are already recorded.
+        self._audio_hot_path_marked_session: str | None = None
         self._overlay_audio_enabled = False
         self._mic_low_level_since: float | None = None
         self._mic_input_warning = ""
@@ -3761,8 +4083,15 @@ class ScriberWebController:
         self._settings_persist_json_only = False
         self._settings_persist_active_json_only = False
         self._settings_persist_generation = 0
+        self._settings_persist_first_pending_at: float | None = None
         self._settings_persist_lock = asyncio.Lock()
         self._settings_update_lock = asyncio.Lock()
+        # get_settings() snapshots tagged with the generation they were built
+        # for; bumping the generation invalidates them without a lock even when
+        # a worker-thread build finishes after a concurrent settings update.
+        self._settings_cache_generation = 0
+        self._settings_cache: tuple[int, dict[str, Any]] | None = None
+        self._settings_json: tuple[int, bytes] | None = None
         try:
             self._settings_persist_debounce_seconds = max(
                 0.0,
@@ -4140,8 +4469,15 @@ class ScriberWebController:
             self._settings_persist_task = self._loop.create_task(self._flush_settings_persist(generation))
             self._settings_persist_task.add_done_callback(self._on_settings_persist_done)
             return
+        now = self._loop.time()
+        if self._settings_persist_first_pending_at is None:
+            self._settings_persist_first_pending_at = now
+        max_delay = max(_SETTINGS_PERSIST_MAX_DELAY_SECONDS, self._settings_persist_debounce_seconds)
         self._settings_persist_handle = self._loop.call_later(
-            self._settings_persist_debounce_seconds,
+            min(
+                self._settings_persist_debounce_seconds,
+                max(0.0, self._settings_persist_first_pending_at + max_delay - now),
+            ),
             self._start_settings_persist_flush,
             generation,
         )
@@ -4171,6 +4507,7 @@ class ScriberWebController:
                 return
             json_only = self._settings_persist_json_only
             self._settings_persist_pending = False
+            self._settings_persist_first_pending_at = None
             self._settings_persist_json_only = False
             self._settings_persist_active_json_only = json_only
             try:
@@ -4196,6 +4533,7 @@ class ScriberWebController:
             else self._settings_persist_active_json_only
         )
         self._settings_persist_pending = False
+        self._settings_persist_first_pending_at = None
         self._settings_persist_json_only = False
         try:
             persist = Config.persist_json_settings if json_only else Config.persist_settings_files
@@ -4928,6 +5266,7 @@ class ScriberWebController:
 
     async def _handle_devices_changed(self, devices: list[dict[str, str]], *, reason: str = "") -> None:
         invalidate_mic_device_resolution_cache()
+        self._direct_microphones_cache = None
         favorite = (getattr(Config, "FAVORITE_MIC", "") or "").strip()
         favorite_restored = False
         restored_device_id = ""
@@ -4943,6 +5282,8 @@ class ScriberWebController:
             ):
                 Config.set_mic_device(restored_device_id)
                 logger.info(f"[DeviceMonitor] Favorite mic restored: {restored_device_label}")
+        # Invalidate after the restore so a concurrent build cannot cache the old mic.
+        self._invalidate_settings_cache()
 
         payload: dict[str, Any] = {
             "type": "microphones_updated",
@@ -5994,7 +6335,7 @@ class ScriberWebController:
             retry_label = int(round(delay_seconds))
             rec.status = "processing"
             rec.step = f"Retrying local completion in {retry_label}s ({attempts}/{self._job_max_attempts})"
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             rec.reset_transcription_attempt()
             rec._persistence_failed = persistence_retry
             self._schedule_retry_scan(delay_seconds)
@@ -6050,7 +6391,7 @@ class ScriberWebController:
                 JobStatus.COMPLETED,
                 JobStatus.FAILED,
             }:
-                rec.updated_at = datetime.now().isoformat()
+                rec.updated_at = _now_iso()
                 if current.status == JobStatus.CANCELED:
                     rec.status = "stopped"
                     rec.step = current.last_error or "Stopped by user"
@@ -6068,7 +6409,7 @@ class ScriberWebController:
             return False
         rec.status = "processing"
         rec.step = f"Retrying in {retry_label}s ({attempts}/{self._job_max_attempts})"
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         rec.reset_transcription_attempt()
         rec._persistence_failed = persistence_retry
         self._schedule_retry_scan(delay_seconds)
@@ -6128,7 +6469,7 @@ class ScriberWebController:
         """Persist and publish the terminal state reached after task cancellation."""
         rec.status = "stopped"
         rec.step = "Stopped by user"
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         await self._sync_job_status_async(rec)
         await self._save_transcript_to_db_async(rec)
         await self._broadcast_history_updated(record=rec, reason="canceled")
@@ -6157,7 +6498,7 @@ class ScriberWebController:
                         rec.status = "failed"
                         rec.step = "Failed"
                         rec.append_final_text(f"[Error] {exc}")
-                    rec.updated_at = datetime.now().isoformat()
+                    rec.updated_at = _now_iso()
                     await self._save_transcript_to_db_async(rec)
                     await self._broadcast_history_updated(record=rec, reason="job_failed")
                 finally:
@@ -6182,7 +6523,7 @@ class ScriberWebController:
                     rec.status = "failed"
                     rec.step = "Failed"
                     rec.append_final_text(f"[Error] {exc}")
-                rec.updated_at = datetime.now().isoformat()
+                rec.updated_at = _now_iso()
                 await self._save_transcript_to_db_async(rec)
                 await self._broadcast_history_updated(record=rec, reason="job_failed")
             finally:
@@ -6214,7 +6555,7 @@ class ScriberWebController:
                         rec.status = "failed"
                         rec.step = "Failed"
                         rec.append_final_text(f"[Error] {exc}")
-                    rec.updated_at = datetime.now().isoformat()
+                    rec.updated_at = _now_iso()
                     await self._save_transcript_to_db_async(rec)
                     await self._broadcast_history_updated(record=rec, reason="job_failed")
                 finally:
@@ -6246,14 +6587,15 @@ class ScriberWebController:
 
     def _build_processing_record_from_job(self, job: JobRecord) -> TranscriptRecord:
         payload = job.payload or {}
-        created_at = job.created_at or datetime.now().isoformat()
-        resumed_at = datetime.now().isoformat()
-        created_dt = datetime.now()
-        if created_at:
+        now = datetime.now()
+        resumed_at = now.isoformat()
+        created_at = job.created_at or resumed_at
+        created_dt = now
+        if job.created_at:
             try:
                 created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
             except ValueError, TypeError:
-                created_dt = datetime.now()
+                pass
         title = str(payload.get("title", "") or "").strip()
         if not title:
             title = "YouTube" if job.job_type == JobType.YOUTUBE else "File"
@@ -6294,7 +6636,7 @@ class ScriberWebController:
         rec.status = "failed"
         rec.step = "Failed"
         rec.append_final_text(f"[Error] {message}")
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         await self._sync_job_status_async(rec)
         await self._save_transcript_to_db_async(rec)
         await self._broadcast_history_updated(record=rec, reason="job_failed")
@@ -6559,7 +6901,7 @@ class ScriberWebController:
                     rec = self._record_from_persisted_data(persisted)
                     rec.status = "processing"
                     rec.step = "Queued (provider result recovery)"
-                    rec.updated_at = datetime.now().isoformat()
+                    rec.updated_at = _now_iso()
                     self._add_to_history(rec)
             if rec and (
                 rec.status in ("completed", "stopped") or (rec.status == "failed" and not durable_local_recovery)
@@ -6573,7 +6915,7 @@ class ScriberWebController:
             elif durable_local_recovery and rec.status == "failed":
                 rec.status = "processing"
                 rec.step = "Queued (provider result recovery)"
-                rec.updated_at = datetime.now().isoformat()
+                rec.updated_at = _now_iso()
 
             self._remember_job_id(rec.id, job.id)
             # A resumed attempt starts now. Do not make the UI count time while
@@ -6586,7 +6928,7 @@ class ScriberWebController:
                     await self._fail_resumed_job(rec, "Missing source URL for resumed YouTube job.")
                     continue
                 rec.step = "Queued (resumed)"
-                rec.updated_at = datetime.now().isoformat()
+                rec.updated_at = _now_iso()
                 self._schedule_youtube_job(rec, resumed=True)
                 resumed_count += 1
                 continue
@@ -6605,7 +6947,7 @@ class ScriberWebController:
                 continue
             rec.source_url = str(file_path)
             rec.step = "Queued (resumed)"
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             self._schedule_file_job(rec, file_path, resumed=True)
             resumed_count += 1
 
@@ -7115,43 +7457,30 @@ class ScriberWebController:
         return len(pending)
 
     def _add_to_history(self, record: TranscriptRecord) -> None:
-        """Insert a transcript into the bounded runtime cache and index it by ID."""
-        if record.id:
-            self._history = [item for item in self._history if item.id != record.id]
-        self._history.insert(0, record)
-        if record.id:
-            self._history_by_id[record.id] = record
+        """Insert a transcript at the front of the bounded runtime cache."""
+        self._history[record.id] = record
+        self._history.move_to_end(record.id, last=False)
 
         while len(self._history) > self._history_cache_limit:
-            evict_index = next(
+            evict_id = next(
                 (
-                    index
-                    for index in range(len(self._history) - 1, -1, -1)
-                    if self._history[index].id not in self._running_tasks
-                    and self._history[index].status not in ("processing", "recording")
+                    rec.id
+                    for rec in reversed(self._history.values())
+                    if rec.id not in self._running_tasks and rec.status not in ("processing", "recording")
                 ),
                 None,
             )
-            if evict_index is None:
+            if evict_id is None:
                 break
-            evicted = self._history.pop(evict_index)
-            if self._history_by_id.get(evicted.id) is evicted:
-                self._history_by_id.pop(evicted.id, None)
+            del self._history[evict_id]
 
     def _remove_from_history(self, transcript_id: str) -> TranscriptRecord | None:
-        """Remove a transcript from history and index; return removed record."""
-        rec = self._history_by_id.pop(transcript_id, None)
-        if not rec:
-            return None
-        for i, item in enumerate(self._history):
-            if item.id == transcript_id:
-                self._history.pop(i)
-                break
-        return rec
+        """Remove a transcript from history; return removed record."""
+        return self._history.pop(transcript_id, None)
 
     def _get_history_record(self, transcript_id: str) -> TranscriptRecord | None:
-        """Get a transcript by ID from the history index."""
-        return self._history_by_id.get(transcript_id)
+        """Get a transcript by ID from the history cache."""
+        return self._history.get(transcript_id)
 
     def get_state(self) -> dict[str, Any]:
         with self._current_lock:
@@ -7611,13 +7940,20 @@ class ScriberWebController:
                 model = self._local_polishing_model_snapshot(variant)
                 if model is None:
                     return
-                payload = local_polishing_model_progress_event(model)
-                if payload != last_payload:
-                    await self.broadcast(payload)
-                    last_payload = payload
+                has_ws_clients = self._has_ws_clients()
+                if has_ws_clients:
+                    payload = local_polishing_model_progress_event(model)
+                    if payload != last_payload:
+                        await self.broadcast(payload)
+                        last_payload = payload
+                else:
+                    # No window is rendering progress. A reconnecting client
+                    # fetches model state over HTTP, so only watch for the end
+                    # and resend the next payload once someone is listening.
+                    last_payload = None
                 if model.get("status") in {"ready", "error", "cancelled"}:
                     return
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(0.2 if has_ws_clients else 1.0)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
@@ -7738,24 +8074,26 @@ class ScriberWebController:
             await asyncio.gather(*tasks, return_exceptions=True)
 
     async def add_client(self, ws: web.WebSocketResponse) -> None:
-        async with self._clients_lock:
-            self._clients.add(ws)
-            self._client_send_locks.setdefault(ws, asyncio.Lock())
-            self._client_count = len(self._clients)
-            self._clients_dirty = True
+        self._clients.add(ws)
+        self._client_send_locks.setdefault(ws, asyncio.Lock())
+        self._client_count = len(self._clients)
+        self._clients_dirty = True
 
     async def remove_client(self, ws: web.WebSocketResponse) -> None:
-        async with self._clients_lock:
-            self._clients.discard(ws)
-            self._client_send_locks.pop(ws, None)
-            self._client_count = len(self._clients)
-            self._clients_dirty = True
+        self._clients.discard(ws)
+        self._client_send_locks.pop(ws, None)
+        self._client_count = len(self._clients)
+        self._clients_dirty = True
 
     def _has_ws_clients(self) -> bool:
         return self._client_count > 0
 
-    async def send_client_text(self, ws: web.WebSocketResponse, message: str) -> bool:
-        """Serialize all writes to one WebSocket and enforce a send deadline."""
+    async def send_client_text(self, ws: web.WebSocketResponse, message: str | bytes) -> bool:
+        """Serialize all writes to one WebSocket and enforce a send deadline.
+
+        ``bytes`` must already be UTF-8 text; they go out as a text frame so a
+        broadcast encodes once instead of once per connected client.
+        """
         if ws.closed:
             return False
         send_lock = self._client_send_locks.get(ws)
@@ -7764,7 +8102,11 @@ class ScriberWebController:
         try:
             async with send_lock:
                 await asyncio.wait_for(
-                    ws.send_str(message),
+                    (
+                        ws.send_frame(message, WSMsgType.TEXT)
+                        if isinstance(message, bytes)
+                        else ws.send_str(message)
+                    ),
                     timeout=_WS_SEND_TIMEOUT_SECONDS,
                 )
             return True
@@ -7778,18 +8120,16 @@ class ScriberWebController:
             validate_event_payload(payload_to_send)
 
         if self._clients_dirty:
-            async with self._clients_lock:
-                if self._clients_dirty:
-                    self._clients_snapshot = tuple(self._clients)
-                    self._client_count = len(self._clients)
-                    self._clients_dirty = False
+            self._clients_snapshot = tuple(self._clients)
+            self._client_count = len(self._clients)
+            self._clients_dirty = False
         clients = self._clients_snapshot
         if not clients:
             return
 
         if payload_to_send is payload:
             payload_to_send = version_event_payload(payload)
-        msg = json.dumps(payload_to_send, ensure_ascii=False)
+        msg = _encode_json_bytes(payload_to_send)
 
         async def send_safe(ws: web.WebSocketResponse):
             """Send message to client, return ws if failed or closed."""
@@ -7798,20 +8138,33 @@ class ScriberWebController:
             except Exception:
                 return ws
 
-        # Send to all clients in parallel
-        results = await asyncio.gather(*[send_safe(ws) for ws in clients], return_exceptions=True)
+        if len(clients) == 1:
+            # The desktop shell is normally the only client; await it directly
+            # instead of wrapping one send in a gathered task.
+            results = [await send_safe(clients[0])]
+        else:
+            # Send to all clients in parallel
+            results = await asyncio.gather(*[send_safe(ws) for ws in clients], return_exceptions=True)
         dead = [r for r in results if r is not None and isinstance(r, web.WebSocketResponse)]
         if dead:
-            async with self._clients_lock:
-                for ws in dead:
-                    self._clients.discard(ws)
-                    self._client_send_locks.pop(ws, None)
-                self._client_count = len(self._clients)
-                self._clients_dirty = True
+            self._clients.difference_update(dead)
+            for ws in dead:
+                self._client_send_locks.pop(ws, None)
+            self._client_count = len(self._clients)
+            self._clients_dirty = True
 
     async def _drain_audio_broadcasts(self) -> None:
-        while self._pending_audio_payload is not None and not self._shutting_down:
+        wakeup = self._audio_broadcast_wakeup
+        while not self._shutting_down:
             payload = self._pending_audio_payload
+            if payload is None:
+                wakeup.clear()
+                try:
+                    async with asyncio.timeout(_AUDIO_BROADCAST_WRITER_IDLE_SECONDS):
+                        await wakeup.wait()
+                except TimeoutError:
+                    return
+                continue
             self._pending_audio_payload = None
             await self.broadcast(payload)
 
@@ -7830,6 +8183,7 @@ class ScriberWebController:
     def _enqueue_audio_broadcast(self, payload: dict[str, Any]) -> None:
         self._pending_audio_payload = payload
         if self._audio_broadcast_task is not None and not self._audio_broadcast_task.done():
+            self._audio_broadcast_wakeup.set()
             return
         task = self._loop.create_task(self._drain_audio_broadcasts(), name="audio_level_broadcast")
         self._audio_broadcast_task = task
@@ -7857,6 +8211,10 @@ class ScriberWebController:
         task.add_done_callback(self._on_control_broadcast_done)
 
     async def _drain_control_broadcasts(self) -> None:
+        # Status text is advisory. Yield once so audio and transcript sends that
+        # are already scheduled go first, and so a burst of state changes from
+        # the same tick collapses onto the newest payload per event type.
+        await asyncio.sleep(0)
         while self._pending_control_payloads and not self._shutting_down:
             event_type = next(iter(self._pending_control_payloads))
             payload = self._pending_control_payloads.pop(event_type)
@@ -7874,6 +8232,22 @@ class ScriberWebController:
         if self._pending_control_payloads and not self._shutting_down:
             self._ensure_control_broadcast_task()
 
+    def _call_soon_on_loop(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule ``callback`` on the controller loop from any thread.
+
+        Live pipeline callbacks already run on this loop. ``call_soon`` keeps
+        the same FIFO ordering there without the self-pipe write that
+        ``call_soon_threadsafe`` performs to wake a selector that is not asleep.
+        """
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._loop.call_soon(callback, *args)
+        else:
+            self._loop.call_soon_threadsafe(callback, *args)
+
     def _set_status(self, status: str, *, session_id: str | None = None) -> None:
         if session_id is not None and session_id != self._session_id:
             return
@@ -7886,11 +8260,20 @@ class ScriberWebController:
         payload["inputWarning"] = self._mic_input_warning
         payload["inputWarningCode"] = self._mic_input_warning_code
         payload["inputWarningActions"] = [dict(item) for item in self._mic_input_warning_actions]
+        # Pipeline callbacks and stop paths re-report the same status; clients
+        # already render it, so skip the cross-thread wakeup and resend.
+        if payload == self._last_status_payload:
+            return
+        self._last_status_payload = payload
         # status changes can happen from non-async callbacks; schedule the broadcast.
-        self._loop.call_soon_threadsafe(
-            self._enqueue_control_broadcast,
-            payload,
-        )
+        self._call_soon_on_loop(self._enqueue_control_broadcast, payload)
+
+    async def _broadcast_transient_status(self, status: str, *, session_id: str | None) -> None:
+        """Broadcast a one-off status outside ``_set_status`` deduplication."""
+        # Clients now show this text, so the next ``_set_status`` must resend
+        # even when it matches the last tracked status payload.
+        self._last_status_payload = None
+        await self.broadcast(status_event(status, False, session_id=session_id))
 
     def _set_live_pipeline_status(self, status: str, *, session_id: str | None = None) -> None:
         normalized = str(status or "").strip() or "Stopped"
@@ -7929,10 +8312,7 @@ class ScriberWebController:
             actions=normalized_actions,
             session_id=session_id,
         )
-        self._loop.call_soon_threadsafe(
-            self._enqueue_control_broadcast,
-            payload,
-        )
+        self._call_soon_on_loop(self._enqueue_control_broadcast, payload)
 
     def _clear_input_warning_state(self, *, session_id: str | None = None, broadcast: bool = True) -> None:
         if session_id is not None and session_id != self._session_id:
@@ -7984,9 +8364,13 @@ class ScriberWebController:
         if session_id is not None and session_id != self._session_id:
             return
         level = max(0.0, float(rms))
-        self._mark_hot_path(session_id or self._session_id, "first_audio_frame")
-        if level >= self._mic_low_rms_clear_threshold:
-            self._mark_hot_path(session_id or self._session_id, "first_audible_audio_frame")
+        marker_session = session_id or self._session_id
+        if marker_session != self._audio_hot_path_marked_session:
+            self._mark_hot_path(marker_session, "first_audio_frame")
+            if level >= self._mic_low_rms_clear_threshold:
+                self._mark_hot_path(marker_session, "first_audible_audio_frame")
+                if self._hot_path_has_mark(marker_session, "first_audible_audio_frame"):
+                    self._audio_hot_path_marked_session = marker_session
         self._update_input_warning(level, session_id=session_id)
 
         has_ws_clients = self._has_ws_clients()
@@ -7995,7 +8379,7 @@ class ScriberWebController:
 
         # Called from the sounddevice callback thread; throttle UI broadcasts to ~60fps.
         now = time.monotonic()
-        if now - self._last_audio_broadcast < (1.0 / 60.0):  # ~60fps
+        if now - self._last_audio_broadcast < _AUDIO_LEVEL_BROADCAST_INTERVAL_SECONDS:
             return
         self._last_audio_broadcast = now
         # Update native overlay waveform only when recording overlay is active
@@ -8006,10 +8390,22 @@ class ScriberWebController:
         if session_id is None:
             session_id = self._session_id
         payload = audio_level_event(level, session_id=session_id)
-        self._loop.call_soon_threadsafe(
-            self._enqueue_audio_broadcast,
-            payload,
-        )
+        with self._audio_level_inbox_lock:
+            self._audio_level_inbox = payload
+            wake_loop = not self._audio_level_wakeup_pending
+            self._audio_level_wakeup_pending = True
+        if wake_loop:
+            self._loop.call_soon_threadsafe(self._take_audio_level)
+
+    def _take_audio_level(self) -> None:
+        # Take the newest level and clear the flag in one step, so a level
+        # written afterwards schedules its own wakeup instead of being dropped.
+        with self._audio_level_inbox_lock:
+            payload = self._audio_level_inbox
+            self._audio_level_inbox = None
+            self._audio_level_wakeup_pending = False
+        if payload is not None:
+            self._enqueue_audio_broadcast(payload)
 
     def _on_transcription(self, text: str, is_final: bool, *, session_id: str | None = None) -> None:
         if session_id is not None and session_id != self._session_id:
@@ -8038,11 +8434,7 @@ class ScriberWebController:
             session_id = self._session_id
         payload = transcript_event(text, bool(is_final), session_id=session_id)
         try:
-            self._loop.call_soon_threadsafe(
-                self._queue_transcript_broadcast,
-                payload,
-                bool(is_final),
-            )
+            self._call_soon_on_loop(self._queue_transcript_broadcast, payload, bool(is_final))
         except RuntimeError:
             return
 
@@ -8252,9 +8644,9 @@ class ScriberWebController:
                     self._add_to_history(failed_current)
                     self._schedule_transcript_save(failed_current)
                     self._loop.call_soon_threadsafe(
-                        lambda: asyncio.create_task(
-                            self._broadcast_history_updated(record=failed_current, reason="pipeline_failed")
-                        )
+                        self._queue_history_update,
+                        failed_current,
+                        "pipeline_failed",
                     )
         finally:
             # Schedule safe cleanup on the event loop
@@ -8318,7 +8710,7 @@ class ScriberWebController:
         if not raw_text:
             return
 
-        await self.broadcast(status_event("Post-processing...", False, session_id=session_id))
+        await self._broadcast_transient_status("Post-processing...", session_id=session_id)
         selected_engine = str(Config.POST_PROCESSING_ENGINE or "cloud").strip().lower()
         selected_variant = str(Config.LOCAL_POLISHING_VARIANT or "q8_0").strip().lower()
         selected_model = (
@@ -8444,8 +8836,9 @@ class ScriberWebController:
                 }
             )
             logger.warning(f"Live mic post-processing failed; inserting raw transcript: {exc}")
-            await self.broadcast(
-                status_event("Post-processing failed; inserting raw transcript", False, session_id=session_id)
+            await self._broadcast_transient_status(
+                "Post-processing failed; inserting raw transcript",
+                session_id=session_id,
             )
             self._emit_workflow_event(
                 message="Live mic post-processing failed; raw transcript retained",
@@ -8530,18 +8923,7 @@ class ScriberWebController:
         """Broadcast history updates with global throttling to avoid refetch storms."""
         now = time.monotonic()
         payload = self._history_update_payload_for_record(record, reason=reason)
-        if not force and now - self._history_broadcast_last < self._history_broadcast_interval:
-            if payload:
-                self._history_broadcast_pending_payload = self._merge_pending_history_update(
-                    self._history_broadcast_pending_payload,
-                    payload,
-                )
-            if self._history_broadcast_handle is None:
-                delay = self._history_broadcast_interval - (now - self._history_broadcast_last)
-                self._history_broadcast_handle = self._loop.call_later(
-                    delay,
-                    lambda: asyncio.create_task(self._broadcast_history_updated(force=True)),
-                )
+        if not force and self._defer_history_update(payload, now):
             return
         self._history_broadcast_last = now
         if self._history_broadcast_handle is not None:
@@ -8569,11 +8951,53 @@ class ScriberWebController:
             )
         )
 
+    def _defer_history_update(self, payload: dict[str, str], now: float) -> bool:
+        """Fold an update into the pending throttle window; False when a broadcast is due now."""
+        if now - self._history_broadcast_last >= self._history_broadcast_interval:
+            return False
+        if payload:
+            self._history_broadcast_pending_payload = self._merge_pending_history_update(
+                self._history_broadcast_pending_payload,
+                payload,
+            )
+        if self._history_broadcast_handle is None:
+            delay = self._history_broadcast_interval - (now - self._history_broadcast_last)
+            self._history_broadcast_handle = self._loop.call_later(
+                delay,
+                lambda: asyncio.create_task(self._broadcast_history_updated(force=True)),
+            )
+        return True
+
+    def _queue_history_update(self, record: TranscriptRecord | None = None, reason: str = "") -> None:
+        """Loop-side history update that only spawns a task when a broadcast is due."""
+        payload = self._history_update_payload_for_record(record, reason=reason)
+        if self._defer_history_update(payload, time.monotonic()):
+            return
+        asyncio.create_task(self._broadcast_history_updated(record=record, reason=reason))
+
+    def _on_file_pipeline_transcription(self, rec: TranscriptRecord, label: str, text: str, is_final: bool) -> None:
+        """Pipeline callback for file and YouTube jobs; only final text is kept."""
+        if not is_final:
+            return
+        rec.append_final_text(text)
+        logger.debug(
+            "{} transcription received: {} chars, buffered segments: {}",
+            label,
+            len(text),
+            len(rec._pending_content_segments),
+        )
+
+    def _on_file_pipeline_progress(self, rec: TranscriptRecord, step: str, *, require_processing: bool) -> None:
+        """Pipeline progress callback; runs on worker threads and hands the broadcast to the loop."""
+        if require_processing and rec.status != "processing":
+            return
+        rec.step = step
+        rec.updated_at = _now_iso()
+        self._loop.call_soon_threadsafe(self._queue_history_update, rec, "progress")
+
     def _touch_history(self, record: TranscriptRecord | None = None, *, reason: str = "") -> None:
         """Thread-safe schedule for history update broadcast."""
-        self._loop.call_soon_threadsafe(
-            lambda: asyncio.create_task(self._broadcast_history_updated(record=record, reason=reason))
-        )
+        self._call_soon_on_loop(self._queue_history_update, record, reason)
 
     def _begin_transcript_artifact(
         self,
@@ -9152,7 +9576,7 @@ class ScriberWebController:
         logger.info("YouTube {} completed: {} chars", source, len(content))
         rec.status = "completed"
         rec.step = "Completed"
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         auto_summary_task = self._claim_auto_summary_task(rec, content)
         # Save the transcript before summary generation so slow LLM work never
         # leaves completed content only in memory.
@@ -9195,6 +9619,7 @@ class ScriberWebController:
                     content,
                     Config.SUMMARIZATION_MODEL,
                     duration=rec.duration,
+                    reuse_cached=True,
                 )
                 rec.mark_summary_completed(summary)
                 await self._save_transcript_summary_state_async(
@@ -9276,7 +9701,7 @@ class ScriberWebController:
             )
             return []
         rec.step = "Separating speakers locally..."
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         await self._broadcast_history_updated(record=rec, reason="progress")
         try:
             segments, _turns = await self._speaker_diarizer.transcribe_with_fallback_speakers(
@@ -9343,7 +9768,7 @@ class ScriberWebController:
         )
         if prefer_captions:
             rec.step = "Checking YouTube captions..."
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             await self._broadcast_history_updated(record=rec, reason="progress")
             captions_started = time.monotonic()
             try:
@@ -9513,7 +9938,7 @@ class ScriberWebController:
         provider_result_attempt_id = ""
         provider_request_fence_persisted = False
         rec.step = "Downloading audio..."
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         await self._broadcast_history_updated(record=rec, reason="progress")
         self._emit_workflow_event(
             message="YouTube download started",
@@ -9559,8 +9984,8 @@ class ScriberWebController:
                     if workflow_phase["value"] != "downloading" or rec.status != "processing":
                         return
                     rec.step = step
-                    rec.updated_at = datetime.now().isoformat()
-                    asyncio.create_task(self._broadcast_history_updated(record=rec, reason="progress"))
+                    rec.updated_at = _now_iso()
+                    self._queue_history_update(rec, "progress")
 
                 self._loop.call_soon_threadsafe(apply_progress)
 
@@ -9616,7 +10041,7 @@ class ScriberWebController:
                 await self._finalize_job_execution_route(rec, route, prepared_audio)
             workflow_phase["value"] = "preparing"
             rec.step = "Preparing transcription..."
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             await self._broadcast_history_updated(record=rec, reason="progress")
             self._emit_workflow_event(
                 message="YouTube download completed",
@@ -9631,26 +10056,8 @@ class ScriberWebController:
                 outcome="success",
             )
 
-            def on_transcription(text: str, is_final: bool) -> None:
-                if not is_final:
-                    return
-                rec.append_final_text(text)
-                logger.debug(
-                    "YouTube transcription received: "
-                    f"{len(text)} chars, buffered segments: {len(rec._pending_content_segments)}"
-                )
-
-            def on_progress(step: str) -> None:
-                if rec.status != "processing":
-                    return
-                rec.step = step
-                rec.updated_at = datetime.now().isoformat()
-                self._loop.call_soon_threadsafe(
-                    lambda: asyncio.create_task(self._broadcast_history_updated(record=rec, reason="progress"))
-                )
-
             rec.step = "Transcribing..."
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             await self._broadcast_history_updated(record=rec, reason="progress")
             transcribe_started = time.monotonic()
             self._emit_workflow_event(
@@ -9669,8 +10076,8 @@ class ScriberWebController:
                 service_name=provider,
                 on_status_change=None,
                 on_audio_level=None,
-                on_transcription=on_transcription,
-                on_progress=on_progress,
+                on_transcription=partial(self._on_file_pipeline_transcription, rec, "YouTube"),
+                on_progress=partial(self._on_file_pipeline_progress, rec, require_processing=True),
                 enable_speaker_diarization=True,
                 execution_route=route.execution_route(),
                 direct_file_expected_duration_seconds=duration_seconds,
@@ -9944,7 +10351,7 @@ class ScriberWebController:
                     duration_ms=(time.monotonic() - workflow_started) * 1000,
                     outcome="success",
                 )
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             if rec.status != "completed" and not rec._persistence_failed:
                 await self._save_transcript_to_db_async(rec)
             await self._broadcast_history_updated(record=rec, reason="job_done")
@@ -10130,23 +10537,6 @@ class ScriberWebController:
             owner=owner,
         )
 
-        def on_transcription(text: str, is_final: bool) -> None:
-            if not is_final:
-                return
-            rec.append_final_text(text)
-            logger.debug(
-                "File transcription received: {} chars, buffered segments: {}",
-                len(text),
-                len(rec._pending_content_segments),
-            )
-
-        def on_progress(step: str) -> None:
-            rec.step = step
-            rec.updated_at = datetime.now().isoformat()
-            self._loop.call_soon_threadsafe(
-                lambda: asyncio.create_task(self._broadcast_history_updated(record=rec, reason="progress"))
-            )
-
         pipeline: Any | None = None
         provider_request_fence_persisted = False
         try:
@@ -10154,8 +10544,8 @@ class ScriberWebController:
                 service_name=provider,
                 on_status_change=None,
                 on_audio_level=None,
-                on_transcription=on_transcription,
-                on_progress=on_progress,
+                on_transcription=partial(self._on_file_pipeline_transcription, rec, "File"),
+                on_progress=partial(self._on_file_pipeline_progress, rec, require_processing=False),
                 enable_speaker_diarization=True,
                 execution_route=route.execution_route(),
                 direct_file_expected_duration_seconds=duration_seconds,
@@ -10315,7 +10705,7 @@ class ScriberWebController:
         workflow_started = time.monotonic()
         provider_result_durable = False
         rec.step = "Preparing audio..."
-        rec.updated_at = datetime.now().isoformat()
+        rec.updated_at = _now_iso()
         await self._broadcast_history_updated(record=rec, reason="progress")
         self._emit_workflow_event(
             message="File transcription started",
@@ -10330,7 +10720,7 @@ class ScriberWebController:
         )
         try:
             rec.step = "Transcribing..."
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             await self._broadcast_history_updated(record=rec, reason="progress")
             transcribe_started = time.monotonic()
             if frozen_route is None:
@@ -10348,7 +10738,7 @@ class ScriberWebController:
             logger.info(f"File transcription completed: {len(content)} chars")
             rec.status = "completed"
             rec.step = "Completed"
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             auto_summary_task = self._claim_auto_summary_task(rec, content)
             # Persist transcript immediately so a stuck/slow summarization
             # cannot keep the transcript in memory-only state.
@@ -10392,6 +10782,7 @@ class ScriberWebController:
                         content,
                         Config.SUMMARIZATION_MODEL,
                         duration=rec.duration,
+                        reuse_cached=True,
                     )
                     rec.mark_summary_completed(summary)
                     await self._save_transcript_summary_state_async(
@@ -10561,7 +10952,7 @@ class ScriberWebController:
                     duration_ms=(time.monotonic() - workflow_started) * 1000,
                     outcome="success",
                 )
-            rec.updated_at = datetime.now().isoformat()
+            rec.updated_at = _now_iso()
             if rec.status != "completed" and not rec._persistence_failed:
                 await self._save_transcript_to_db_async(rec)
             await self._broadcast_history_updated(record=rec, reason="job_done")
@@ -11708,7 +12099,7 @@ class ScriberWebController:
         elif silent_early_exit:
             self._overlay_audio_enabled = False
             self._hide_recording_overlay_async(session_id=session_id)
-            await self.broadcast(status_event("No speech detected", False, session_id=session_id))
+            await self._broadcast_transient_status("No speech detected", session_id=session_id)
             self._emit_workflow_event(
                 message="Live mic silent recording skipped provider finalization",
                 event="api.session.silent_skipped_provider",
@@ -11989,7 +12380,57 @@ class ScriberWebController:
                 if now - self._last_toggle_poll_error_log >= 5.0:
                     self._last_toggle_poll_error_log = now
                     logger.warning(f"Toggle-hotkey polling error for '{Config.HOTKEY}': {exc}")
-            await asyncio.sleep(0.05)
+            await self._await_hotkey_poll_tick(last_pressed)
+
+    async def _await_hotkey_poll_tick(self, pressed: bool) -> None:
+        """Wait before the next hotkey poll.
+
+        While the hotkey is held, or without a keyboard hook, poll on a fixed
+        tick. Otherwise nothing can change until a key event arrives, so idle
+        pollers sleep on the hook's wakeup instead of spinning 20 times a second.
+        The wait is bounded so a stalled hook degrades to slow polling.
+        """
+        if pressed or self._keyboard_hook is None:
+            await asyncio.sleep(_HOTKEY_POLL_INTERVAL_SECONDS)
+            return
+        wakeup = self._hotkey_key_event
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=_HOTKEY_IDLE_POLL_BACKSTOP_SECONDS)
+        except TimeoutError:
+            return
+        wakeup.clear()
+
+    def _on_keyboard_event(self, _event: Any) -> None:
+        """Keyboard hook thread callback: wake the hotkey pollers."""
+        if self._hotkey_key_event.is_set() or self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._hotkey_key_event.set)
+        except RuntimeError:
+            pass
+
+    def _install_keyboard_wakeup_hook(self, kb: Any) -> None:
+        self._remove_keyboard_wakeup_hook()
+        if not hasattr(kb, "hook") or not hasattr(kb, "unhook"):
+            return
+        try:
+            self._keyboard_hook = kb.hook(self._on_keyboard_event)
+        except Exception as exc:
+            logger.debug(f"Keyboard wakeup hook unavailable; hotkey polling stays on a fixed tick: {exc}")
+            self._keyboard_hook = None
+
+    def _remove_keyboard_wakeup_hook(self) -> None:
+        hook = self._keyboard_hook
+        self._keyboard_hook = None
+        kb = self._keyboard
+        if hook is None or kb is None:
+            return
+        try:
+            kb.unhook(hook)
+        except Exception as exc:
+            logger.debug(f"Keyboard wakeup hook cleanup warning: {exc}")
+        # Release pollers parked on the removed hook so they fall back to the tick.
+        self._hotkey_key_event.set()
 
     async def _handle_hotkey_toggle(self) -> None:
         if self._live_mic_start_in_progress_generation is not None:
@@ -12077,6 +12518,7 @@ class ScriberWebController:
 
         try:
             kb.clear_all_hotkeys()
+            self._install_keyboard_wakeup_hook(kb)
             if Config.MODE == "push_to_talk":
                 self._ptt_task = asyncio.create_task(self._ptt_loop(), name="ptt_loop")
                 logger.info(f"Push-to-Talk active: {Config.HOTKEY}")
@@ -12132,7 +12574,7 @@ class ScriberWebController:
                 if now - self._last_ptt_error_log >= 5.0:
                     self._last_ptt_error_log = now
                     logger.warning(f"Push-to-Talk polling error for '{Config.HOTKEY}': {exc}")
-            await asyncio.sleep(0.05)
+            await self._await_hotkey_poll_tick(last_state)
 
     def begin_shutdown(self) -> None:
         """Prevent cancellation handlers from turning resumable jobs terminal."""
@@ -13590,6 +14032,8 @@ class ScriberWebController:
         self._local_polishing_prewarm_tasks.clear()
         self._local_polishing_prewarm_target = None
         self._pending_audio_payload = None
+        with self._audio_level_inbox_lock:
+            self._audio_level_inbox = None
         if self._audio_broadcast_task is not None:
             self._audio_broadcast_task.cancel()
             self._audio_broadcast_task = None
@@ -13648,6 +14092,7 @@ class ScriberWebController:
                     type(exc).__name__,
                 )
 
+        self._remove_keyboard_wakeup_hook()
         kb = self._keyboard
         if kb and hasattr(kb, "clear_all_hotkeys"):
             try:
@@ -13692,7 +14137,39 @@ class ScriberWebController:
             except Exception as exc:
                 logger.warning("Failed to close {} connections: {}", name, exc)
 
+    def _invalidate_settings_cache(self) -> None:
+        self._settings_cache_generation += 1
+        self._settings_cache = None
+        self._settings_json = None
+
     def get_settings(self) -> dict[str, Any]:
+        """Return the UI settings snapshot; callers must treat it as read-only.
+
+        The snapshot is reused until a settings update or device change
+        invalidates it. Without the device monitor there is no hot-plug
+        signal, so the microphone fields are resolved fresh on every call.
+        """
+        generation = self._settings_cache_generation
+        cached = self._settings_cache
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        settings = self._build_settings()
+        if self._device_monitor_enabled:
+            self._settings_cache = (generation, settings)
+        return settings
+
+    def get_settings_json(self) -> bytes:
+        """Return the encoded get_settings() snapshot for HTTP responses."""
+        generation = self._settings_cache_generation
+        cached = self._settings_json
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        body = _encode_json_bytes(self.get_settings())
+        if self._device_monitor_enabled:
+            self._settings_json = (generation, body)
+        return body
+
+    def _build_settings(self) -> dict[str, Any]:
         # Track favorite mic availability for UI feedback
         _favorite_mic_available = False
         _resolved_favorite = ""
@@ -13814,34 +14291,50 @@ class ScriberWebController:
             "fileUploadLimits": file_upload_limits,
             "apiKeys": {
                 "soniox": Config.SONIOX_API_KEY or "",
-                "mistral": getattr(Config, "MISTRAL_API_KEY", "") or "",
-                "smallest": getattr(Config, "SMALLEST_API_KEY", "") or "",
+                "mistral": Config.MISTRAL_API_KEY or "",
+                "smallest": Config.SMALLEST_API_KEY or "",
                 "assemblyai": Config.ASSEMBLYAI_API_KEY or "",
                 "deepgram": Config.DEEPGRAM_API_KEY or "",
                 "openai": Config.OPENAI_API_KEY or "",
-                "openrouter": getattr(Config, "OPENROUTER_API_KEY", "") or "",
-                "cerebras": getattr(Config, "CEREBRAS_API_KEY", "") or "",
-                "celeris": getattr(Config, "CELERIS_API_KEY", "") or "",
-                "azureMaiSpeechKey": getattr(Config, "AZURE_MAI_SPEECH_KEY", "") or "",
-                "azureMaiRegion": getattr(Config, "AZURE_MAI_REGION", "") or "northeurope",
-                "azureMaiModel": getattr(Config, "AZURE_MAI_MODEL", "") or "mai-transcribe-1.5",
+                "openrouter": Config.OPENROUTER_API_KEY or "",
+                "cerebras": Config.CEREBRAS_API_KEY or "",
+                "celeris": Config.CELERIS_API_KEY or "",
+                "azureMaiSpeechKey": Config.AZURE_MAI_SPEECH_KEY or "",
+                "azureMaiRegion": Config.AZURE_MAI_REGION or "northeurope",
+                "azureMaiModel": Config.AZURE_MAI_MODEL or "mai-transcribe-1.5",
                 "gladia": Config.GLADIA_API_KEY or "",
                 "groq": Config.GROQ_API_KEY or "",
                 "speechmatics": Config.SPEECHMATICS_API_KEY or "",
-                "modulate": getattr(Config, "MODULATE_API_KEY", "") or "",
+                "modulate": Config.MODULATE_API_KEY or "",
                 "elevenlabs": Config.ELEVENLABS_API_KEY or "",
-                "googleApiKey": getattr(Config, "GOOGLE_API_KEY", "") or "",
+                "googleApiKey": Config.GOOGLE_API_KEY or "",
                 "googleApplicationCredentials": Config.GOOGLE_APPLICATION_CREDENTIALS or "",
-                "youtubeApiKey": getattr(Config, "YOUTUBE_API_KEY", "") or "",
+                "youtubeApiKey": Config.YOUTUBE_API_KEY or "",
             },
         }
 
     async def update_settings(self, payload: dict[str, Any]) -> dict[str, Any]:
         async with self._settings_update_lock:
-            return await self._update_settings_unlocked(payload)
+            try:
+                return await self._update_settings_unlocked(payload)
+            except BaseException:
+                # Rejected payloads may have applied earlier fields already.
+                self._invalidate_settings_cache()
+                raise
 
     async def _update_settings_unlocked(self, payload: dict[str, Any]) -> dict[str, Any]:
         _validate_settings_text_lengths(payload)
+        # Only a fresh cached snapshot is checked: building one here would
+        # enumerate microphones again before every real change.
+        cached = self._settings_cache
+        if (
+            cached is not None
+            and cached[0] == self._settings_cache_generation
+            and _settings_payload_is_noop(payload, cached[1])
+        ):
+            # Idempotent saves (UI auto-save on blur) skip the broadcast,
+            # hotkey re-registration and the .env rewrite.
+            return cached[1]
         old_hotkey = Config.HOTKEY
         old_post_processing_hotkey = Config.POST_PROCESSING_HOTKEY
         old_meeting_hotkey = Config.MEETING_HOTKEY
@@ -13856,6 +14349,7 @@ class ScriberWebController:
         validated_meeting_analysis_model: str | None = None
         validated_meeting_transcription_mode: str | None = None
         validated_meeting_final_provider: str | None = None
+        validated_meeting_audio_retention_days: int | None = None
         validated_onnx_model: str | None = None
         validated_onnx_quantization: str | None = None
         validated_overlay_visualizer_style: str | None = None
@@ -13908,6 +14402,11 @@ class ScriberWebController:
             if candidate not in allowed_meeting_final_providers:
                 raise ValueError("Unsupported final meeting transcription provider.")
             validated_meeting_final_provider = candidate
+        if "meetingAudioRetentionDays" in payload:
+            try:
+                validated_meeting_audio_retention_days = int(payload["meetingAudioRetentionDays"])
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Meeting audio retention must be a whole number of days.") from exc
         validated_post_processing_model: str | None = None
         if "postProcessingModel" in payload and isinstance(payload["postProcessingModel"], str):
             validated_post_processing_model = _validate_summarization_model(payload["postProcessingModel"])
@@ -14017,13 +14516,6 @@ class ScriberWebController:
         if validated_soniox_region is not None:
             Config.set_soniox_region(validated_soniox_region)
 
-        if "sonioxAsyncModel" in payload and isinstance(payload["sonioxAsyncModel"], str):
-            Config.SONIOX_ASYNC_MODEL = payload["sonioxAsyncModel"].strip()
-            os.environ["SCRIBER_SONIOX_ASYNC_MODEL"] = Config.SONIOX_ASYNC_MODEL
-
-        if "language" in payload and isinstance(payload["language"], str):
-            Config.set_language(payload["language"])
-
         if "micDevice" in payload and isinstance(payload["micDevice"], str):
             Config.set_mic_device(payload["micDevice"])
             invalidate_mic_device_resolution_cache()
@@ -14052,17 +14544,6 @@ class ScriberWebController:
                 # deliberately best-effort and cannot roll back the setting.
                 discard_vad_cache_without_importing_pipeline()
 
-        debug_enabled = _payload_bool(payload, "debug")
-        if debug_enabled is not None:
-            Config.set_debug(debug_enabled)
-
-        if "customVocab" in payload and isinstance(payload["customVocab"], str):
-            Config.CUSTOM_VOCAB = payload["customVocab"].strip()
-            os.environ["SCRIBER_CUSTOM_VOCAB"] = Config.CUSTOM_VOCAB
-
-        if "summarizationPrompt" in payload and isinstance(payload["summarizationPrompt"], str):
-            Config.set_summarization_prompt(payload["summarizationPrompt"])
-
         if validated_summarization_model is not None:
             Config.SUMMARIZATION_MODEL = validated_summarization_model
             os.environ["SCRIBER_SUMMARIZATION_MODEL"] = Config.SUMMARIZATION_MODEL
@@ -14076,27 +14557,8 @@ class ScriberWebController:
         if validated_meeting_final_provider is not None:
             Config.set_meeting_final_provider(validated_meeting_final_provider)
 
-        meeting_smart_turn = _payload_bool(payload, "meetingSmartTurnEnabled")
-        if meeting_smart_turn is not None:
-            Config.set_meeting_smart_turn_enabled(meeting_smart_turn)
-
-        meeting_auto_analyze = _payload_bool(payload, "meetingAutoAnalyze")
-        if meeting_auto_analyze is not None:
-            Config.set_meeting_auto_analyze(meeting_auto_analyze)
-
-        meeting_aec = _payload_bool(payload, "meetingAecEnabled")
-        if meeting_aec is not None:
-            Config.set_meeting_aec_enabled(meeting_aec)
-
-        if "meetingAudioRetentionDays" in payload:
-            try:
-                Config.set_meeting_audio_retention_days(int(payload["meetingAudioRetentionDays"]))
-            except (TypeError, ValueError) as exc:
-                raise ValueError("Meeting audio retention must be a whole number of days.") from exc
-
-        diarization_fallback = _payload_bool(payload, "speakerDiarizationFallbackEnabled")
-        if diarization_fallback is not None:
-            Config.set_speaker_diarization_fallback_enabled(diarization_fallback)
+        if validated_meeting_audio_retention_days is not None:
+            Config.set_meeting_audio_retention_days(validated_meeting_audio_retention_days)
 
         if validated_post_processing_model is not None:
             Config.set_post_processing_model(validated_post_processing_model)
@@ -14117,10 +14579,6 @@ class ScriberWebController:
             Config.AUTO_SUMMARIZE = auto_summarize
             os.environ["SCRIBER_AUTO_SUMMARIZE"] = "1" if Config.AUTO_SUMMARIZE else "0"
 
-        youtube_prefer_captions = _payload_bool(payload, "youtubePreferCaptions")
-        if youtube_prefer_captions is not None:
-            Config.set_youtube_prefer_captions(youtube_prefer_captions)
-
         voiceprint_opt_in = _payload_bool(payload, "voiceprintLibraryOptIn")
         if voiceprint_opt_in is not None:
             await asyncio.to_thread(
@@ -14129,18 +14587,22 @@ class ScriberWebController:
             )
             Config.set_voiceprint_library_opt_in(voiceprint_opt_in)
 
-        post_processing_enabled = _payload_bool(payload, "postProcessingEnabled")
-        if post_processing_enabled is not None:
-            Config.set_post_processing_enabled(post_processing_enabled)
-
-        if "postProcessingPrompt" in payload and isinstance(payload["postProcessingPrompt"], str):
-            Config.set_post_processing_prompt(payload["postProcessingPrompt"])
-
-        if "openaiSttModel" in payload and isinstance(payload["openaiSttModel"], str):
-            Config.set_openai_stt_model(payload["openaiSttModel"])
-
-        if "openaiRealtimeSttModel" in payload and isinstance(payload["openaiRealtimeSttModel"], str):
-            Config.set_openai_realtime_stt_model(payload["openaiRealtimeSttModel"])
+        # Pass-through fields go after every step that can still fail, so a
+        # rejected save does not leave them applied in memory but unpersisted.
+        for key, setter_name in _SETTINGS_PLAIN_SETTERS:
+            value = payload.get(key)
+            if isinstance(value, str):
+                getattr(Config, setter_name)(value)
+        for key, setter_name in _SETTINGS_BOOL_SETTERS:
+            value = payload.get(key)
+            if isinstance(value, bool):
+                getattr(Config, setter_name)(value)
+        for key, attr, env_var in _SETTINGS_TEXT_ATTRIBUTES:
+            value = payload.get(key)
+            if isinstance(value, str):
+                text = value.strip()
+                setattr(Config, attr, text)
+                os.environ[env_var] = text
 
         if validated_onnx_model is not None:
             Config.set_onnx_model(validated_onnx_model)
@@ -14148,10 +14610,6 @@ class ScriberWebController:
         if validated_onnx_quantization is not None:
             Config.set_onnx_quantization(validated_onnx_quantization)
 
-        onnx_use_gpu = _payload_bool(payload, "onnxUseGpu")
-        if onnx_use_gpu is not None:
-            Config.set_onnx_use_gpu(onnx_use_gpu)
-
         if "visualizerBarCount" in payload:
             try:
                 count = int(payload["visualizerBarCount"])
@@ -14164,46 +14622,16 @@ class ScriberWebController:
 
         api_keys = payload.get("apiKeys")
         if isinstance(api_keys, dict):
-            mapping: dict[str, tuple[str, Callable[[str], None] | None]] = {
-                "soniox": ("soniox", lambda v: Config.set_api_key("soniox", v)),
-                "mistral": ("mistral", lambda v: Config.set_api_key("mistral", v)),
-                "smallest": ("smallest", lambda v: Config.set_api_key("smallest", v)),
-                "assemblyai": ("assemblyai", lambda v: Config.set_api_key("assemblyai", v)),
-                "deepgram": ("deepgram", lambda v: Config.set_api_key("deepgram", v)),
-                "openai": ("openai", lambda v: Config.set_api_key("openai", v)),
-                "openrouter": ("openrouter", lambda v: Config.set_api_key("openrouter", v)),
-                "cerebras": ("cerebras", lambda v: Config.set_api_key("cerebras", v)),
-                "celeris": ("celeris", lambda v: Config.set_api_key("celeris", v)),
-                "gladia": ("gladia", lambda v: Config.set_api_key("gladia", v)),
-                "groq": ("groq", lambda v: Config.set_api_key("groq", v)),
-                "speechmatics": ("speechmatics", lambda v: Config.set_api_key("speechmatics", v)),
-                "modulate": ("modulate", lambda v: Config.set_api_key("modulate", v)),
-                "elevenlabs": ("elevenlabs", lambda v: Config.set_api_key("elevenlabs", v)),
-            }
-            for key, (_, setter) in mapping.items():
-                if key in api_keys and isinstance(api_keys[key], str) and setter:
-                    setter(api_keys[key])
-
-            if "azureMaiSpeechKey" in api_keys and isinstance(api_keys["azureMaiSpeechKey"], str):
-                Config.AZURE_MAI_SPEECH_KEY = api_keys["azureMaiSpeechKey"].strip()
-                os.environ["AZURE_MAI_SPEECH_KEY"] = Config.AZURE_MAI_SPEECH_KEY
-            if "azureMaiRegion" in api_keys and isinstance(api_keys["azureMaiRegion"], str):
-                Config.AZURE_MAI_REGION = api_keys["azureMaiRegion"].strip() or "northeurope"
-                os.environ["SCRIBER_AZURE_MAI_REGION"] = Config.AZURE_MAI_REGION
-            if "azureMaiModel" in api_keys and isinstance(api_keys["azureMaiModel"], str):
-                Config.AZURE_MAI_MODEL = api_keys["azureMaiModel"].strip() or "mai-transcribe-1.5"
-                os.environ["SCRIBER_AZURE_MAI_MODEL"] = Config.AZURE_MAI_MODEL
-
-            if "googleApiKey" in api_keys and isinstance(api_keys["googleApiKey"], str):
-                Config.GOOGLE_API_KEY = api_keys["googleApiKey"].strip()
-                os.environ["GOOGLE_API_KEY"] = Config.GOOGLE_API_KEY
-            if "googleApplicationCredentials" in api_keys and isinstance(api_keys["googleApplicationCredentials"], str):
-                Config.GOOGLE_APPLICATION_CREDENTIALS = api_keys["googleApplicationCredentials"].strip()
-                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = Config.GOOGLE_APPLICATION_CREDENTIALS
-
-            if "youtubeApiKey" in api_keys and isinstance(api_keys["youtubeApiKey"], str):
-                Config.YOUTUBE_API_KEY = api_keys["youtubeApiKey"].strip()
-                os.environ["YOUTUBE_API_KEY"] = Config.YOUTUBE_API_KEY
+            for service in _SETTINGS_API_KEY_SERVICES:
+                value = api_keys.get(service)
+                if isinstance(value, str):
+                    Config.set_api_key(service, value)
+            for key, attr, env_var, blank_default in _SETTINGS_API_KEY_ATTRIBUTES:
+                value = api_keys.get(key)
+                if isinstance(value, str):
+                    text = value.strip() or blank_default
+                    setattr(Config, attr, text)
+                    os.environ[env_var] = text
 
         if (
             old_hotkey != Config.HOTKEY
@@ -14218,6 +14646,7 @@ class ScriberWebController:
                 force_route_restart=mic_route_changed,
             )
 
+        self._invalidate_settings_cache()
         await self.broadcast({"type": "settings_updated"})
         settings = await asyncio.to_thread(self.get_settings)
         # Start the quiet period only after the update response snapshot is
@@ -14237,7 +14666,7 @@ class ScriberWebController:
 
             if rec and rec.status == "processing":
                 rec.step = "Stopping..."
-                rec.updated_at = datetime.now().isoformat()
+                rec.updated_at = _now_iso()
                 await self._broadcast_history_updated(record=rec, reason="cancel_requested")
             return True
 
@@ -14337,10 +14766,18 @@ class ScriberWebController:
         except Exception:  # pragma: no cover - optional runtime dep
             return [{"deviceId": "default", "label": "Default"}]
 
-        devices: list[dict[str, str]] = [{"deviceId": "default", "label": "Default"}]
-
         sample_rate = int(getattr(Config, "SAMPLE_RATE", 16000) or 16000)
         channels = max(1, int(getattr(Config, "CHANNELS", 1) or 1))
+        now = time.monotonic()
+        cached = self._direct_microphones_cache
+        if (
+            cached is not None
+            and now - cached[0] < _DIRECT_MICROPHONE_LIST_TTL_SECONDS
+            and cached[1:3] == (sample_rate, channels)
+        ):
+            return list(cached[3])
+
+        devices: list[dict[str, str]] = [{"deviceId": "default", "label": "Default"}]
         with get_device_guard_lock():
             entries = list_unique_input_microphones(
                 sd,
@@ -14351,10 +14788,12 @@ class ScriberWebController:
             label = f"{entry.name} (Default)" if entry.is_default else entry.name
             devices.append({"deviceId": entry.name, "label": label})
 
-        return devices
+        self._direct_microphones_cache = (now, sample_rate, channels, devices)
+        return list(devices)
 
     def request_microphone_refresh(self, hint_payload: dict[str, Any] | None = None) -> dict[str, Any]:
         """Schedule a safe microphone refresh from an external device-change hint."""
+        self._direct_microphones_cache = None
         if self._device_monitor_enabled:
             native_hint = _normalize_microphone_refresh_hint(hint_payload)
             if native_hint is not None:
@@ -14496,7 +14935,7 @@ class ScriberWebController:
             # Only active task IDs can represent unsaved file/YouTube sessions.
             # Avoid scanning the full transcript history on every search request.
             for transcript_id in tuple(self._running_tasks):
-                rec = self._history_by_id.get(transcript_id)
+                rec = self._history.get(transcript_id)
                 if rec is None:
                     continue
                 if rec.status not in ("processing", "recording"):
@@ -14545,7 +14984,7 @@ class ScriberWebController:
 
         active_records = [
             rec
-            for rec in tuple(self._history_by_id.values())
+            for rec in tuple(self._history.values())
             if rec.status in ("processing", "recording") and (not transcript_type or rec.type == transcript_type)
         ]
         active_records.sort(key=lambda rec: rec.created_at, reverse=True)
@@ -14658,11 +15097,22 @@ def _unexpected_api_error_payload() -> dict[str, Any]:
     )
 
 
+_CORS_STATIC_HEADERS: dict[str, str] = {
+    "Access-Control-Allow-Methods": "GET,POST,PUT,PATCH,DELETE,OPTIONS",
+    "Access-Control-Allow-Headers": f"Content-Type, Authorization, {_SESSION_TOKEN_HEADER}",
+}
+_CORS_CREDENTIALED_HEADERS: dict[str, str] = {
+    "Vary": "Origin",
+    "Access-Control-Allow-Credentials": "true",
+    **_CORS_STATIC_HEADERS,
+}
+
+
 @web.middleware
 async def cors_middleware(request: web.Request, handler):
     origin = request.headers.get("Origin")
     if origin and not _origin_allowed(origin):
-        return web.json_response({"message": "Origin not allowed"}, status=403)
+        return _json_response({"message": "Origin not allowed"}, status=403)
 
     if request.method == "OPTIONS":
         resp = web.Response(status=204)
@@ -14682,18 +15132,17 @@ async def cors_middleware(request: web.Request, handler):
                 request.method,
                 request.path,
             )
-            resp = web.json_response(_unexpected_api_error_payload(), status=500)
+            resp = _json_response(_unexpected_api_error_payload(), status=500)
 
+    headers = resp.headers
     if origin:
-        resp.headers["Access-Control-Allow-Origin"] = origin
-        resp.headers["Vary"] = "Origin"
-        resp.headers["Access-Control-Allow-Credentials"] = "true"
+        headers["Access-Control-Allow-Origin"] = origin
+        headers.update(_CORS_CREDENTIALED_HEADERS)
         if request.headers.get(_PRIVATE_NETWORK_ACCESS_REQUEST_HEADER, "").lower() == "true":
-            resp.headers[_PRIVATE_NETWORK_ACCESS_ALLOW_HEADER] = "true"
+            headers[_PRIVATE_NETWORK_ACCESS_ALLOW_HEADER] = "true"
     else:
-        resp.headers["Access-Control-Allow-Origin"] = "*"
-    resp.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
-    resp.headers["Access-Control-Allow-Headers"] = f"Content-Type, Authorization, {_SESSION_TOKEN_HEADER}"
+        headers["Access-Control-Allow-Origin"] = "*"
+        headers.update(_CORS_STATIC_HEADERS)
     return resp
 
 
@@ -14704,7 +15153,7 @@ async def session_token_middleware(request: web.Request, handler):
 
     token = _configured_session_token()
     if token and _request_requires_session_token(request) and not _request_has_valid_session_token(request, token):
-        return web.json_response({"message": "Session token required"}, status=401)
+        return _json_response({"message": "Session token required"}, status=401)
 
     return await handler(request)
 
@@ -14825,7 +15274,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             request.path == _PROVIDER_REPLAY_ROUTE_PREFIX
             or request.path.startswith(f"{_PROVIDER_REPLAY_ROUTE_PREFIX}/")
         ) and not provider_replay.enabled:
-            return web.json_response({"message": "Not found"}, status=404)
+            return _json_response({"message": "Not found"}, status=404)
         return await handler(request)
 
     app = web.Application(
@@ -14877,14 +15326,16 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
     async def health(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(ctl.get_health())
+        return _json_response(ctl.get_health())
 
     async def ws_handler(request: web.Request):
         origin = request.headers.get("Origin")
         if origin and not _origin_allowed(origin):
-            return web.json_response({"message": "Origin not allowed"}, status=403)
+            return _json_response({"message": "Origin not allowed"}, status=403)
 
-        ws = web.WebSocketResponse(heartbeat=30)
+        # No permessage-deflate: clients sit on loopback, and per-connection
+        # zlib would recompress every once-encoded broadcast frame.
+        ws = web.WebSocketResponse(heartbeat=30, compress=False)
         await ws.prepare(request)
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         await ctl.add_client(ws)
@@ -14892,7 +15343,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             initial_sent = await ctl.send_client_text(
                 ws,
-                json.dumps(state_event(ctl.get_state())),
+                _encode_json_bytes(state_event(ctl.get_state())),
             )
             if not initial_sent:
                 return ws
@@ -14909,29 +15360,29 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
     async def get_state(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(ctl.get_state())
+        return _json_response(ctl.get_state())
 
     async def get_runtime(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(ctl.get_runtime_info())
+        return _json_response(ctl.get_runtime_info())
 
     async def get_frontend_ready(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(ctl.get_frontend_ready())
+        return _json_response(ctl.get_frontend_ready())
 
     async def post_frontend_ready(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             payload = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(payload, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         try:
             validate_frontend_ready_request_payload(payload)
         except RESTContractError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
-        return web.json_response(ctl.record_frontend_ready(payload, request))
+            return _json_response({"message": str(exc)}, status=400)
+        return _json_response(ctl.record_frontend_ready(payload, request))
 
     async def get_frontend_performance(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -14941,12 +15392,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
             try:
                 after_sequence = int(raw_after_sequence)
             except ValueError:
-                return web.json_response(
+                return _json_response(
                     {"message": "afterSequence must be a non-negative integer"},
                     status=400,
                 )
             if after_sequence < 0:
-                return web.json_response(
+                return _json_response(
                     {"message": "afterSequence must be a non-negative integer"},
                     status=400,
                 )
@@ -14956,11 +15407,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
             or len(source_instance_id) > 64
             or not all(char.isalnum() or char in "-_" for char in source_instance_id)
         ):
-            return web.json_response(
+            return _json_response(
                 {"message": "sourceInstanceId must be a bounded opaque identifier"},
                 status=400,
             )
-        return web.json_response(
+        return _json_response(
             ctl.get_frontend_performance(
                 after_sequence=after_sequence,
                 source_instance_id=source_instance_id,
@@ -14972,30 +15423,30 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             payload = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(payload, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         try:
             validate_frontend_performance_request_payload(payload)
         except RESTContractError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
-        return web.json_response(ctl.record_frontend_performance(payload))
+            return _json_response({"message": str(exc)}, status=400)
+        return _json_response(ctl.record_frontend_performance(payload))
 
     async def request_frontend_performance_flush(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             payload = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(payload, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         try:
             validate_frontend_performance_flush_request_payload(payload)
         except RESTContractError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         flush = ctl.request_frontend_performance_flush(payload["sourceInstanceId"])
         if flush is None:
-            return web.json_response(
+            return _json_response(
                 {"message": "Frontend performance source changed"},
                 status=409,
             )
@@ -15005,7 +15456,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 flush["heartbeatSequence"],
             )
         )
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "accepted": True,
@@ -15017,7 +15468,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def get_audio_diagnostics(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         payload = await asyncio.to_thread(ctl.get_audio_diagnostics)
-        return web.json_response(payload)
+        return _json_response(payload)
 
     async def get_post_processing_diagnostics(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15025,7 +15476,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             limit = int(request.query.get("limit", "20"))
         except ValueError:
             limit = 20
-        return web.json_response(ctl.get_post_processing_diagnostics(limit=limit))
+        return _json_response(ctl.get_post_processing_diagnostics(limit=limit))
 
     async def get_runtime_logs(request: web.Request):
         try:
@@ -15036,34 +15487,34 @@ def create_app(controller: ScriberWebController) -> web.Application:
             payload = await asyncio.to_thread(collect_debug_logs, limit=limit)
         except Exception:
             logger.exception("Failed to collect runtime logs")
-            return web.json_response({"message": "Failed to collect runtime logs"}, status=500)
-        return web.json_response(payload)
+            return _json_response({"message": "Failed to collect runtime logs"}, status=500)
+        return _json_response(payload)
 
     async def delete_runtime_logs(request: web.Request):
         try:
             payload = await asyncio.to_thread(clear_debug_logs)
         except Exception:
             logger.exception("Failed to clear runtime logs")
-            return web.json_response({"message": "Failed to clear runtime logs"}, status=500)
+            return _json_response({"message": "Failed to clear runtime logs"}, status=500)
         status = 200 if payload.get("ok") else 500
-        return web.json_response(payload, status=status)
+        return _json_response(payload, status=status)
 
     async def shutdown_runtime(request: web.Request):
         if not _is_loopback_request(request):
-            return web.json_response({"message": "Runtime shutdown is only available on loopback"}, status=403)
+            return _json_response({"message": "Runtime shutdown is only available on loopback"}, status=403)
 
         token = _configured_session_token()
         if not token:
-            return web.json_response({"message": "Runtime shutdown token is not configured"}, status=403)
+            return _json_response({"message": "Runtime shutdown token is not configured"}, status=403)
         if not _request_has_valid_session_token(request, token):
-            return web.json_response({"message": "Session token required"}, status=401)
+            return _json_response({"message": "Session token required"}, status=401)
 
         stop_event = request.app.get(APP_SHUTDOWN_EVENT)
         if not isinstance(stop_event, asyncio.Event):
-            return web.json_response({"message": "Runtime shutdown is not available"}, status=503)
+            return _json_response({"message": "Runtime shutdown is not available"}, status=503)
 
         stop_event.set()
-        return web.json_response({"ok": True, "message": "Shutdown requested"})
+        return _json_response({"ok": True, "message": "Shutdown requested"})
 
     async def create_runtime_support_bundle(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15083,7 +15534,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             bundle_path = await asyncio.to_thread(build_bundle)
         except Exception:
             logger.exception("Failed to create support bundle")
-            return web.json_response({"message": "Failed to create support bundle"}, status=500)
+            return _json_response({"message": "Failed to create support bundle"}, status=500)
 
         return web.FileResponse(
             bundle_path,
@@ -15109,12 +15560,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
             limit=limit,
             include_active=include_active,
         )
-        return web.json_response(payload)
+        return _json_response(payload)
 
     def _provider_replay_contract_error(exc: RESTContractError) -> web.Response:
         status = 404 if "runId does not match this runtime" in str(exc) else 400
         message = "Not found" if status == 404 else str(exc)
-        return web.json_response({"message": message}, status=status)
+        return _json_response({"message": message}, status=status)
 
     async def prepare_provider_replay(request: web.Request):
         replay = request.app[APP_PROVIDER_REPLAY]
@@ -15142,7 +15593,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         capture_block_size_frames=int(getattr(Config, "MIC_BLOCK_SIZE", 512) or 512),
                     )
                 except RuntimeError, ValueError:
-                    return web.json_response(
+                    return _json_response(
                         {"message": ("Provider replay MAI validator is unavailable")},
                         status=503,
                     )
@@ -15157,15 +15608,15 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except RESTContractError as exc:
             return _provider_replay_contract_error(exc)
         except json.JSONDecodeError, TypeError, ValueError:
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         except ProviderReplayConflict as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except ProviderReplayCapacityError:
-            return web.json_response(
+            return _json_response(
                 {"message": "Provider replay registry is unavailable"},
                 status=503,
             )
-        return web.json_response(result, status=201)
+        return _json_response(result, status=201)
 
     async def get_provider_replay_status(request: web.Request):
         replay = request.app[APP_PROVIDER_REPLAY]
@@ -15185,8 +15636,8 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except RESTContractError as exc:
             return _provider_replay_contract_error(exc)
         except ProviderReplayNotFound:
-            return web.json_response({"message": "Not found"}, status=404)
-        return web.json_response(result)
+            return _json_response({"message": "Not found"}, status=404)
+        return _json_response(result)
 
     async def arm_provider_replay(request: web.Request):
         replay = request.app[APP_PROVIDER_REPLAY]
@@ -15272,9 +15723,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except RESTContractError as exc:
             return _provider_replay_contract_error(exc)
         except json.JSONDecodeError, TypeError, ValueError:
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         except ProviderReplayNotFound:
-            return web.json_response({"message": "Not found"}, status=404)
+            return _json_response({"message": "Not found"}, status=404)
         except ProviderReplayConflict as exc:
             if validated is not None and arm_started:
                 with contextlib.suppress(ProviderReplayError):
@@ -15283,7 +15734,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         sample_id=sample_id,
                         error_code="target_mismatch",
                     )
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except Exception:
             logger.exception("Installed provider replay arm failed")
             if validated is not None and arm_started:
@@ -15300,11 +15751,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
             pending_watchdog = pending.get("watchdogTask") if isinstance(pending, dict) else None
             if isinstance(pending_watchdog, asyncio.Task):
                 pending_watchdog.cancel()
-            return web.json_response(
+            return _json_response(
                 {"message": "Installed provider replay could not start"},
                 status=503,
             )
-        return web.json_response(result, status=202)
+        return _json_response(result, status=202)
 
     async def activate_provider_replay(
         marker: dict[str, Any],
@@ -15456,7 +15907,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             raise
 
     async def provider_replay_not_found(_request: web.Request):
-        return web.json_response({"message": "Not found"}, status=404)
+        return _json_response({"message": "Not found"}, status=404)
 
     async def start_live_request(
         request: web.Request,
@@ -15469,13 +15920,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             tauri_hotkey_marker, provider_replay_activation = await _tauri_activation_marker_from_request(request)
         except RESTContractError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         try:
             if provider_replay_activation:
                 if post_process or tauri_hotkey_marker is None:
                     raise ProviderReplayConflict("provider replay activation path is invalid")
                 await activate_provider_replay(tauri_hotkey_marker)
-                return web.json_response(ctl.get_state())
+                return _json_response(ctl.get_state())
             if pending_provider_replay_activations:
                 raise ProviderReplayConflict("provider replay requires its armed native activation")
             start_kwargs: dict[str, Any] = {
@@ -15485,7 +15936,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 start_kwargs["post_process"] = True
             start_error = await ctl.start_listening(**start_kwargs)
         except ProviderReplayConflict as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except Exception:
             # The local log retains the traceback needed to diagnose a broken
             # frozen runtime.  Never reflect module names, filesystem paths, or
@@ -15494,16 +15945,16 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 "Live microphone runtime failed during {} start",
                 "post-processing" if post_process else "standard",
             )
-            return web.json_response(
+            return _json_response(
                 _live_mic_runtime_unavailable_payload(),
                 status=503,
             )
         if start_error is not None:
-            return web.json_response(
+            return _json_response(
                 version_event_payload(ctl._provider_error_event_from_info(start_error)),
                 status=400,
             )
-        return web.json_response(ctl.get_state())
+        return _json_response(ctl.get_state())
 
     async def start_live(request: web.Request):
         return await start_live_request(request)
@@ -15515,11 +15966,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         stop_error = await ctl.stop_listening()
         if stop_error is not None:
-            return web.json_response(
+            return _json_response(
                 version_event_payload(ctl._provider_error_event_from_info(stop_error)),
                 status=400,
             )
-        return web.json_response(ctl.get_state())
+        return _json_response(ctl.get_state())
 
     async def toggle_live(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15532,12 +15983,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 payload["stopAccepted"] = False
                 payload["finalizing"] = False
                 payload["duplicateStartIgnored"] = True
-                return web.json_response(payload)
+                return _json_response(payload)
             accepted = ctl.request_background_stop_listening()
             payload = ctl.get_state()
             payload["stopAccepted"] = bool(accepted)
             payload["finalizing"] = True
-            return web.json_response(payload, status=202)
+            return _json_response(payload, status=202)
 
         return await start_live_request(request)
 
@@ -15552,7 +16003,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             # The rejected benchmark sample must still release microphone and
             # provider resources; it can never become successful evidence.
             ctl.request_async_stop_listening()
-            return web.json_response(
+            return _json_response(
                 {"message": str(exc)},
                 status=409,
             )
@@ -15566,7 +16017,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             "sessionId": ctl._session_id,
         }
         status = 202 if outcome["stopAccepted"] else 503
-        return web.json_response(payload, status=status)
+        return _json_response(payload, status=status)
 
     async def toggle_live_post_processing(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15582,37 +16033,38 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 payload["stopAccepted"] = False
                 payload["finalizing"] = False
                 payload["duplicateStartIgnored"] = True
-                return web.json_response(payload)
+                return _json_response(payload)
             accepted = ctl.request_background_stop_listening()
             payload = ctl.get_state()
             payload["stopAccepted"] = bool(accepted)
             payload["finalizing"] = True
-            return web.json_response(payload, status=202)
+            return _json_response(payload, status=202)
 
         return await start_live_request(request, post_process=True)
 
     async def get_settings(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(await asyncio.to_thread(ctl.get_settings))
+        body = await asyncio.to_thread(ctl.get_settings_json)
+        return web.Response(body=body, content_type="application/json", charset="utf-8")
 
     async def put_settings(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             payload = await request.json()
         except Exception:
-            return web.json_response({"message": "Invalid JSON"}, status=400)
+            return _json_response({"message": "Invalid JSON"}, status=400)
         try:
             updated = await ctl.update_settings(payload if isinstance(payload, dict) else {})
-            return web.json_response(updated)
+            return _json_response(updated)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except Exception as exc:
             logger.exception("Failed to update settings")
-            return web.json_response({"message": str(exc) or "Failed to update settings"}, status=500)
+            return _json_response({"message": str(exc) or "Failed to update settings"}, status=500)
 
     def local_polishing_error_response(exc: Exception) -> web.Response:
         if isinstance(exc, CatalogError):
-            return web.json_response(
+            return _json_response(
                 {
                     "success": False,
                     "code": "catalog_unavailable",
@@ -15637,7 +16089,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             status = 409
         else:
             status = 503
-        return web.json_response(
+        return _json_response(
             {
                 "success": False,
                 "code": code,
@@ -15652,7 +16104,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def local_polishing_models(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
-            return web.json_response(ctl.get_local_polishing_models())
+            return _json_response(ctl.get_local_polishing_models())
         except Exception:
             logger.exception("Failed to read local-polishing model state")
             return local_polishing_error_response(RuntimeError())
@@ -15667,7 +16119,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except Exception:
             logger.exception("Failed to start local-polishing model installation")
             return local_polishing_error_response(RuntimeError())
-        return web.json_response({"success": True, **model}, status=202)
+        return _json_response({"success": True, **model}, status=202)
 
     async def cancel_local_polishing_operation(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15679,7 +16131,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except Exception:
             logger.exception("Failed to cancel local-polishing model installation")
             return local_polishing_error_response(RuntimeError())
-        return web.json_response({"success": True, **operation}, status=202)
+        return _json_response({"success": True, **operation}, status=202)
 
     async def remove_local_polishing_model(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15691,11 +16143,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except Exception:
             logger.exception("Failed to remove local-polishing model")
             return local_polishing_error_response(RuntimeError())
-        return web.json_response({"success": True, **model})
+        return _json_response({"success": True, **model})
 
     async def get_autostart(request: web.Request):
         """Report unavailable outside the Tauri-owned desktop command surface."""
-        return web.json_response(
+        return _json_response(
             {
                 "enabled": False,
                 "available": False,
@@ -15705,7 +16157,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
     async def set_autostart(request: web.Request):
         """Reject legacy backend mutations; the installed shell owns autostart."""
-        return web.json_response(
+        return _json_response(
             {
                 "enabled": False,
                 "available": False,
@@ -15716,8 +16168,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
     async def microphones(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
+        if request.query.get("refresh") == "1":
+            ctl._direct_microphones_cache = None
         devices = await asyncio.to_thread(ctl.list_microphones)
-        return web.json_response({"devices": devices})
+        return _json_response({"devices": devices})
 
     async def refresh_microphones(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15726,11 +16180,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
             try:
                 raw_payload = await request.json()
             except Exception:
-                return web.json_response({"message": "Invalid JSON"}, status=400)
+                return _json_response({"message": "Invalid JSON"}, status=400)
             if not isinstance(raw_payload, dict):
-                return web.json_response({"message": "Expected JSON object"}, status=400)
+                return _json_response({"message": "Expected JSON object"}, status=400)
             payload = raw_payload
-        return web.json_response(ctl.request_microphone_refresh(payload))
+        return _json_response(ctl.request_microphone_refresh(payload))
 
     async def transcripts(request: web.Request):
         """List transcripts with optional search, filtering, and pagination.
@@ -15756,7 +16210,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             limit = 50
 
         try:
-            return web.json_response(
+            return _json_response(
                 await ctl.list_transcripts(
                     include_content=False,
                     query=query,
@@ -15766,26 +16220,26 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 )
             )
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def transcript_detail(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         transcript_id = request.match_info["id"]
         rec = await ctl.get_transcript(transcript_id)
         if not rec:
-            return web.json_response({"message": "Not found"}, status=404)
-        return web.json_response(rec)
+            return _json_response({"message": "Not found"}, status=404)
+        return _json_response(rec)
 
     async def youtube_search(request: web.Request):
         q = (request.query.get("q") or "").strip()
         if not q:
-            return web.json_response({"message": "Missing query parameter: q"}, status=400)
+            return _json_response({"message": "Missing query parameter: q"}, status=400)
         if len(q) > 500:
-            return web.json_response({"message": "Search query is too long"}, status=400)
+            return _json_response({"message": "Search query is too long"}, status=400)
 
-        api_key = getattr(Config, "YOUTUBE_API_KEY", "") or ""
+        api_key = Config.YOUTUBE_API_KEY or ""
         if not api_key.strip():
-            return web.json_response(
+            return _json_response(
                 {"message": "Missing YouTube API key. Set YOUTUBE_API_KEY or save it in Settings."}, status=400
             )
 
@@ -15797,11 +16251,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
         page_token = (request.query.get("pageToken") or "").strip() or None
         if page_token and len(page_token) > 512:
-            return web.json_response({"message": "Page token is too long"}, status=400)
+            return _json_response({"message": "Page token is too long"}, status=400)
 
         session: ClientSession | None = request.app.get(APP_HTTP_SESSION)
         if not session:
-            return web.json_response({"message": "HTTP session not initialized"}, status=500)
+            return _json_response({"message": "HTTP session not initialized"}, status=500)
 
         direct_video_id = extract_youtube_video_id(q)
         if direct_video_id:
@@ -15814,19 +16268,19 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     timeout=ClientTimeout(total=30),
                 )
             except ValueError as exc:
-                return web.json_response({"message": str(exc)}, status=400)
+                return _json_response({"message": str(exc)}, status=400)
             except YouTubeApiError as exc:
                 logger.warning("YouTube direct URL lookup failed: status={} video_id={}", exc.status, direct_video_id)
-                return web.json_response({"message": str(exc), "details": exc.details}, status=exc.status)
+                return _json_response({"message": str(exc), "details": exc.details}, status=exc.status)
             except Exception:
                 logger.exception("YouTube direct URL lookup failed")
-                return web.json_response({"message": "YouTube video fetch failed"}, status=500)
+                return _json_response({"message": "YouTube video fetch failed"}, status=500)
 
             if not video:
                 logger.warning("YouTube direct URL lookup returned no item for video_id={}", direct_video_id)
-                return web.json_response({"message": "Video not found", "code": "youtube_video_not_found"}, status=404)
+                return _json_response({"message": "Video not found", "code": "youtube_video_not_found"}, status=404)
 
-            return web.json_response(
+            return _json_response(
                 {
                     "query": q,
                     "nextPageToken": "",
@@ -15839,7 +16293,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
         if is_youtube_url_like(q):
             logger.warning("Unsupported YouTube URL format sent to search endpoint")
-            return web.json_response(
+            return _json_response(
                 {"message": UNSUPPORTED_YOUTUBE_URL_MESSAGE, "code": "unsupported_youtube_url"},
                 status=400,
             )
@@ -15853,14 +16307,14 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 session=session,
             )
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except YouTubeApiError as exc:
-            return web.json_response({"message": str(exc), "details": exc.details}, status=exc.status)
+            return _json_response({"message": str(exc), "details": exc.details}, status=exc.status)
         except Exception:
             logger.exception("YouTube search failed")
-            return web.json_response({"message": "YouTube search failed"}, status=500)
+            return _json_response({"message": "YouTube search failed"}, status=500)
 
-        return web.json_response(payload)
+        return _json_response(payload)
 
     async def youtube_video(request: web.Request):
         """Fetch video details by video ID or URL."""
@@ -15872,23 +16326,23 @@ def create_app(controller: ScriberWebController) -> web.Application:
             video_id = extract_youtube_video_id(url_param) or ""
             if not video_id and is_youtube_url_like(url_param):
                 logger.warning("Unsupported YouTube URL format sent to video endpoint")
-                return web.json_response(
+                return _json_response(
                     {"message": UNSUPPORTED_YOUTUBE_URL_MESSAGE, "code": "unsupported_youtube_url"},
                     status=400,
                 )
 
         if not video_id:
-            return web.json_response({"message": "Missing video ID or URL parameter"}, status=400)
+            return _json_response({"message": "Missing video ID or URL parameter"}, status=400)
 
-        api_key = getattr(Config, "YOUTUBE_API_KEY", "") or ""
+        api_key = Config.YOUTUBE_API_KEY or ""
         if not api_key.strip():
-            return web.json_response(
+            return _json_response(
                 {"message": "Missing YouTube API key. Set YOUTUBE_API_KEY or save it in Settings."}, status=400
             )
 
         session: ClientSession | None = request.app.get(APP_HTTP_SESSION)
         if not session:
-            return web.json_response({"message": "HTTP session not initialized"}, status=500)
+            return _json_response({"message": "HTTP session not initialized"}, status=500)
 
         try:
             video = await get_video_by_id(
@@ -15898,27 +16352,27 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 timeout=ClientTimeout(total=30),
             )
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except YouTubeApiError as exc:
-            return web.json_response({"message": str(exc), "details": exc.details}, status=exc.status)
+            return _json_response({"message": str(exc), "details": exc.details}, status=exc.status)
         except Exception:
             logger.exception("YouTube video fetch failed")
-            return web.json_response({"message": "YouTube video fetch failed"}, status=500)
+            return _json_response({"message": "YouTube video fetch failed"}, status=500)
 
         if not video:
             logger.warning("YouTube video lookup returned no item for video_id={}", video_id)
-            return web.json_response({"message": "Video not found"}, status=404)
+            return _json_response({"message": "Video not found"}, status=404)
 
-        return web.json_response(video)
+        return _json_response(video)
 
     async def youtube_thumbnail(request: web.Request):
         url = _safe_youtube_thumbnail_url(request.query.get("url") or "")
         if not url:
-            return web.json_response({"message": "Invalid YouTube thumbnail URL"}, status=400)
+            return _json_response({"message": "Invalid YouTube thumbnail URL"}, status=400)
 
         session: ClientSession | None = request.app.get(APP_HTTP_SESSION)
         if not session:
-            return web.json_response({"message": "HTTP session not initialized"}, status=500)
+            return _json_response({"message": "HTTP session not initialized"}, status=500)
 
         try:
             current_url = url
@@ -15934,35 +16388,35 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         location = (resp.headers.get("Location") or "").strip()
                         redirected_url = _safe_youtube_thumbnail_url(urljoin(current_url, location))
                         if not location or not redirected_url:
-                            return web.json_response(
+                            return _json_response(
                                 {"message": "Unsafe thumbnail redirect"},
                                 status=502,
                             )
                         current_url = redirected_url
                         continue
                     if resp.status >= 400:
-                        return web.json_response({"message": "Thumbnail fetch failed"}, status=resp.status)
+                        return _json_response({"message": "Thumbnail fetch failed"}, status=resp.status)
                     content_type = (resp.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
                     if not content_type.startswith("image/"):
-                        return web.json_response({"message": "Thumbnail response is not an image"}, status=415)
+                        return _json_response({"message": "Thumbnail response is not an image"}, status=415)
                     try:
                         content_length = int(resp.headers.get("Content-Length") or 0)
                     except TypeError, ValueError:
                         content_length = 0
                     if content_length > _YOUTUBE_THUMBNAIL_MAX_BYTES:
-                        return web.json_response({"message": "Thumbnail response is too large"}, status=413)
+                        return _json_response({"message": "Thumbnail response is too large"}, status=413)
                     try:
                         body = await _read_limited_response_body(resp.content, _YOUTUBE_THUMBNAIL_MAX_BYTES)
                     except ValueError:
-                        return web.json_response({"message": "Thumbnail response is too large"}, status=413)
+                        return _json_response({"message": "Thumbnail response is too large"}, status=413)
                     break
             if body is None:
-                return web.json_response({"message": "Too many thumbnail redirects"}, status=502)
+                return _json_response({"message": "Too many thumbnail redirects"}, status=502)
         except TimeoutError:
-            return web.json_response({"message": "Thumbnail fetch timed out"}, status=504)
+            return _json_response({"message": "Thumbnail fetch timed out"}, status=504)
         except Exception:
             logger.exception("YouTube thumbnail proxy failed")
-            return web.json_response({"message": "Thumbnail fetch failed"}, status=502)
+            return _json_response({"message": "Thumbnail fetch failed"}, status=502)
 
         return web.Response(
             body=body,
@@ -15975,17 +16429,17 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             payload = await request.json()
         except Exception:
-            return web.json_response({"message": "Invalid JSON"}, status=400)
+            return _json_response({"message": "Invalid JSON"}, status=400)
 
         try:
             rec = await ctl.start_youtube_transcription(payload if isinstance(payload, dict) else {})
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except Exception as exc:
             logger.exception("Failed to start YouTube transcription")
-            return web.json_response({"message": str(exc) or "Failed to start YouTube transcription"}, status=500)
+            return _json_response({"message": str(exc) or "Failed to start YouTube transcription"}, status=500)
 
-        return web.json_response(rec.to_public(include_content=True))
+        return _json_response(rec.to_public(include_content=True))
 
     async def file_transcribe(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -15994,7 +16448,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
         # Check content type for multipart upload
         if not request.content_type.startswith("multipart/"):
-            return web.json_response({"message": "Expected multipart/form-data"}, status=400)
+            return _json_response({"message": "Expected multipart/form-data"}, status=400)
 
         try:
             reader = await request.multipart()
@@ -16008,13 +16462,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     break
 
             if file_field is None:
-                return web.json_response({"message": "No file uploaded"}, status=400)
+                return _json_response({"message": "No file uploaded"}, status=400)
 
             # Validate file extension
             safe_filename = _safe_upload_filename(original_filename)
             ext = Path(safe_filename).suffix.lower()
             if ext not in _ALLOWED_UPLOAD_EXTENSIONS:
-                return web.json_response(
+                return _json_response(
                     {
                         "message": (
                             f"Unsupported file type: {ext}. Allowed: {', '.join(sorted(_ALLOWED_UPLOAD_EXTENSIONS))}"
@@ -16051,13 +16505,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 request.content_length,
                 file_limit=ingest_max_bytes,
             ):
-                return web.json_response(
+                return _json_response(
                     {"message": f"File too large (max raw upload {ingest_limit_label})."},
                     status=413,
                 )
 
             # Generate unique ID and save file
-            file_id = uuid4().hex
+            file_id = secrets.token_hex(16)
             save_dir = ctl._downloads_dir / "files" / file_id
             save_dir.mkdir(parents=True, exist_ok=True)
             save_path = save_dir / safe_filename
@@ -16070,14 +16524,14 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
             if bytes_read == 0:
                 await _remove_tree_if_exists(save_dir)
-                return web.json_response({"message": "Uploaded file is empty"}, status=400)
+                return _json_response({"message": "Uploaded file is empty"}, status=400)
 
             if too_large:
                 try:
                     await _remove_tree_if_exists(save_dir)
                 except Exception as cleanup_err:
                     logger.warning(f"Failed to cleanup oversized upload: {cleanup_err}")
-                return web.json_response(
+                return _json_response(
                     {"message": f"File too large (max raw upload {ingest_limit_label})."},
                     status=413,
                 )
@@ -16094,7 +16548,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     audio_size = audio_path.stat().st_size
                     if audio_size > final_audio_limit:
                         await _remove_tree_if_exists(save_dir)
-                        return web.json_response(
+                        return _json_response(
                             {
                                 "message": (
                                     f"Extracted/compressed audio too large "
@@ -16120,7 +16574,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 except RuntimeError as extract_err:
                     await _remove_tree_if_exists(save_dir)
                     logger.error(f"Audio extraction failed: {extract_err}")
-                    return web.json_response(
+                    return _json_response(
                         {"message": f"Failed to extract audio from video: {extract_err}"},
                         status=500,
                     )
@@ -16129,7 +16583,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 compressed_size = transcribe_path.stat().st_size
                 if compressed_size > final_audio_limit:
                     await _remove_tree_if_exists(save_dir)
-                    return web.json_response(
+                    return _json_response(
                         {
                             "message": (
                                 f"Compressed audio still too large "
@@ -16142,13 +16596,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
             # Start transcription
             rec = await ctl.start_file_transcription(transcribe_path, safe_filename)
             transcription_scheduled = True
-            return web.json_response(rec.to_public(include_content=True))
+            return _json_response(rec.to_public(include_content=True))
 
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except Exception as exc:
             logger.exception("Failed to process file upload")
-            return web.json_response({"message": str(exc) or "Failed to process file upload"}, status=500)
+            return _json_response({"message": str(exc) or "Failed to process file upload"}, status=500)
         finally:
             if save_dir is not None and not transcription_scheduled:
                 try:
@@ -16160,24 +16614,24 @@ def create_app(controller: ScriberWebController) -> web.Application:
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         transcript_id = request.match_info.get("id", "")
         if not transcript_id:
-            return web.json_response({"message": "Missing transcript ID"}, status=400)
+            return _json_response({"message": "Missing transcript ID"}, status=400)
 
         delete_status, found = await ctl.delete_transcript_record(transcript_id)
         if delete_status == "not_found" or found is None:
-            return web.json_response({"message": "Transcript not found"}, status=404)
+            return _json_response({"message": "Transcript not found"}, status=404)
         if delete_status == "busy":
-            return web.json_response(
+            return _json_response(
                 {"message": "Transcript is still stopping; try deleting it again."},
                 status=409,
             )
         if delete_status == "persistence_error":
-            return web.json_response(
+            return _json_response(
                 {"message": "Failed to delete transcript from storage"},
                 status=500,
             )
         logger.info(f"Deleted transcript: {found.title} ({transcript_id})")
 
-        return web.json_response({"success": True, "id": transcript_id})
+        return _json_response({"success": True, "id": transcript_id})
 
     async def summarize_transcript(request: web.Request):
         """Summarize a transcript using the configured LLM model."""
@@ -16186,28 +16640,38 @@ def create_app(controller: ScriberWebController) -> web.Application:
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         transcript_id = request.match_info.get("id", "")
         if not transcript_id:
-            return web.json_response({"message": "Missing transcript ID"}, status=400)
+            return _json_response({"message": "Missing transcript ID"}, status=400)
 
         # Ensure full content is loaded (lazy-load safe)
         full_data = await ctl.get_transcript(transcript_id)
         rec = ctl._get_history_record(transcript_id)
 
         if not rec and not full_data:
-            return web.json_response({"message": "Transcript not found"}, status=404)
+            return _json_response({"message": "Transcript not found"}, status=404)
 
         content = rec.content_text() if rec else (full_data.get("content", "") if isinstance(full_data, dict) else "")
         status = rec.status if rec else (full_data.get("status", "") if isinstance(full_data, dict) else "")
         duration = rec.duration if rec else (full_data.get("duration", "") if isinstance(full_data, dict) else "")
+        detail = full_data if isinstance(full_data, dict) else {}
+        previous_summary = rec.summary if rec else detail.get("summary", "")
 
         if not content or not content.strip():
-            return web.json_response({"message": "Transcript has no content to summarize"}, status=400)
+            return _json_response({"message": "Transcript has no content to summarize"}, status=400)
 
         if status != "completed":
-            return web.json_response({"message": "Transcript is not yet completed"}, status=400)
+            return _json_response({"message": "Transcript is not yet completed"}, status=400)
+
+        # A completed summary is returned as-is; ?force=1 regenerates it.
+        summary_status = rec.summary_status if rec else detail.get("summaryStatus", "")
+        if previous_summary and summary_status == "completed" and request.query.get("force") != "1":
+            summary_format = rec.summary_format if rec else detail.get("summaryFormat", "markdown")
+            return _json_response(
+                {"success": True, "summary": previous_summary, "summaryFormat": summary_format, "cached": True}
+            )
 
         summary_task = asyncio.current_task()
         if summary_task is None or not ctl._register_summary_task(transcript_id, summary_task):
-            return web.json_response(
+            return _json_response(
                 {"message": "A summary is already running for this transcript"},
                 status=409,
             )
@@ -16242,14 +16706,15 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     status="pending",
                 )
                 if not updated:
-                    return web.json_response({"message": "Transcript not found"}, status=404)
+                    return _json_response({"message": "Transcript not found"}, status=404)
 
-            model = getattr(Config, "SUMMARIZATION_MODEL", "") or Config.DEFAULT_SUMMARIZATION_MODEL
-            summary = await summarize_text(content, model, duration=duration)
+            model = Config.SUMMARIZATION_MODEL or Config.DEFAULT_SUMMARIZATION_MODEL
+            # A forced or retried request for a transcript that already has a
+            # summary is a regenerate and must reach the model; first summaries
+            # may reuse an identical input summarized for another transcript.
+            summary = await summarize_text(content, model, duration=duration, reuse_cached=not previous_summary)
             if transcript_id in ctl._deleted_transcript_ids:
-                return web.json_response(
-                    {"message": "Transcript was deleted while summarization was running"}, status=404
-                )
+                return _json_response({"message": "Transcript was deleted while summarization was running"}, status=404)
             if rec:
                 rec.mark_summary_completed(summary)
                 await ctl._save_transcript_summary_state_async(
@@ -16262,9 +16727,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
             else:
                 updated = await asyncio.to_thread(db.update_transcript_summary, transcript_id, summary)
                 if not updated:
-                    return web.json_response({"message": "Transcript not found"}, status=404)
+                    return _json_response({"message": "Transcript not found"}, status=404)
                 logger.info(f"Summarized transcript: {transcript_id} ({len(summary)} chars)")
-            return web.json_response({"success": True, "summary": summary, "summaryFormat": "html"})
+            return _json_response({"success": True, "summary": summary, "summaryFormat": "html"})
         except asyncio.CancelledError:
             if rec:
                 rec.mark_summary_failed("Summary canceled")
@@ -16280,7 +16745,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 await ctl._broadcast_history_updated(record=rec, reason="summary_failed")
             else:
                 await persist_detached_summary_failure(str(exc))
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except Exception as exc:
             info = provider_user_error(None, exc)
             public_message = "Could not create the summary. Please try again."
@@ -16295,24 +16760,24 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 await ctl._broadcast_history_updated(record=rec, reason="summary_failed")
             else:
                 await persist_detached_summary_failure(public_message)
-            return web.json_response({"message": public_message}, status=500)
+            return _json_response({"message": public_message}, status=500)
 
     async def stop_transcript(request: web.Request):
         """Cancel a running transcription task."""
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         transcript_id = request.match_info.get("id", "")
         if not transcript_id:
-            return web.json_response({"message": "Missing transcript ID"}, status=400)
+            return _json_response({"message": "Missing transcript ID"}, status=400)
 
         success = await ctl.cancel_transcript(transcript_id)
         if not success:
             # Check if it exists at all
             found = ctl._get_history_record(transcript_id) is not None
             if not found:
-                return web.json_response({"message": "Transcript not found"}, status=404)
-            return web.json_response({"message": "Transcription is not running"}, status=400)
+                return _json_response({"message": "Transcript not found"}, status=404)
+            return _json_response({"message": "Transcription is not running"}, status=400)
 
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
 
     async def export_transcript(request: web.Request):
         """Export transcript as PDF or DOCX."""
@@ -16321,16 +16786,16 @@ def create_app(controller: ScriberWebController) -> web.Application:
         export_format = request.match_info.get("format", "pdf").lower()
 
         if not transcript_id:
-            return web.json_response({"message": "Missing transcript ID"}, status=400)
+            return _json_response({"message": "Missing transcript ID"}, status=400)
 
         if export_format not in ("pdf", "docx"):
-            return web.json_response({"message": "Invalid format. Use 'pdf' or 'docx'"}, status=400)
+            return _json_response({"message": "Invalid format. Use 'pdf' or 'docx'"}, status=400)
 
         # Ensure full content is loaded (lazy-load safe)
         full_data = await ctl.get_transcript(transcript_id)
         rec = ctl._get_history_record(transcript_id)
         if not rec and not full_data:
-            return web.json_response({"message": "Transcript not found"}, status=404)
+            return _json_response({"message": "Transcript not found"}, status=404)
 
         content = rec.content_text() if rec else (full_data.get("content", "") if isinstance(full_data, dict) else "")
         summary = rec.summary if rec else (full_data.get("summary", "") if isinstance(full_data, dict) else "")
@@ -16344,7 +16809,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         duration = rec.duration if rec else (full_data.get("duration", "") if isinstance(full_data, dict) else "")
 
         if not content:
-            return web.json_response({"message": "Transcript has no content to export"}, status=400)
+            return _json_response({"message": "Transcript has no content to export"}, status=400)
 
         try:
             data, content_type, ext = await _render_transcript_export_async(
@@ -16369,10 +16834,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 },
             )
         except ImportError as e:
-            return web.json_response({"message": str(e)}, status=500)
+            return _json_response({"message": str(e)}, status=500)
         except Exception as e:
             logger.exception(f"Export failed: {e}")
-            return web.json_response({"message": f"Export failed: {e}"}, status=500)
+            return _json_response({"message": f"Export failed: {e}"}, status=500)
 
     async def list_meetings(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -16380,11 +16845,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
             limit = int(request.query.get("limit", "50"))
             offset = int(request.query.get("offset", "0"))
         except ValueError:
-            return web.json_response({"message": "limit and offset must be integers"}, status=400)
+            return _json_response({"message": "limit and offset must be integers"}, status=400)
         payload = await asyncio.to_thread(ctl._meeting_store.list, limit=limit, offset=offset)
         payload["apiVersion"] = REST_API_VERSION
         payload["activeMeeting"] = await asyncio.to_thread(ctl._meeting_store.active)
-        return web.json_response(payload)
+        return _json_response(payload)
 
     async def meeting_capabilities(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -16402,7 +16867,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if available_free_bytes is not None
             else None
         )
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "platform": "windows" if os.name == "nt" else "unsupported",
@@ -16495,7 +16960,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             elif missing_render:
                 reason = "renderInventoryEmpty"
 
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "available": bool(shell_available and (grouped["capture"] or grouped["render"])),
@@ -16510,13 +16975,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def meeting_device_test(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         if not shell_ipc_available():
-            return web.json_response({"message": "Native meeting audio is unavailable."}, status=503)
+            return _json_response({"message": "Native meeting audio is unavailable."}, status=503)
         try:
             raw = await request.json() if request.can_read_body else {}
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(raw, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         try:
             duration_ms = max(
                 500,
@@ -16526,7 +16991,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 ),
             )
         except TypeError, ValueError:
-            return web.json_response({"message": "Invalid meeting device test payload."}, status=400)
+            return _json_response({"message": "Invalid meeting device test payload."}, status=400)
 
         admission_lock = _audio_admission_lock(ctl)
         device_test_claim: AudioAdmissionClaim | None = None
@@ -16536,13 +17001,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 or ctl._is_listening
                 or ctl._is_stopping
             ):
-                return web.json_response({"message": "Stop Live Mic before testing meeting devices."}, status=409)
+                return _json_response({"message": "Stop Live Mic before testing meeting devices."}, status=409)
             if await _active_meeting_audio_conflict(ctl) is not None:
-                return web.json_response({"message": "Finish the active meeting before testing devices."}, status=409)
+                return _json_response({"message": "Finish the active meeting before testing devices."}, status=409)
             if ctl._meeting_device_test_active:
-                return web.json_response({"message": "A meeting device test is already running."}, status=409)
+                return _json_response({"message": "A meeting device test is already running."}, status=409)
             if bool(getattr(ctl, "_voice_enrollment_active", False)):
-                return web.json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
+                return _json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
             try:
                 device_test_claim = await _claim_persistent_audio(
                     ctl,
@@ -16551,7 +17016,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     heartbeat=duration_ms > _MEETING_DEVICE_TEST_DEFAULT_MAX_DURATION_MS,
                 )
             except AudioAdmissionConflict:
-                return web.json_response(
+                return _json_response(
                     {"message": "Another Scriber controller owns native audio capture."},
                     status=409,
                 )
@@ -16573,7 +17038,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 timeout_seconds=4.0,
             )
             if not response.get("success"):
-                return web.json_response(
+                return _json_response(
                     {"message": str(response.get("fallbackReason") or "Native meeting device test did not start.")},
                     status=503,
                 )
@@ -16632,7 +17097,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             capture_id = ""
             levels = await asyncio.to_thread(probe.stop)
             probe = None
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "available": True,
@@ -16645,10 +17110,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except TypeError, ValueError:
-            return web.json_response({"message": "Invalid meeting device test payload."}, status=400)
+            return _json_response({"message": "Invalid meeting device test payload."}, status=400)
         except Exception as exc:
             logger.warning("Meeting device test failed: {}", type(exc).__name__)
-            return web.json_response(
+            return _json_response(
                 {"message": f"Meeting device test failed ({type(exc).__name__})."},
                 status=503,
             )
@@ -16791,7 +17256,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         selected_final = final_options.get(final_provider, final_options["soniox_async"])
         final_ready = bool(Config.get_api_key(final_provider)) or final_provider == "onnx_local"
         cost_estimate = _meeting_stt_cost_estimate(final_provider, transcription_mode)
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "defaultProfileId": "soniox-balanced",
@@ -16945,7 +17410,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def outlook_status(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         payload = await ctl._outlook_calendar.status()
-        return web.json_response({"apiVersion": REST_API_VERSION, **payload})
+        return _json_response({"apiVersion": REST_API_VERSION, **payload})
 
     async def outlook_connect(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -16953,9 +17418,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
             raw = await request.json() if request.can_read_body else {}
             open_browser = not isinstance(raw, dict) or raw.get("openBrowser") is not False
             payload = ctl._outlook_calendar.begin_connect(open_browser=open_browser)
-            return web.json_response({"apiVersion": REST_API_VERSION, **payload}, status=202)
+            return _json_response({"apiVersion": REST_API_VERSION, **payload}, status=202)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
 
     async def outlook_callback(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -16999,13 +17464,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             changed = await ctl._outlook_calendar.sync(request.app[APP_HTTP_SESSION])
             status = await ctl._outlook_calendar.status()
-            return web.json_response({"apiVersion": REST_API_VERSION, "changed": changed, **status})
+            return _json_response({"apiVersion": REST_API_VERSION, "changed": changed, **status})
         except ValueError as exc:
             ctl._outlook_calendar.record_sync_error(type(exc).__name__)
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except TimeoutError:
             ctl._outlook_calendar.record_sync_error("TimeoutError")
-            return web.json_response(
+            return _json_response(
                 {"message": "Outlook did not respond in time. Your saved calendar remains available."},
                 status=504,
             )
@@ -17013,7 +17478,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             error_type = type(exc).__name__
             ctl._outlook_calendar.record_sync_error(error_type)
             logger.warning("Manual Outlook calendar sync failed: {}", error_type)
-            return web.json_response(
+            return _json_response(
                 {"message": "Outlook calendar could not be refreshed. Your saved calendar remains available."},
                 status=502,
             )
@@ -17021,7 +17486,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def outlook_events(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         if ctl._outlook_calendar.authorization_pending:
-            return web.json_response(
+            return _json_response(
                 {"message": "Finish the Outlook sign-in before loading calendar events."},
                 status=409,
             )
@@ -17033,17 +17498,17 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 start_value=request.query.get("start", ""),
                 end_value=request.query.get("end", ""),
             )
-            return web.json_response({"apiVersion": REST_API_VERSION, **payload})
+            return _json_response({"apiVersion": REST_API_VERSION, **payload})
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def outlook_disconnect(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             await ctl._outlook_calendar.disconnect()
-            return web.json_response({"apiVersion": REST_API_VERSION, "disconnected": True})
+            return _json_response({"apiVersion": REST_API_VERSION, "disconnected": True})
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
 
     async def meeting_hotkey(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -17056,7 +17521,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             meeting_id=active["id"] if active else None,
         )
         await ctl.broadcast(event)
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "accepted": True,
@@ -17068,18 +17533,18 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
     async def get_meeting_detection(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(ctl.get_meeting_detection())
+        return _json_response(ctl.get_meeting_detection())
 
     async def dismiss_meeting_detection(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             raw = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         detection_id = str(raw.get("detectionId", "")) if isinstance(raw, dict) else ""
         if not ctl.dismiss_meeting_detection(detection_id):
-            return web.json_response({"message": "Meeting detection not found"}, status=404)
-        return web.json_response({"apiVersion": REST_API_VERSION, "dismissed": True})
+            return _json_response({"message": "Meeting detection not found"}, status=404)
+        return _json_response({"apiVersion": REST_API_VERSION, "dismissed": True})
 
     async def meeting_detail(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -17157,25 +17622,25 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 detail,
             )
             detail["apiVersion"] = REST_API_VERSION
-            return web.json_response(detail)
+            return _json_response(detail)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
 
     async def search_meeting_transcript(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         meeting_id = request.match_info.get("id", "")
         query = request.query.get("q", "").strip()
         if not query:
-            return web.json_response({"apiVersion": REST_API_VERSION, "query": "", "items": []})
+            return _json_response({"apiVersion": REST_API_VERSION, "query": "", "items": []})
         if len(query.encode("utf-8")) > 512:
-            return web.json_response({"message": "Transcript search query is too long."}, status=400)
+            return _json_response({"message": "Transcript search query is too long."}, status=400)
         try:
             limit = max(1, min(100, int(request.query.get("limit", "40"))))
         except ValueError:
-            return web.json_response({"message": "Search limit must be a whole number."}, status=400)
+            return _json_response({"message": "Search limit must be a whole number."}, status=400)
         try:
             items = await asyncio.to_thread(ctl._meeting_store.search_segments, meeting_id, query, limit=limit)
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "query": query,
@@ -17183,7 +17648,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
 
     async def patch_meeting_segment(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -17208,13 +17673,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     outputs_stale=result["outputsStale"],
                 )
             )
-            return web.json_response({"apiVersion": REST_API_VERSION, **result})
+            return _json_response({"apiVersion": REST_API_VERSION, **result})
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting segment not found"}, status=404)
+            return _json_response({"message": "Meeting segment not found"}, status=404)
         except MeetingConflict as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except (TypeError, ValueError) as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def undo_meeting_segment_edit(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -17238,13 +17703,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     outputs_stale=result["outputsStale"],
                 )
             )
-            return web.json_response({"apiVersion": REST_API_VERSION, **result})
+            return _json_response({"apiVersion": REST_API_VERSION, **result})
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting segment not found"}, status=404)
+            return _json_response({"message": "Meeting segment not found"}, status=404)
         except MeetingConflict as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except (TypeError, ValueError) as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def meeting_segment_edits(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -17252,7 +17717,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         segment_id = request.match_info.get("segmentId", "")
         try:
             items = await asyncio.to_thread(ctl._meeting_store.segment_edit_history, meeting_id, segment_id)
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "meetingId": meeting_id,
@@ -17261,7 +17726,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
 
     def meeting_import_payload(record: Any, *, upload_url: str = "") -> dict[str, Any]:
         raw = record.to_public()
@@ -17376,14 +17841,14 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             limit = max(1, min(50, int(request.query.get("limit", "24"))))
         except ValueError:
-            return web.json_response({"message": "Meeting import limit must be a whole number."}, status=400)
+            return _json_response({"message": "Meeting import limit must be a whole number."}, status=400)
         records = await asyncio.to_thread(
             ctl._meeting_import_store.list_inbox,
             limit=limit,
             recent_terminal_limit=6,
         )
         items = [meeting_import_inbox_payload(record) for record in records]
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "items": items,
@@ -17411,7 +17876,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 _get_video_max_bytes() if extension in _VIDEO_EXTENSIONS else _get_audio_ingest_max_bytes(provider)
             )
             if expected_bytes > max_bytes:
-                return web.json_response(
+                return _json_response(
                     {"message": f"Meeting recording is too large (max {_format_upload_limit(max_bytes)})."},
                     status=413,
                 )
@@ -17430,20 +17895,20 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 profile_snapshot=profile,
                 metadata={"title": str(raw.get("title") or Path(safe_filename).stem)[:500], "origin": "imported"},
             )
-            return web.json_response(
+            return _json_response(
                 meeting_import_payload(record, upload_url=f"/api/meeting-imports/{record.id}/content"),
                 status=201,
             )
         except (ValueError, RuntimeError) as exc:
-            return web.json_response({"message": redact_text(str(exc))[:240]}, status=400)
+            return _json_response({"message": redact_text(str(exc))[:240]}, status=400)
 
     async def get_meeting_import(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             record = await asyncio.to_thread(ctl._meeting_import_store.require, request.match_info.get("importId", ""))
-            return web.json_response(meeting_import_payload(record))
+            return _json_response(meeting_import_payload(record))
         except MeetingImportNotFound:
-            return web.json_response({"message": "Meeting import not found"}, status=404)
+            return _json_response({"message": "Meeting import not found"}, status=404)
 
     async def upload_meeting_import(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -17459,7 +17924,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             ctl._meeting_import_upload_tasks = upload_tasks
         existing_upload = upload_tasks.get(import_id)
         if existing_upload is not None and not existing_upload.done():
-            return web.json_response(
+            return _json_response(
                 {"message": "A Meeting recording upload is already active for this job."},
                 status=409,
             )
@@ -17480,15 +17945,24 @@ def create_app(controller: ScriberWebController) -> web.Application:
             digest = hashlib.sha256()
             received = 0
             last_reported = 0
+            pending = bytearray()
             with part_path.open("wb") as handle:
+
+                def write_batch(batch: bytes) -> None:
+                    handle.write(batch)
+                    digest.update(batch)
+
                 async for chunk in request.content.iter_chunked(1024 * 1024):
                     if not chunk:
                         continue
                     received += len(chunk)
                     if record.expected_bytes is not None and received > record.expected_bytes:
                         raise ValueError("Meeting recording exceeds its declared size.")
-                    handle.write(chunk)
-                    digest.update(chunk)
+                    pending.extend(chunk)
+                    if len(pending) >= _UPLOAD_WRITE_BATCH_BYTES:
+                        batch = bytes(pending)
+                        pending.clear()
+                        await _to_thread_cancellation_barrier(write_batch, batch)
                     if received - last_reported >= 1024 * 1024:
                         record = await _to_thread_cancellation_barrier(
                             ctl._meeting_import_store.update_receive_progress, import_id, received
@@ -17498,6 +17972,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         last_reported = received
 
                 def flush_and_sync() -> None:
+                    if pending:
+                        write_batch(bytes(pending))
+                        pending.clear()
                     handle.flush()
                     os.fsync(handle.fileno())
 
@@ -17534,7 +18011,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 # durable source commit. Startup recovery owns RECEIVED jobs;
                 # never turn a safely accepted upload into data loss here.
                 logger.exception("Accepted Meeting import bookkeeping will be repaired on recovery")
-            return web.json_response(meeting_import_payload(record), status=202)
+            return _json_response(meeting_import_payload(record), status=202)
         except asyncio.CancelledError:
             cleanup_incomplete_upload = True
             try:
@@ -17569,11 +18046,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     await _remove_tree_if_exists(job_root)
             raise
         except MeetingImportNotFound:
-            return web.json_response({"message": "Meeting import not found"}, status=404)
+            return _json_response({"message": "Meeting import not found"}, status=404)
         except (MeetingImportConflict, InvalidMeetingImportTransition, ValueError) as exc:
             if source_committed:
                 record = await asyncio.to_thread(ctl._meeting_import_store.require, import_id)
-                return web.json_response(meeting_import_payload(record), status=202)
+                return _json_response(meeting_import_payload(record), status=202)
             if not receiving_claimed:
                 # This request never won the durable upload generation. A
                 # duplicate/replayed PUT is observational only: it must not
@@ -17581,14 +18058,14 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 try:
                     record = await asyncio.to_thread(ctl._meeting_import_store.require, import_id)
                 except MeetingImportNotFound:
-                    return web.json_response({"message": "Meeting import not found"}, status=404)
+                    return _json_response({"message": "Meeting import not found"}, status=404)
                 if record.status not in {
                     MeetingImportStatus.CREATED,
                     MeetingImportStatus.RECEIVING,
                     MeetingImportStatus.CANCEL_REQUESTED,
                 }:
-                    return web.json_response(meeting_import_payload(record), status=202)
-                return web.json_response({"message": redact_text(str(exc))[:240]}, status=409)
+                    return _json_response(meeting_import_payload(record), status=202)
+                return _json_response({"message": redact_text(str(exc))[:240]}, status=409)
             try:
                 await _to_thread_cancellation_barrier(
                     ctl._meeting_import_store.mark_failed,
@@ -17602,12 +18079,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 part_path.unlink(missing_ok=True)
             if job_root is not None:
                 await _remove_tree_if_exists(job_root)
-            return web.json_response({"message": redact_text(str(exc))[:240]}, status=409)
+            return _json_response({"message": redact_text(str(exc))[:240]}, status=409)
         except Exception:
             logger.exception("Meeting import upload failed")
             if source_committed:
                 record = await asyncio.to_thread(ctl._meeting_import_store.require, import_id)
-                return web.json_response(meeting_import_payload(record), status=202)
+                return _json_response(meeting_import_payload(record), status=202)
             try:
                 await _to_thread_cancellation_barrier(
                     ctl._meeting_import_store.mark_failed,
@@ -17621,7 +18098,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 part_path.unlink(missing_ok=True)
             if job_root is not None:
                 await _remove_tree_if_exists(job_root)
-            return web.json_response({"message": "The Meeting recording upload was interrupted."}, status=500)
+            return _json_response({"message": "The Meeting recording upload was interrupted."}, status=500)
         finally:
             if current_task is not None and upload_tasks.get(import_id) is current_task:
                 upload_tasks.pop(import_id, None)
@@ -17635,7 +18112,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 MeetingImportStatus.COMPLETED,
                 MeetingImportStatus.FAILED,
             }:
-                return web.json_response(
+                return _json_response(
                     {
                         "message": "This Meeting import has already finished.",
                         "meetingId": record.meeting_id or None,
@@ -17671,23 +18148,23 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 if record.status == MeetingImportStatus.CANCELED
                 else "Canceling Meeting import",
             )
-            return web.json_response(
+            return _json_response(
                 meeting_import_payload(record),
                 status=202 if record.status == MeetingImportStatus.CANCEL_REQUESTED else 200,
             )
         except MeetingImportNotFound:
-            return web.json_response({"message": "Meeting import not found"}, status=404)
+            return _json_response({"message": "Meeting import not found"}, status=404)
         except MeetingImportConflict as exc:
             try:
                 record = await asyncio.to_thread(ctl._meeting_import_store.require, import_id)
                 meeting_id = record.meeting_id or None
             except MeetingImportNotFound:
                 meeting_id = None
-            return web.json_response({"message": str(exc), "meetingId": meeting_id}, status=409)
+            return _json_response({"message": str(exc), "meetingId": meeting_id}, status=409)
 
     async def import_meeting_file(request: web.Request):
         """Retired one-request import; durable imports use create + binary PUT."""
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "message": (
@@ -17705,22 +18182,22 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             raw = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(raw, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         requested_transcription_mode = (
             str(raw.get("transcriptionMode", Config.MEETING_TRANSCRIPTION_MODE)).strip().lower()
         )
         if requested_transcription_mode not in _MEETING_TRANSCRIPTION_MODES:
-            return web.json_response({"message": "Unsupported meeting transcription mode."}, status=400)
+            return _json_response({"message": "Unsupported meeting transcription mode."}, status=400)
         requested_voice_library = bool(raw.get("voiceLibraryEnabled", False))
         if requested_voice_library and not Config.VOICEPRINT_LIBRARY_OPT_IN:
-            return web.json_response(
+            return _json_response(
                 {"message": "Voice Library requires the explicit biometric-processing opt-in in Settings."},
                 status=409,
             )
         if requested_voice_library and not ctl._speaker_model.status()["installed"]:
-            return web.json_response(
+            return _json_response(
                 {"message": "Install the optional WeSpeaker model before enabling Voice Library."},
                 status=409,
             )
@@ -17739,7 +18216,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     else None
                 )
                 if selected_calendar_event is None:
-                    return web.json_response(
+                    return _json_response(
                         {
                             "message": (
                                 "The selected Outlook event is no longer available. "
@@ -17780,7 +18257,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 )
             except MeetingConflict as exc:
                 await _release_persistent_audio(ctl, meeting_claim)
-                return web.json_response({"message": str(exc)}, status=409)
+                return _json_response({"message": str(exc)}, status=409)
             try:
                 ownership.meeting_id = str(meeting["id"])
                 if meeting_claim is not None:
@@ -17927,7 +18404,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 if live_preview_degraded:
                     for source in ("microphone", "system"):
                         await ctl.broadcast(meeting_live_status_event(meeting["id"], source, "degraded", 0))
-                return web.json_response({**recording, "apiVersion": REST_API_VERSION}, status=201)
+                return _json_response({**recording, "apiVersion": REST_API_VERSION}, status=201)
             except asyncio.CancelledError:
                 await _cleanup_meeting_capture_ownership_barrier(
                     ctl,
@@ -17951,7 +18428,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     "errorCode": exc.code,
                     "errorMessage": exc.message,
                 }
-                return web.json_response(
+                return _json_response(
                     {
                         "message": meeting_payload.get("errorMessage") or exc.message,
                         "meeting": meeting_payload,
@@ -17971,7 +18448,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     error_message=message,
                 )
                 await _release_persistent_audio(ctl, meeting_claim)
-                return web.json_response(
+                return _json_response(
                     {
                         "message": (failed or {}).get("errorMessage") or message,
                         "meeting": failed,
@@ -17982,15 +18459,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
         async with _audio_admission_lock(ctl):
             if ctl._is_listening or ctl._is_stopping:
-                return web.json_response({"message": "Stop Live Mic before starting a meeting."}, status=409)
+                return _json_response({"message": "Stop Live Mic before starting a meeting."}, status=409)
             if ctl._meeting_device_test_active:
-                return web.json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
+                return _json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
             if bool(getattr(ctl, "_voice_enrollment_active", False)):
-                return web.json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
+                return _json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
             if await _active_meeting_audio_conflict(ctl) is not None:
-                return web.json_response(
-                    {"message": "Finish the active meeting before starting another one."}, status=409
-                )
+                return _json_response({"message": "Finish the active meeting before starting another one."}, status=409)
             try:
                 meeting_claim = await _claim_persistent_audio(
                     ctl,
@@ -17998,7 +18473,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     owner_id=f"pending-{uuid4().hex}",
                 )
             except AudioAdmissionConflict:
-                return web.json_response(
+                return _json_response(
                     {"message": "Another Scriber controller owns native audio capture."},
                     status=409,
                 )
@@ -18037,7 +18512,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         meeting_id = request.match_info.get("id", "")
         if current.get("state") != "paused":
-            return web.json_response(
+            return _json_response(
                 {"message": f"Meeting cannot resume from {current.get('state', 'unknown')}."},
                 status=409,
             )
@@ -18077,7 +18552,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 # No new owner exists. Keep the intentional paused state so a
                 # transient native error can be retried by the user.
                 ownership.resume_prewarm = False
-                return web.json_response(
+                return _json_response(
                     {"message": str(response.get("fallbackReason") or "Meeting capture resume failed")},
                     status=503,
                 )
@@ -18189,7 +18664,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if live_preview_degraded:
                 for source in ("microphone", "system"):
                     await ctl.broadcast(meeting_live_status_event(meeting_id, source, "degraded", 0))
-            return web.json_response({**updated, "apiVersion": REST_API_VERSION})
+            return _json_response({**updated, "apiVersion": REST_API_VERSION})
         except asyncio.CancelledError:
             await _cleanup_meeting_capture_ownership_barrier(
                 ctl,
@@ -18207,7 +18682,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 error_message=exc.message,
             )
             await _release_persistent_audio(ctl)
-            return web.json_response(
+            return _json_response(
                 {
                     "message": (failed or {}).get("errorMessage") or exc.message,
                     "meeting": failed,
@@ -18225,7 +18700,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 error_message=message,
             )
             await _release_persistent_audio(ctl)
-            return web.json_response(
+            return _json_response(
                 {
                     "message": (failed or {}).get("errorMessage") or message,
                     "meeting": failed,
@@ -18245,7 +18720,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         allowed_source_states = {
             "audioMeetingPause": frozenset({"recording"}),
             "audioMeetingResume": frozenset({"paused"}),
@@ -18258,13 +18733,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
         }
         current_state = str(current.get("state") or "unknown")
         if current_state not in allowed_source_states.get(command, frozenset()):
-            return web.json_response(
+            return _json_response(
                 {"message": (f"Meeting cannot {command_labels.get(command, 'change')} from {current_state}.")},
                 status=409,
             )
         meeting_claim = _meeting_audio_claim(ctl, meeting_id)
         if meeting_claim is None:
-            return web.json_response(
+            return _json_response(
                 {"message": "This Meeting does not own native audio capture."},
                 status=409,
             )
@@ -18314,7 +18789,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 command,
                 type(exc).__name__,
             )
-            return web.json_response(
+            return _json_response(
                 {"message": "Native Meeting audio control is temporarily unavailable."},
                 status=503,
             )
@@ -18322,9 +18797,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if disconnect_prepared and callable(cancel_disconnect):
                 cancel_disconnect()
             restore_watchdog()
-            return web.json_response(
-                {"message": str(response.get("fallbackReason") or f"{command} failed")}, status=503
-            )
+            return _json_response({"message": str(response.get("fallbackReason") or f"{command} failed")}, status=503)
         native_payload = response.get("payload") if isinstance(response.get("payload"), dict) else {}
         capture_metadata = dict(current.get("captureMetadata", {}))
         if command in {"audioMeetingPause", "audioMeetingStop"}:
@@ -18386,11 +18859,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     capture_metadata=capture_metadata,
                 )
             except (InvalidMeetingTransition, MeetingConflict) as exc:
-                return web.json_response({"message": str(exc)}, status=409)
+                return _json_response({"message": str(exc)}, status=409)
             await _release_persistent_audio(ctl, meeting_claim)
             ctl._resume_idle_mic_prewarm_after_capture()
             await ctl.broadcast(meeting_state_event(failed))
-            return web.json_response(
+            return _json_response(
                 {
                     "message": failure_message,
                     "meeting": failed,
@@ -18413,12 +18886,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 capture_metadata=capture_metadata,
             )
         except (InvalidMeetingTransition, MeetingConflict) as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         if command == "audioMeetingStop":
             await _release_persistent_audio(ctl, meeting_claim)
             ctl._resume_idle_mic_prewarm_after_capture()
         await ctl.broadcast(meeting_state_event(updated))
-        return web.json_response({**updated, "apiVersion": REST_API_VERSION})
+        return _json_response({**updated, "apiVersion": REST_API_VERSION})
 
     async def _meeting_capture_command(
         request: web.Request,
@@ -18434,24 +18907,24 @@ def create_app(controller: ScriberWebController) -> web.Application:
             try:
                 current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
             except MeetingNotFound:
-                return web.json_response({"message": "Meeting not found"}, status=404)
+                return _json_response({"message": "Meeting not found"}, status=404)
             if current.get("state") != "paused":
-                return web.json_response(
+                return _json_response(
                     {"message": (f"Meeting cannot resume from {current.get('state', 'unknown')}.")},
                     status=409,
                 )
             if ctl._is_listening or ctl._is_stopping:
-                return web.json_response({"message": "Stop Live Mic before resuming this meeting."}, status=409)
+                return _json_response({"message": "Stop Live Mic before resuming this meeting."}, status=409)
             if ctl._meeting_device_test_active:
-                return web.json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
+                return _json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
             if bool(getattr(ctl, "_voice_enrollment_active", False)):
-                return web.json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
+                return _json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
             if await _active_meeting_audio_conflict(ctl, allow_meeting_id=meeting_id) is not None:
-                return web.json_response({"message": "Finish the active meeting before resuming this one."}, status=409)
+                return _json_response({"message": "Finish the active meeting before resuming this one."}, status=409)
             try:
                 await _claim_persistent_audio(ctl, owner_kind="meeting", owner_id=meeting_id)
             except AudioAdmissionConflict:
-                return web.json_response(
+                return _json_response(
                     {"message": "Another Scriber controller owns native audio capture."},
                     status=409,
                 )
@@ -18466,9 +18939,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         if current.get("state") != "interrupted":
-            return web.json_response(
+            return _json_response(
                 {"message": f"Meeting cannot resume from {current.get('state', 'unknown')}."},
                 status=409,
             )
@@ -18597,7 +19070,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if live_preview_degraded:
                 for source in ("microphone", "system"):
                     await ctl.broadcast(meeting_live_status_event(meeting_id, source, "degraded", 0))
-            return web.json_response({**recording, "apiVersion": REST_API_VERSION})
+            return _json_response({**recording, "apiVersion": REST_API_VERSION})
         except asyncio.CancelledError:
             await _cleanup_meeting_capture_ownership_barrier(
                 ctl,
@@ -18615,7 +19088,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 error_message=exc.message,
             )
             await _release_persistent_audio(ctl)
-            return web.json_response(
+            return _json_response(
                 {
                     "message": (failed or {}).get("errorMessage") or exc.message,
                     "meeting": failed,
@@ -18633,7 +19106,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 error_message=message,
             )
             await _release_persistent_audio(ctl)
-            return web.json_response(
+            return _json_response(
                 {
                     "message": (failed or {}).get("errorMessage") or message,
                     "meeting": failed,
@@ -18648,35 +19121,35 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         if current["state"] != "interrupted":
             return await _meeting_capture_command(request, command="audioMeetingResume", target_state="recording")
 
         async with _audio_admission_lock(ctl):
             if ctl._is_listening or ctl._is_stopping:
-                return web.json_response({"message": "Stop Live Mic before resuming this meeting."}, status=409)
+                return _json_response({"message": "Stop Live Mic before resuming this meeting."}, status=409)
             if ctl._meeting_device_test_active:
-                return web.json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
+                return _json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
             if bool(getattr(ctl, "_voice_enrollment_active", False)):
-                return web.json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
+                return _json_response({"message": "Wait for the Voice Library sample to finish."}, status=409)
             if await _active_meeting_audio_conflict(ctl, allow_meeting_id=meeting_id) is not None:
-                return web.json_response({"message": "Finish the active meeting before resuming this one."}, status=409)
+                return _json_response({"message": "Finish the active meeting before resuming this one."}, status=409)
 
             # Re-read state after waiting for admission. A concurrent stop or
             # retry must not be resumed from the stale pre-lock snapshot.
             try:
                 current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
             except MeetingNotFound:
-                return web.json_response({"message": "Meeting not found"}, status=404)
+                return _json_response({"message": "Meeting not found"}, status=404)
             if current["state"] != "interrupted":
-                return web.json_response(
+                return _json_response(
                     {"message": f"Meeting can no longer resume from {current['state']}."},
                     status=409,
                 )
             try:
                 await _claim_persistent_audio(ctl, owner_kind="meeting", owner_id=meeting_id)
             except AudioAdmissionConflict:
-                return web.json_response(
+                return _json_response(
                     {"message": "Another Scriber controller owns native audio capture."},
                     status=409,
                 )
@@ -18695,7 +19168,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             clear_level_state(meeting_id)
         await ctl.broadcast(meeting_state_event(finalizing))
         ctl.schedule_meeting_finalization(meeting_id)
-        return web.json_response({**finalizing, "apiVersion": REST_API_VERSION}, status=202)
+        return _json_response({**finalizing, "apiVersion": REST_API_VERSION}, status=202)
 
     async def reprocess_meeting(request: web.Request):
         """Refresh Voice matches or create a new canonical transcript safely."""
@@ -18705,22 +19178,22 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             raw = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(raw, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         mode = str(raw.get("mode") or "").strip().lower()
         if mode not in {"speaker_identity", "full_transcript"}:
-            return web.json_response({"message": "Choose speaker_identity or full_transcript."}, status=400)
+            return _json_response({"message": "Choose speaker_identity or full_transcript."}, status=400)
 
         try:
             detail = await asyncio.to_thread(ctl._meeting_store.detail, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         capabilities = await _meeting_reprocessing_capabilities(ctl, detail)
 
         if mode == "speaker_identity":
             if not capabilities["speakerIdentityAvailable"]:
-                return web.json_response(
+                return _json_response(
                     {
                         "message": capabilities["speakerIdentityUnavailableReason"]
                         or "Speaker matching is unavailable for this Meeting."
@@ -18729,13 +19202,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 )
             start_gate = asyncio.Event()
             if not ctl.schedule_meeting_speaker_reprocessing(meeting_id, start_gate=start_gate):
-                return web.json_response({"message": "Meeting processing is already running."}, status=409)
+                return _json_response({"message": "Meeting processing is already running."}, status=409)
             task = ctl._meeting_tasks.get(meeting_id)
             if task is None:
-                return web.json_response({"message": "Speaker matching could not be started."}, status=503)
+                return _json_response({"message": "Speaker matching could not be started."}, status=503)
             start_gate.set()
             meeting = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "meeting": meeting,
@@ -18745,7 +19218,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
 
         if not capabilities["fullTranscriptAvailable"]:
-            return web.json_response(
+            return _json_response(
                 {
                     "message": capabilities["fullTranscriptUnavailableReason"]
                     or "Full Meeting retranscription is unavailable."
@@ -18756,10 +19229,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
         start_gate = asyncio.Event()
         reserved_task: asyncio.Task | None = None
         if not ctl.schedule_meeting_finalization(meeting_id, start_gate=start_gate):
-            return web.json_response({"message": "Meeting processing is already running."}, status=409)
+            return _json_response({"message": "Meeting processing is already running."}, status=409)
         reserved_task = ctl._meeting_tasks.get(meeting_id)
         if reserved_task is None:
-            return web.json_response({"message": "Meeting retranscription could not be started."}, status=503)
+            return _json_response({"message": "Meeting retranscription could not be started."}, status=503)
         try:
             finalizing, pending_cancel = await _await_with_delayed_cancellation(
                 asyncio.to_thread(
@@ -18778,7 +19251,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if pending_cancel is not None:
                 raise pending_cancel
             await ctl.broadcast(meeting_state_event(finalizing))
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "meeting": finalizing,
@@ -18789,11 +19262,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
         except asyncio.CancelledError:
             raise
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except (InvalidMeetingTransition, MeetingConflict) as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         finally:
             if not start_gate.is_set() and reserved_task is not None:
                 reserved_task.cancel()
@@ -18807,9 +19280,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
             try:
                 raw_retry = await request.json()
             except Exception:
-                return web.json_response({"message": "Expected JSON payload"}, status=400)
+                return _json_response({"message": "Expected JSON payload"}, status=400)
             if not isinstance(raw_retry, dict):
-                return web.json_response({"message": "Expected JSON object"}, status=400)
+                return _json_response({"message": "Expected JSON object"}, status=400)
             requested_final_provider = str(raw_retry.get("finalProvider") or "").strip().lower()
         start_gate: asyncio.Event | None = None
         reserved_task: asyncio.Task | None = None
@@ -18822,23 +19295,23 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
             if current["state"] not in {"finalization_failed", "analysis_failed", "interrupted", "capture_failed"}:
-                return web.json_response({"message": "Meeting is not waiting for a finalization retry."}, status=409)
+                return _json_response({"message": "Meeting is not waiting for a finalization retry."}, status=409)
             original_state = str(current["state"])
             retry_state = "analyzing" if current["state"] == "analysis_failed" else "finalizing"
             if requested_final_provider:
                 if retry_state != "finalizing":
-                    return web.json_response(
+                    return _json_response(
                         {"message": "The final transcription provider cannot change during an analysis-only retry."},
                         status=409,
                     )
                 if requested_final_provider not in _MEETING_FINAL_STT_PROVIDERS:
-                    return web.json_response(
+                    return _json_response(
                         {"message": "Unsupported final meeting transcription provider."},
                         status=400,
                     )
                 readiness_error = _provider_readiness_error(requested_final_provider)
                 if readiness_error:
-                    return web.json_response({"message": readiness_error}, status=409)
+                    return _json_response({"message": readiness_error}, status=409)
                 current_provider = str(current.get("finalProvider") or "").strip().lower()
                 capture_metadata = current.get("captureMetadata")
                 is_full_reprocess = bool(
@@ -18874,7 +19347,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         ),
                     )
                     if durable_timeline_ms > provider_duration_limit * 1_000:
-                        return web.json_response(
+                        return _json_response(
                             {
                                 "message": (
                                     f"{_service_label(requested_final_provider)} accepts Meeting "
@@ -18913,7 +19386,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         final_model=previous_reprocess_final_model,
                     )
                     changed_final_provider = ""
-                return web.json_response({"message": "Meeting processing is already running."}, status=409)
+                return _json_response({"message": "Meeting processing is already running."}, status=409)
             reserved_task = ctl._meeting_tasks.get(meeting_id)
             if import_job is not None and import_job.status == MeetingImportStatus.FAILED:
                 reopened_import = await _to_thread_cancellation_barrier(
@@ -18926,18 +19399,18 @@ def create_app(controller: ScriberWebController) -> web.Application:
             finalizing = await _to_thread_cancellation_barrier(ctl._meeting_store.transition, meeting_id, retry_state)
             start_gate.set()
             await ctl.broadcast(meeting_state_event(finalizing))
-            return web.json_response({**finalizing, "apiVersion": REST_API_VERSION}, status=202)
+            return _json_response({**finalizing, "apiVersion": REST_API_VERSION}, status=202)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except (
             InvalidMeetingTransition,
             MeetingConflict,
             InvalidMeetingImportTransition,
             MeetingImportConflict,
         ) as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         finally:
             if start_gate is not None and not start_gate.is_set() and reserved_task is not None:
                 reserved_task.cancel()
@@ -18996,20 +19469,20 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             current = await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
             if current["state"] not in {"ready", "analysis_failed"}:
-                return web.json_response({"message": "Meeting is not ready for analysis."}, status=409)
+                return _json_response({"message": "Meeting is not ready for analysis."}, status=409)
             original_state = str(current["state"])
             start_gate = asyncio.Event()
             if not ctl.schedule_meeting_analysis(meeting_id, start_gate=start_gate):
-                return web.json_response({"message": "Meeting analysis is already running."}, status=409)
+                return _json_response({"message": "Meeting analysis is already running."}, status=409)
             reserved_task = ctl._meeting_tasks.get(meeting_id)
             analyzing = await _to_thread_cancellation_barrier(ctl._meeting_store.transition, meeting_id, "analyzing")
             start_gate.set()
             await ctl.broadcast(meeting_state_event(analyzing))
-            return web.json_response({**analyzing, "apiVersion": REST_API_VERSION}, status=202)
+            return _json_response({**analyzing, "apiVersion": REST_API_VERSION}, status=202)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except (InvalidMeetingTransition, MeetingConflict) as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         finally:
             if start_gate is not None and not start_gate.is_set() and reserved_task is not None:
                 reserved_task.cancel()
@@ -19042,11 +19515,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 at_ms=int(raw["atMs"]) if raw.get("atMs") is not None else None,
             )
             await ctl.broadcast(meeting_note_event(meeting_id, note))
-            return web.json_response({**note, "apiVersion": REST_API_VERSION}, status=201)
+            return _json_response({**note, "apiVersion": REST_API_VERSION}, status=201)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except (TypeError, ValueError) as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def put_meeting_note(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -19066,11 +19539,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
             if note.get("writeApplied") is not False:
                 await ctl.broadcast(meeting_note_event(meeting_id, note))
-            return web.json_response({**note, "apiVersion": REST_API_VERSION})
+            return _json_response({**note, "apiVersion": REST_API_VERSION})
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except (TypeError, ValueError) as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def patch_meeting_action_item(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -19084,11 +19557,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if not allowed:
                 raise ValueError("No editable action item fields were supplied.")
             item = await asyncio.to_thread(ctl._meeting_store.update_action_item, meeting_id, item_id, allowed)
-            return web.json_response({**item, "apiVersion": REST_API_VERSION})
+            return _json_response({**item, "apiVersion": REST_API_VERSION})
         except MeetingNotFound as exc:
-            return web.json_response({"message": str(exc)}, status=404)
+            return _json_response({"message": str(exc)}, status=404)
         except (TypeError, ValueError) as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def discard_meeting(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -19114,7 +19587,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     }
                 )
             ):
-                return web.json_response(
+                return _json_response(
                     {
                         "message": (
                             "Meeting processing is still running. Wait for it to finish or fail "
@@ -19127,7 +19600,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             meetings_root = (storage_root / "meetings").resolve()
             meeting_root = (meetings_root / meeting_id).resolve()
             if meetings_root.parent != storage_root or meeting_root.parent != meetings_root:
-                return web.json_response({"message": "Meeting storage path is invalid."}, status=400)
+                return _json_response({"message": "Meeting storage path is invalid."}, status=400)
             discarded = await asyncio.to_thread(ctl._meeting_store.transition, meeting_id, "discarded")
             if meeting_root.is_dir():
                 await asyncio.to_thread(shutil.rmtree, meeting_root)
@@ -19137,26 +19610,26 @@ def create_app(controller: ScriberWebController) -> web.Application:
             if callable(clear_level_state):
                 clear_level_state(meeting_id)
             await ctl.broadcast(meeting_state_event(discarded))
-            return web.json_response({"success": True, "id": meeting_id, "apiVersion": REST_API_VERSION})
+            return _json_response({"success": True, "id": meeting_id, "apiVersion": REST_API_VERSION})
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except (InvalidMeetingTransition, MeetingConflict) as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
 
     async def meeting_audio(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         meeting_id = request.match_info.get("id", "")
         source = request.match_info.get("source", "")
         if source not in {"microphone", "system"}:
-            return web.json_response({"message": "Unknown meeting audio source"}, status=404)
+            return _json_response({"message": "Unknown meeting audio source"}, status=404)
         try:
             await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         final_dir = data_dir() / "meetings" / meeting_id / "final"
         path = final_dir / ("microphone.opus" if source == "microphone" else "system.opus")
         if not path.is_file():
-            return web.json_response({"message": "Meeting audio is not ready"}, status=404)
+            return _json_response({"message": "Meeting audio is not ready"}, status=404)
         return web.FileResponse(path, headers={"Accept-Ranges": "bytes", "Cache-Control": "private, no-store"})
 
     async def meeting_audio_mix(request: web.Request):
@@ -19165,10 +19638,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             await asyncio.to_thread(ctl._meeting_store.get, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         path = data_dir() / "meetings" / meeting_id / "final" / "playback.opus"
         if not path.is_file():
-            return web.json_response({"message": "Meeting playback mix is not ready"}, status=404)
+            return _json_response({"message": "Meeting playback mix is not ready"}, status=404)
         return web.FileResponse(
             path,
             headers={"Accept-Ranges": "bytes", "Cache-Control": "private, no-store"},
@@ -19179,14 +19652,14 @@ def create_app(controller: ScriberWebController) -> web.Application:
         meeting_id = request.match_info.get("id", "")
         export_format = request.match_info.get("format", "json").lower()
         if export_format not in {"json", "md", "pdf", "docx", "audio"}:
-            return web.json_response(
+            return _json_response(
                 {"message": "Meeting export supports json, md, pdf, docx, or compressed audio"},
                 status=400,
             )
         try:
             detail = await asyncio.to_thread(ctl._meeting_store.detail, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         safe_title = re.sub(r"[^A-Za-z0-9 _-]", "", detail["title"]).strip()[:60] or "meeting"
         if export_format == "audio":
             # Finalization already creates this bounded 64-kbit/s mono Opus mix
@@ -19194,7 +19667,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             # a second share copy or exposing lossless/raw meeting tracks.
             path = data_dir() / "meetings" / meeting_id / "final" / "playback.opus"
             if not path.is_file():
-                return web.json_response({"message": "Compressed meeting audio is not ready"}, status=404)
+                return _json_response({"message": "Compressed meeting audio is not ready"}, status=404)
             return web.FileResponse(
                 path,
                 headers={
@@ -19233,8 +19706,8 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             detail = await asyncio.to_thread(ctl._meeting_store.detail, request.match_info.get("id", ""))
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
-        return web.json_response(
+            return _json_response({"message": "Meeting not found"}, status=404)
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 **build_meeting_email(detail, fallback_language=Config.LANGUAGE),
@@ -19246,11 +19719,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
         meeting_id = request.match_info.get("id", "")
         attachment_format = request.query.get("attachment", "").strip().lower()
         if attachment_format not in {"", "md", "pdf", "docx"}:
-            return web.json_response({"message": "Email attachment supports md, pdf, or docx."}, status=400)
+            return _json_response({"message": "Email attachment supports md, pdf, or docx."}, status=400)
         try:
             detail = await asyncio.to_thread(ctl._meeting_store.detail, meeting_id)
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         safe_title = re.sub(r"[^A-Za-z0-9 _-]", "", detail["title"]).strip()[:60] or "meeting"
         attachment = None
         attachment_name = ""
@@ -19290,9 +19763,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
         meeting_id = request.match_info.get("id", "")
         try:
             items = await asyncio.to_thread(ctl._meeting_store.chat_threads, meeting_id)
-            return web.json_response({"apiVersion": REST_API_VERSION, "items": items})
+            return _json_response({"apiVersion": REST_API_VERSION, "items": items})
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
 
     async def meeting_chat(request: web.Request):
         from src.summarization import generate_text_with_model
@@ -19308,12 +19781,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 raise ValueError("Question must contain 1 to 8000 characters.")
             detail = await asyncio.to_thread(ctl._meeting_store.detail, meeting_id)
             if not detail["segments"]:
-                return web.json_response({"message": "Meeting transcript is not ready"}, status=409)
+                return _json_response({"message": "Meeting transcript is not ready"}, status=409)
             thread_id = str(raw.get("threadId", "")).strip()
             threads = await asyncio.to_thread(ctl._meeting_store.chat_threads, meeting_id)
             thread = next((item for item in threads if item["id"] == thread_id), None)
             if thread_id and thread is None:
-                return web.json_response({"message": "Meeting chat thread not found"}, status=404)
+                return _json_response({"message": "Meeting chat thread not found"}, status=404)
             if thread is None:
                 thread = await asyncio.to_thread(ctl._meeting_store.create_chat_thread, meeting_id, question[:80])
                 thread["messages"] = []
@@ -19391,16 +19864,16 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 citations=list(dict.fromkeys(citations)),
             )
             await ctl.broadcast(meeting_chat_delta_event(meeting_id, thread_id, answer))
-            return web.json_response(
+            return _json_response(
                 {"apiVersion": REST_API_VERSION, "threadId": thread_id, "message": message}, status=201
             )
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
         except Exception as exc:
             logger.exception("Meeting chat failed")
-            return web.json_response({"message": redact_text(str(exc))[:240] or "Meeting chat failed"}, status=500)
+            return _json_response({"message": redact_text(str(exc))[:240] or "Meeting chat failed"}, status=500)
 
     async def patch_meeting_speaker(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -19411,7 +19884,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             display_name = str(raw.get("displayName", "")) if isinstance(raw, dict) else ""
             changed = await asyncio.to_thread(ctl._meeting_store.rename_speaker, meeting_id, speaker_id, display_name)
             if not changed:
-                return web.json_response({"message": "Speaker not found"}, status=404)
+                return _json_response({"message": "Speaker not found"}, status=404)
             detail, profiles = await asyncio.gather(
                 asyncio.to_thread(ctl._meeting_store.detail, meeting_id),
                 asyncio.to_thread(ctl._meeting_store.speaker_profiles),
@@ -19425,7 +19898,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 (item for item in profiles if str(item.get("id") or "") == profile_id),
                 None,
             )
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "success": True,
@@ -19434,9 +19907,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def meeting_speaker_assignments(request: web.Request):
         from src.meeting_participant_matching import build_assignment_context
@@ -19452,9 +19925,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
             model = str(detail.get("analysisModel") or Config.MEETING_ANALYSIS_MODEL)
             model_ready = _meeting_llm_model_ready(model)
             context["llmSuggestionAvailable"] = bool(context["llmSuggestionAvailable"] and model_ready)
-            return web.json_response({"apiVersion": REST_API_VERSION, **context, "llmModel": model})
+            return _json_response({"apiVersion": REST_API_VERSION, **context, "llmModel": model})
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
 
     async def suggest_meeting_speaker_assignments(request: web.Request):
         from src.meeting_participant_matching import (
@@ -19474,13 +19947,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
             local_context = build_assignment_context(detail, profiles)
             model = str(detail.get("analysisModel") or Config.MEETING_ANALYSIS_MODEL)
             if not _meeting_llm_model_ready(model):
-                return web.json_response(
+                return _json_response(
                     {"message": ("Configure the API key for the selected Meeting analysis model first.")},
                     status=409,
                 )
             prompt, speaker_keys, person_keys = build_llm_prompt(detail, local_context)
             if not speaker_keys or not person_keys:
-                return web.json_response(
+                return _json_response(
                     {
                         "apiVersion": REST_API_VERSION,
                         **local_context,
@@ -19497,7 +19970,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
             llm_suggestions = parse_llm_suggestions(raw, speaker_keys, person_keys)
             context = build_assignment_context(detail, profiles, llm_suggestions=llm_suggestions)
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     **context,
@@ -19508,10 +19981,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except MeetingNotFound:
-            return web.json_response({"message": "Meeting not found"}, status=404)
+            return _json_response({"message": "Meeting not found"}, status=404)
         except Exception as exc:
             logger.warning("Meeting participant suggestion failed: {}", type(exc).__name__)
-            return web.json_response(
+            return _json_response(
                 {"message": "Speaker suggestions could not be generated. No assignment was changed."},
                 status=502,
             )
@@ -19525,18 +19998,18 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             raw = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(raw, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         if raw.get("confirmed") is not True:
-            return web.json_response(
+            return _json_response(
                 {"message": "Speaker assignments require explicit confirmation."},
                 status=400,
             )
         has_participant_id = "participantId" in raw
         has_display_name = "displayName" in raw
         if has_participant_id == has_display_name:
-            return web.json_response(
+            return _json_response(
                 {
                     "message": (
                         "Provide either participantId (use null to remove an assignment) or a meeting-only displayName."
@@ -19547,14 +20020,14 @@ def create_app(controller: ScriberWebController) -> web.Application:
         try:
             if has_display_name:
                 if not isinstance(raw.get("displayName"), str):
-                    return web.json_response({"message": "displayName must be text."}, status=400)
+                    return _json_response({"message": "displayName must be text."}, status=400)
                 assignment = await asyncio.to_thread(
                     ctl._meeting_store.assign_speaker_display_name,
                     meeting_id,
                     speaker_id,
                     raw["displayName"],
                 )
-                return web.json_response(
+                return _json_response(
                     {
                         "apiVersion": REST_API_VERSION,
                         "assignment": assignment,
@@ -19575,7 +20048,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     None,
                 )
                 if participant is None:
-                    return web.json_response(
+                    return _json_response(
                         {"message": ("Choose a participant from the calendar snapshot saved with this meeting.")},
                         status=409,
                     )
@@ -19591,7 +20064,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
             if participant is not None:
                 assignment["confirmedAttendee"] = participant
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "assignment": assignment,
@@ -19600,12 +20073,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
         except MeetingNotFound as exc:
             message = str(exc)
-            return web.json_response(
+            return _json_response(
                 {"message": message},
                 status=404,
             )
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def list_speaker_profiles(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -19661,7 +20134,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             }
         prune_speaker_preview_grants(now)
         model_status = ctl._speaker_model.status()
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "enabled": bool(Config.VOICEPRINT_LIBRARY_OPT_IN and model_status["installed"]),
@@ -19676,11 +20149,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
         prune_speaker_preview_grants(now)
         token = str(request.match_info.get("token") or "")
         if not re.fullmatch(r"[0-9a-f]{32}", token):
-            return web.json_response({"message": "Speaker preview not found"}, status=404)
+            return _json_response({"message": "Speaker preview not found"}, status=404)
         grant = speaker_preview_grants.get(token)
         if grant is None or grant.expires_at <= now:
             speaker_preview_grants.pop(token, None)
-            return web.json_response({"message": "Speaker preview not found"}, status=404)
+            return _json_response({"message": "Speaker preview not found"}, status=404)
 
         # Deleting a profile or purging its retained Meeting audio immediately
         # revokes every previously minted process-local capability.
@@ -19688,15 +20161,15 @@ def create_app(controller: ScriberWebController) -> web.Application:
         current_candidates = await asyncio.to_thread(candidates_fn) if callable(candidates_fn) else {}
         if grant.profile_id not in current_candidates:
             speaker_preview_grants.pop(token, None)
-            return web.json_response({"message": "Speaker preview not found"}, status=404)
+            return _json_response({"message": "Speaker preview not found"}, status=404)
         try:
             audio = await _render_speaker_profile_preview(grant)
         except FileNotFoundError:
             speaker_preview_grants.pop(token, None)
-            return web.json_response({"message": "Speaker preview not found"}, status=404)
+            return _json_response({"message": "Speaker preview not found"}, status=404)
         except Exception as exc:
             logger.warning("Local Voice Library preview failed: {}", type(exc).__name__)
-            return web.json_response(
+            return _json_response(
                 {"message": "The local speaker preview could not be played."},
                 status=503,
             )
@@ -19713,56 +20186,56 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def enroll_speaker_profile(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         if not Config.VOICEPRINT_LIBRARY_OPT_IN:
-            return web.json_response(
+            return _json_response(
                 {"message": "Turn on Voice Library in Settings before recording a voice."},
                 status=409,
             )
         if not ctl._speaker_model.status()["installed"]:
-            return web.json_response(
+            return _json_response(
                 {"message": "Download the local voice recognition model before recording a voice."},
                 status=409,
             )
         if not shell_ipc_available():
-            return web.json_response({"message": "Native microphone capture is unavailable in this copy."}, status=503)
+            return _json_response({"message": "Native microphone capture is unavailable in this copy."}, status=503)
         try:
             raw = await request.json()
         except Exception:
-            return web.json_response({"message": "Expected JSON payload"}, status=400)
+            return _json_response({"message": "Expected JSON payload"}, status=400)
         if not isinstance(raw, dict):
-            return web.json_response({"message": "Expected JSON object"}, status=400)
+            return _json_response({"message": "Expected JSON object"}, status=400)
         display_name = " ".join(str(raw.get("displayName", "")).split()).strip()
         if not display_name:
-            return web.json_response({"message": "Enter the speaker's name first."}, status=400)
+            return _json_response({"message": "Enter the speaker's name first."}, status=400)
         if len(display_name) > 120:
-            return web.json_response({"message": "Speaker name must be 120 characters or fewer."}, status=400)
+            return _json_response({"message": "Speaker name must be 120 characters or fewer."}, status=400)
         profile_id = str(raw.get("profileId", "") or "").strip()
         if profile_id:
             profiles = await asyncio.to_thread(ctl._meeting_store.speaker_profiles)
             if not any(str(item.get("id", "")) == profile_id for item in profiles):
-                return web.json_response({"message": "Speaker profile not found"}, status=404)
+                return _json_response({"message": "Speaker profile not found"}, status=404)
         microphone_hash = str(raw.get("microphoneNativeEndpointIdHash", "") or "").strip()
         if microphone_hash and not re.fullmatch(r"[0-9a-fA-F]{8,128}", microphone_hash):
-            return web.json_response({"message": "Choose a valid microphone."}, status=400)
+            return _json_response({"message": "Choose a valid microphone."}, status=400)
         try:
             duration_ms = max(6_000, min(10_000, int(raw.get("durationMs", 8_000) or 8_000)))
         except TypeError, ValueError:
-            return web.json_response({"message": "Invalid voice sample duration."}, status=400)
+            return _json_response({"message": "Invalid voice sample duration."}, status=400)
 
         admission_lock = _audio_admission_lock(ctl)
         enrollment_claim: AudioAdmissionClaim | None = None
         claim_cancel: asyncio.CancelledError | None = None
         async with admission_lock:
             if ctl._is_listening or ctl._is_stopping:
-                return web.json_response({"message": "Stop Live Mic before recording a voice sample."}, status=409)
+                return _json_response({"message": "Stop Live Mic before recording a voice sample."}, status=409)
             if await _active_meeting_audio_conflict(ctl) is not None:
-                return web.json_response(
+                return _json_response(
                     {"message": "Finish the active meeting before recording a voice sample."},
                     status=409,
                 )
             if ctl._meeting_device_test_active:
-                return web.json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
+                return _json_response({"message": "Wait for the Meeting device test to finish."}, status=409)
             if bool(getattr(ctl, "_voice_enrollment_active", False)):
-                return web.json_response({"message": "A Voice Library sample is already being recorded."}, status=409)
+                return _json_response({"message": "A Voice Library sample is already being recorded."}, status=409)
             try:
                 claimed_audio, pending_cancel = await _await_with_delayed_cancellation(
                     _claim_persistent_audio(
@@ -19779,7 +20252,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 ctl._voice_enrollment_active = True
                 claim_cancel = pending_cancel
             except AudioAdmissionConflict:
-                return web.json_response({"message": "Another Scriber window is using the microphone."}, status=409)
+                return _json_response({"message": "Another Scriber window is using the microphone."}, status=409)
 
         capture: VoiceEnrollmentCapture | None = None
         stream_id = ""
@@ -19825,13 +20298,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     )
                 else:
                     message = str(response.get("fallbackReason") or "The selected microphone could not start.")[:240]
-                return web.json_response(
+                return _json_response(
                     {"message": message},
                     status=503,
                 )
             frame_pipe = str(payload.get("framePipe") or "")
             if not stream_id or not frame_pipe:
-                return web.json_response(
+                return _json_response(
                     {"message": "Native microphone capture returned an incomplete response."},
                     status=503,
                 )
@@ -19843,7 +20316,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 returned_channels = 0
             returned_sample_format = str(payload.get("sampleFormat") or "")
             if returned_sample_rate != 16_000 or returned_channels != 1 or returned_sample_format != "pcm_i16_le":
-                return web.json_response(
+                return _json_response(
                     {
                         "message": (
                             "Native microphone capture returned an unsupported "
@@ -19884,12 +20357,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
             pcm = capture.pcm16()
             async with _voice_library_mutation_lock(ctl):
                 if not Config.VOICEPRINT_LIBRARY_OPT_IN:
-                    return web.json_response(
+                    return _json_response(
                         {"message": "Voice Library was turned off before the sample finished."},
                         status=409,
                     )
                 if not ctl._speaker_model.status()["installed"]:
-                    return web.json_response(
+                    return _json_response(
                         {"message": "The local voice recognition model is no longer available."},
                         status=409,
                     )
@@ -19912,7 +20385,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 "peak": round(float(snapshot.get("peak", 0.0) or 0.0), 4),
                 "quality": quality,
             }
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "profile": profile,
@@ -19923,17 +20396,17 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 status=201,
             )
         except MeetingNotFound:
-            return web.json_response({"message": "Speaker profile not found"}, status=404)
+            return _json_response({"message": "Speaker profile not found"}, status=404)
         except VoiceLibraryDisabled as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=422)
+            return _json_response({"message": str(exc)}, status=422)
         except asyncio.CancelledError:
             handler_cancelled = True
             raise
         except Exception as exc:
             logger.warning("Voice Library enrollment failed: {}", type(exc).__name__)
-            return web.json_response({"message": "The voice sample could not be completed. Try again."}, status=503)
+            return _json_response({"message": "The voice sample could not be completed. Try again."}, status=503)
         finally:
 
             async def cleanup_enrollment() -> None:
@@ -20019,8 +20492,8 @@ def create_app(controller: ScriberWebController) -> web.Application:
             ctl._meeting_store.delete_speaker_profile, request.match_info.get("profileId", "")
         )
         if not deleted:
-            return web.json_response({"message": "Speaker profile not found"}, status=404)
-        return web.json_response({"apiVersion": REST_API_VERSION, "success": True})
+            return _json_response({"message": "Speaker profile not found"}, status=404)
+        return _json_response({"apiVersion": REST_API_VERSION, "success": True})
 
     async def patch_speaker_profile(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -20033,11 +20506,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 request.match_info.get("profileId", ""),
                 str(raw.get("displayName", "")),
             )
-            return web.json_response({"apiVersion": REST_API_VERSION, **result})
+            return _json_response({"apiVersion": REST_API_VERSION, **result})
         except MeetingNotFound as exc:
-            return web.json_response({"message": str(exc)}, status=404)
+            return _json_response({"message": str(exc)}, status=404)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def merge_speaker_profiles(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -20050,11 +20523,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 str(raw.get("targetProfileId", "")),
                 str(raw.get("sourceProfileId", "")),
             )
-            return web.json_response({"apiVersion": REST_API_VERSION, **result})
+            return _json_response({"apiVersion": REST_API_VERSION, **result})
         except MeetingNotFound as exc:
-            return web.json_response({"message": str(exc)}, status=404)
+            return _json_response({"message": str(exc)}, status=404)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=400)
+            return _json_response({"message": str(exc)}, status=400)
 
     async def split_speaker_profile(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
@@ -20064,15 +20537,15 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 request.match_info.get("id", ""),
                 request.match_info.get("speakerId", ""),
             )
-            return web.json_response({"apiVersion": REST_API_VERSION, **result})
+            return _json_response({"apiVersion": REST_API_VERSION, **result})
         except MeetingNotFound as exc:
-            return web.json_response({"message": str(exc)}, status=404)
+            return _json_response({"message": str(exc)}, status=404)
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=409)
+            return _json_response({"message": str(exc)}, status=409)
 
     async def speaker_model_status(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "optedIn": bool(Config.VOICEPRINT_LIBRARY_OPT_IN),
@@ -20083,12 +20556,12 @@ def create_app(controller: ScriberWebController) -> web.Application:
     async def download_speaker_model(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         if not Config.VOICEPRINT_LIBRARY_OPT_IN:
-            return web.json_response(
+            return _json_response(
                 {"message": "Confirm the Voice Library biometric-processing opt-in first."}, status=409
             )
         durable_enabled = getattr(ctl._meeting_store, "speaker_library_enabled", None)
         if callable(durable_enabled) and not await asyncio.to_thread(durable_enabled):
-            return web.json_response(
+            return _json_response(
                 {"message": "Voice Library was turned off before the download started."},
                 status=409,
             )
@@ -20103,7 +20576,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         and (not callable(durable_enabled) or await asyncio.to_thread(durable_enabled))
                     )
                     if not enabled_before_promotion:
-                        return web.json_response(
+                        return _json_response(
                             {"message": ("Voice Library was turned off while the local download was running.")},
                             status=409,
                         )
@@ -20129,15 +20602,15 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         pending_cancel = pending_cancel or delete_cancel
                         if pending_cancel is not None:
                             raise pending_cancel
-                        return web.json_response(
+                        return _json_response(
                             {"message": ("Voice Library was turned off while the local download was finishing.")},
                             status=409,
                         )
                     if pending_cancel is not None:
                         raise pending_cancel
-            return web.json_response({"apiVersion": REST_API_VERSION, **status})
+            return _json_response({"apiVersion": REST_API_VERSION, **status})
         except ValueError as exc:
-            return web.json_response({"message": str(exc)}, status=502)
+            return _json_response({"message": str(exc)}, status=502)
         finally:
             if staged is not None:
                 try:
@@ -20152,6 +20625,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             deleted = await asyncio.to_thread(ctl._meeting_store.delete_all_speaker_profiles)
             await asyncio.to_thread(ctl._speaker_model.delete)
             Config.set_voiceprint_library_opt_in(False)
+            ctl._invalidate_settings_cache()
             ctl._schedule_settings_persist()
             return deleted
 
@@ -20159,13 +20633,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
             deleted_profiles, pending_cancel = await _await_with_delayed_cancellation(delete_all_voice_data())
             if pending_cancel is not None:
                 raise pending_cancel
-        return web.json_response({"apiVersion": REST_API_VERSION, "deleted": True, "deletedProfiles": deleted_profiles})
+        return _json_response({"apiVersion": REST_API_VERSION, "deleted": True, "deletedProfiles": deleted_profiles})
 
     async def diarization_component_status(request: web.Request):
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         status_async = getattr(ctl._speaker_diarizer, "status_async", None)
         status = await status_async() if callable(status_async) else ctl._speaker_diarizer.status()
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "enabled": bool(Config.SPEAKER_DIARIZATION_FALLBACK_ENABLED),
@@ -20177,7 +20651,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         ctl: ScriberWebController = request.app[APP_CONTROLLER]
         try:
             status = await ctl._speaker_diarizer.install(request.app[APP_HTTP_SESSION])
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "enabled": bool(Config.SPEAKER_DIARIZATION_FALLBACK_ENABLED),
@@ -20185,7 +20659,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except (OSError, RuntimeError, ValueError) as exc:
-            return web.json_response(
+            return _json_response(
                 {"message": redact_text(str(exc))[:240] or "Local diarization install failed."},
                 status=502,
             )
@@ -20199,7 +20673,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             await asyncio.to_thread(ctl._speaker_diarizer.delete)
             deleted = True
         if not deleted:
-            return web.json_response(
+            return _json_response(
                 {
                     "apiVersion": REST_API_VERSION,
                     "deleted": False,
@@ -20209,7 +20683,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
         status_async = getattr(ctl._speaker_diarizer, "status_async", None)
         status = await status_async() if callable(status_async) else ctl._speaker_diarizer.status()
-        return web.json_response(
+        return _json_response(
             {
                 "apiVersion": REST_API_VERSION,
                 "deleted": True,
@@ -20423,9 +20897,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
 
             payload = await asyncio.to_thread(_load_onnx_models)
-            return web.json_response(payload)
+            return _json_response(payload)
         except ImportError as e:
-            return web.json_response(
+            return _json_response(
                 {
                     "available": False,
                     "message": str(e),
@@ -20434,13 +20908,13 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
         except Exception as e:
             logger.exception("Failed to list ONNX models")
-            return web.json_response({"message": str(e)}, status=500)
+            return _json_response({"message": str(e)}, status=500)
 
     async def onnx_model_status(request: web.Request):
         """Get status of a specific ONNX model."""
         model_id = request.match_info.get("model_id", "")
         if not model_id:
-            return web.json_response({"message": "Missing model ID"}, status=400)
+            return _json_response({"message": "Missing model ID"}, status=400)
         quantization = request.query.get("quantization") or Config.ONNX_QUANTIZATION
 
         try:
@@ -20455,10 +20929,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
             info, status = await asyncio.to_thread(load_status)
             if not info:
-                return web.json_response({"message": "Unknown model"}, status=404)
+                return _json_response({"message": "Unknown model"}, status=404)
             assert status is not None
 
-            return web.json_response(
+            return _json_response(
                 {
                     "id": model_id,
                     "name": info["name"],
@@ -20478,7 +20952,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 }
             )
         except Exception as e:
-            return web.json_response({"message": str(e)}, status=500)
+            return _json_response({"message": str(e)}, status=500)
 
     async def onnx_download_model(request: web.Request):
         """Download an ONNX model from Hugging Face."""
@@ -20490,7 +20964,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
         model_id = body.get("modelId", "")
         quantization = body.get("quantization") or Config.ONNX_QUANTIZATION
         if not model_id:
-            return web.json_response({"message": "Missing modelId"}, status=400)
+            return _json_response({"message": "Missing modelId"}, status=400)
 
         try:
             from src.onnx_stt import download_model, get_model_status
@@ -20506,11 +20980,11 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
             info, status, downloading = await asyncio.to_thread(download_preflight)
             if not info:
-                return web.json_response({"message": "Unknown model"}, status=404)
+                return _json_response({"message": "Unknown model"}, status=404)
 
             assert status is not None
             if status.get("downloaded"):
-                return web.json_response(
+                return _json_response(
                     {
                         "success": True,
                         "message": "Model already downloaded",
@@ -20519,7 +20993,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 )
 
             if downloading:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": False,
                         "message": "Download already in progress",
@@ -20568,7 +21042,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
 
             if success:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": True,
                         "message": "Model downloaded successfully",
@@ -20576,7 +21050,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         "quantization": quantization,
                     }
                 )
-            return web.json_response(
+            return _json_response(
                 {
                     "success": False,
                     "message": "Download failed",
@@ -20587,16 +21061,16 @@ def create_app(controller: ScriberWebController) -> web.Application:
             )
 
         except ValueError as e:
-            return web.json_response({"message": str(e)}, status=400)
+            return _json_response({"message": str(e)}, status=400)
         except Exception as e:
             logger.exception(f"Failed to download model {model_id}")
-            return web.json_response({"message": str(e)}, status=500)
+            return _json_response({"message": str(e)}, status=500)
 
     async def onnx_delete_model(request: web.Request):
         """Delete a downloaded ONNX model from cache."""
         model_id = request.match_info.get("model_id", "")
         if not model_id:
-            return web.json_response({"message": "Missing model ID"}, status=400)
+            return _json_response({"message": "Missing model ID"}, status=400)
         quantization = request.query.get("quantization") or Config.ONNX_QUANTIZATION
 
         try:
@@ -20613,9 +21087,9 @@ def create_app(controller: ScriberWebController) -> web.Application:
 
             delete_state, success = await asyncio.to_thread(delete_local_model)
             if delete_state == "unknown":
-                return web.json_response({"message": "Unknown model"}, status=404)
+                return _json_response({"message": "Unknown model"}, status=404)
             if delete_state == "downloading":
-                return web.json_response(
+                return _json_response(
                     {"message": "Cannot delete a model while it is downloading"},
                     status=409,
                 )
@@ -20628,7 +21102,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                         "modelId": model_id,
                     }
                 )
-                return web.json_response(
+                return _json_response(
                     {
                         "success": True,
                         "message": "Model deleted",
@@ -20636,7 +21110,7 @@ def create_app(controller: ScriberWebController) -> web.Application:
                     }
                 )
             else:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": False,
                         "message": "Model not found in cache",
@@ -20646,10 +21120,10 @@ def create_app(controller: ScriberWebController) -> web.Application:
                 )
 
         except ValueError as e:
-            return web.json_response({"message": str(e)}, status=400)
+            return _json_response({"message": str(e)}, status=400)
         except Exception as e:
             logger.exception(f"Failed to delete model {model_id}")
-            return web.json_response({"message": str(e)}, status=500)
+            return _json_response({"message": str(e)}, status=500)
 
     app.router.add_get("/api/onnx/models", onnx_list_models)
     app.router.add_get("/api/onnx/models/{model_id}", onnx_model_status)
@@ -20679,6 +21153,7 @@ async def run_server(host: str, port: int) -> None:
     shutdown_requested = False
     background_init_task: asyncio.Task | None = None
     previous_signal_handlers: dict[int, Any] = {}
+    loop_signal_handlers: list[int] = []
     force_exit_timer: threading.Timer | None = None
 
     def _request_stop(*_args: Any) -> None:
@@ -20699,7 +21174,13 @@ async def run_server(host: str, port: int) -> None:
         for sig in (signal.SIGINT, getattr(signal, "SIGTERM", signal.SIGINT)):
             try:
                 previous_signal_handlers[int(sig)] = signal.getsignal(sig)
-                signal.signal(sig, _request_stop)
+                try:
+                    loop.add_signal_handler(sig, stop_event.set)
+                    loop_signal_handlers.append(int(sig))
+                except NotImplementedError:
+                    # Windows loops have no add_signal_handler; the C-level
+                    # handler wakes the loop thread-safely instead.
+                    signal.signal(sig, _request_stop)
             except Exception:  # pragma: no cover - platform dependent
                 pass
 
@@ -20740,6 +21221,11 @@ async def run_server(host: str, port: int) -> None:
         except Exception:
             logger.exception("Scriber persistence cleanup failed")
         logger.info("Scriber web API shutdown cleanup complete")
+        for sig_value in loop_signal_handlers:
+            try:
+                loop.remove_signal_handler(sig_value)
+            except Exception as exc:  # pragma: no cover - platform dependent
+                logger.debug("Loop signal-handler removal failed: {}", type(exc).__name__)
         for sig_value, previous_handler in previous_signal_handlers.items():
             try:
                 signal.signal(sig_value, previous_handler)
@@ -20908,6 +21394,21 @@ def _prewarm_stt_service(service_name: str) -> None:
         logger.debug(f"Could not prewarm STT service {service_name}: {e}")
 
 
+def _server_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory on POSIX hosts that have it installed.
+
+    The shipped Windows backend keeps the default Proactor loop; uvloop has no
+    Windows build.
+    """
+    if os.name == "nt":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
     add_stderr = os.getenv("SCRIBER_LOG_STDERR", "1").strip().lower() not in {
         "0",
@@ -20918,7 +21419,7 @@ def main() -> None:
     setup_logging(component="web_api", force=True, add_stderr=add_stderr)
     host = os.getenv("SCRIBER_WEB_HOST", "127.0.0.1")
     port = _env_int("SCRIBER_WEB_PORT", 8765, minimum=1, maximum=65535)
-    asyncio.run(run_server(host, port))
+    asyncio.run(run_server(host, port), loop_factory=_server_loop_factory())
 
 
 if __name__ == "__main__":
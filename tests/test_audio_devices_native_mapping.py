@@ -2,6 +2,7 @@ import types
 import warnings
 
 from src.audio_devices import (
+    _looks_virtual_or_output,
     build_input_endpoint_mappings,
     collect_native_capture_endpoint_inventory,
     hash_native_endpoint_id,
@@ -36,6 +37,15 @@ def test_hash_native_endpoint_id_is_stable_and_redacted():
     assert "secret-device-guid" not in hashed
 
 
+def test_virtual_and_output_device_names_are_filtered_case_insensitively():
+    assert _looks_virtual_or_output("Stereo Mix (Realtek Audio)")
+    assert _looks_virtual_or_output("Primärer Soundaufnahmetreiber")
+    assert _looks_virtual_or_output("PC-LAUTSPRECHER (High Definition Audio)")
+    assert _looks_virtual_or_output("Input ()")
+    assert not _looks_virtual_or_output("Mikrofon (2- Dock Mic)")
+    assert not _looks_virtual_or_output("Headset Microphone (USB)")
+
+
 def test_normalize_native_endpoint_inventory_filters_render_and_redacts_ids():
     raw_capture_id = r"SWD\MMDEVAPI\{0.0.1.00000000}.{capture-guid}"
     entries = normalize_native_endpoint_inventory(
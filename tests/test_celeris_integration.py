@@ -333,5 +333,5 @@ def test_frontend_and_settings_contract_expose_celeris_without_a_key() -> None:
     assert 'value: "celeris-1"' in settings
     assert 'provider="Celeris"' in settings
     assert "celeris?: string" in api_types
-    assert '"celeris": getattr(Config, "CELERIS_API_KEY"' in web_api
+    assert '"celeris": Config.CELERIS_API_KEY or ""' in web_api
     assert '"celeris": "CELERIS_API_KEY"' in config
@@ -380,6 +380,25 @@ def test_poll_refresh_does_not_quiesce_or_refresh_portaudio(monkeypatch):
     assert calls == []
 
 
+def test_unchanged_poll_keeps_published_device_list(monkeypatch):
+    monitor = device_monitor.DeviceMonitor()
+    monkeypatch.setattr(
+        device_monitor,
+        "_enumerate_microphones",
+        lambda **_kwargs: [
+            {"deviceId": "default", "label": "Default"},
+            {"deviceId": "USB Mic", "label": "USB Mic (Default)"},
+        ],
+    )
+
+    monitor._refresh_devices(trigger="poll", force=False, refresh_portaudio=False)
+    published = monitor._devices
+    monitor._refresh_devices(trigger="poll", force=False, refresh_portaudio=False)
+
+    assert monitor._devices is published
+    assert monitor.get_devices() == published
+
+
 def test_poll_interval_is_sparse_when_native_events_are_active():
     monitor = device_monitor.DeviceMonitor()
     monitor._poll_seconds_override = None
@@ -144,8 +144,8 @@ async def test_hotkey_toggle_burst_stress_end_to_end(monkeypatch, tmp_path):
     _assert_controller_clean(ctl)
     _assert_pipeline_invariants()
     assert ctl._history
-    assert all(rec.status == "completed" for rec in ctl._history)
-    assert all(rec.content.strip().startswith("stress transcript") for rec in ctl._history)
+    assert all(rec.status == "completed" for rec in ctl._history.values())
+    assert all(rec.content.strip().startswith("stress transcript") for rec in ctl._history.values())
     assert paste_mock.call_count == len(ctl._history)
 
 
@@ -222,7 +222,7 @@ async def test_tauri_hotkey_start_spam_during_initializing_creates_single_record
     _assert_controller_clean(ctl)
     _assert_pipeline_invariants()
     assert len(ctl._history) == 1
-    assert ctl._history[0].status == "completed"
+    assert next(iter(ctl._history.values())).status == "completed"
     assert paste_mock.call_count == 1
 
 
@@ -270,8 +270,8 @@ async def test_hotkey_ptt_press_release_burst_stress_end_to_end(monkeypatch, tmp
     _assert_controller_clean(ctl)
     _assert_pipeline_invariants()
     assert len(ctl._history) >= 3
-    assert all(rec.status == "completed" for rec in ctl._history)
-    assert all(rec.content.strip().startswith("stress transcript") for rec in ctl._history)
+    assert all(rec.status == "completed" for rec in ctl._history.values())
+    assert all(rec.content.strip().startswith("stress transcript") for rec in ctl._history.values())
     assert paste_mock.call_count == len(ctl._history)
 
 
@@ -328,4 +328,4 @@ async def test_cancelling_ptt_poller_does_not_cancel_active_finalization(
 
     _assert_controller_clean(ctl)
     assert len(ctl._history) == 1
-    assert ctl._history[0].status == "completed"
+    assert next(iter(ctl._history.values())).status == "completed"
@@ -4,7 +4,7 @@ import asyncio
 import hashlib
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp.test_utils import TestClient, TestServer
@@ -209,6 +209,40 @@ async def test_install_is_idempotent_anonymous_and_broadcasts_authoritative_prog
         await _close(client, controller)
 
 
+@pytest.mark.asyncio
+async def test_progress_watcher_skips_broadcasts_and_slows_polling_without_ws_clients(
+    monkeypatch,
+    tmp_path,
+):
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    controller = ScriberWebController(asyncio.get_running_loop())
+    snapshots = iter(
+        [
+            {"variant": "q8_0", "status": "downloading", "progress": 10.0},
+            {"variant": "q8_0", "status": "downloading", "progress": 60.0},
+            {"variant": "q8_0", "status": "ready", "progress": 100.0},
+        ]
+    )
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    broadcast = AsyncMock()
+    monkeypatch.setattr(controller, "_local_polishing_model_snapshot", lambda _variant: next(snapshots))
+    monkeypatch.setattr(controller, "broadcast", broadcast)
+    controller._client_count = 0
+    try:
+        with patch.object(web_api.asyncio, "sleep", fake_sleep):
+            await controller._watch_local_polishing_operation("op-1", "q8_0")
+    finally:
+        controller.shutdown()
+
+    broadcast.assert_not_awaited()
+    assert sleeps == [1.0, 1.0]
+
+
 @pytest.mark.asyncio
 async def test_install_operation_can_be_cancelled_without_starting_a_duplicate(
     monkeypatch,
@@ -2962,6 +2962,45 @@ async def test_durable_meeting_import_commits_upload_before_background_processin
         database._close_all_connections()
 
 
+@pytest.mark.asyncio
+async def test_meeting_import_upload_batches_disk_writes_and_hashes_every_byte(monkeypatch, tmp_path):
+    monkeypatch.delenv("SCRIBER_SESSION_TOKEN", raising=False)
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(web_api, "_UPLOAD_WRITE_BATCH_BYTES", 4096)
+    content = bytes(range(256)) * 97
+    import_store = MeetingImportStore(tmp_path / "meeting-import-upload.db")
+    created = import_store.create(
+        import_id="upload-import",
+        source_filename="Standup.wav",
+        expected_bytes=len(content),
+        profile_snapshot={"id": "balanced", "language": "en"},
+        metadata={"title": "Standup", "origin": "imported"},
+    )
+    scheduled: list[str] = []
+
+    async def broadcast_import(*_args):
+        return None
+
+    controller = object.__new__(web_api.ScriberWebController)
+    controller._meeting_import_store = import_store
+    controller._broadcast_meeting_import = broadcast_import
+    controller.schedule_meeting_import = scheduled.append
+    client = TestClient(TestServer(web_api.create_app(controller)))
+    await client.start_server()
+    try:
+        response = await client.put(f"/api/meeting-imports/{created.id}/content", data=content)
+        assert response.status == 202
+
+        record = import_store.require(created.id)
+        assert record.status == MeetingImportStatus.RECEIVED
+        assert record.original_sha256 == hashlib.sha256(content).hexdigest()
+        assert (tmp_path / "meeting-imports" / created.id / "source.wav").read_bytes() == content
+        assert scheduled == [created.id]
+    finally:
+        await client.close()
+        import_store.close()
+
+
 @pytest.mark.asyncio
 async def test_meeting_import_collection_recovers_jobs_without_exposing_staging_details(monkeypatch, tmp_path):
     monkeypatch.delenv("SCRIBER_SESSION_TOKEN", raising=False)
@@ -4891,6 +4930,9 @@ class _EnrollmentController:
     def _resume_idle_mic_prewarm_after_capture(self):
         self.prewarm_paused = False
 
+    def _invalidate_settings_cache(self):
+        pass
+
 
 @pytest.mark.asyncio
 async def test_voice_enrollment_api_gates_opt_in_model_and_active_audio(monkeypatch):
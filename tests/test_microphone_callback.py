@@ -60,6 +60,39 @@ async def test_audio_callback_throttles_visualizer_work_to_sixty_hz(monkeypatch)
     assert mic._queue.qsize() == 4
 
 
+@pytest.mark.skipif(not microphone.HAS_SOUNDDEVICE, reason="sounddevice unavailable")
+@pytest.mark.asyncio
+async def test_audio_callback_meters_rms_in_reused_scratch_buffer(monkeypatch):
+    mic = microphone.MicrophoneInput(sample_rate=16000, channels=1, block_size=512)
+    times = iter([100.0, 100.1, 100.2, 100.3, 100.4, 100.5])
+
+    monkeypatch.setattr(
+        microphone,
+        "time",
+        types.SimpleNamespace(
+            monotonic=lambda: next(times),
+            perf_counter_ns=lambda: 1,
+        ),
+    )
+
+    mic.on_audio_level = lambda _level: None
+    mic._running = True
+    mic._accepting_audio = True
+    mic._loop = asyncio.get_running_loop()
+
+    mic._audio_callback(np.full((512, 1), 1000, dtype=np.int16), 512, None, None)
+    scratch = mic._audio_level_scratch
+    first_rms = mic._last_observed_rms
+    mic._audio_callback(np.full((256, 1), -2000, dtype=np.int16), 256, None, None)
+    mic._running = False
+    await asyncio.sleep(0)
+
+    assert first_rms == pytest.approx(1000 / 32768.0, rel=1e-5)
+    assert mic._last_observed_rms == pytest.approx(2000 / 32768.0, rel=1e-5)
+    assert mic._audio_level_scratch is scratch
+    assert scratch.size == 512
+
+
 @pytest.mark.skipif(not microphone.HAS_SOUNDDEVICE, reason="sounddevice unavailable")
 @pytest.mark.asyncio
 async def test_microphone_watchdog_recovers_failed_queue_consumer(monkeypatch):
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import sys
 import types
 
@@ -446,6 +447,82 @@ async def test_get_settings_falls_back_to_first_available_when_favorite_missing(
         ctl.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_get_settings_snapshot_is_reused_until_devices_change(monkeypatch: pytest.MonkeyPatch):
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    try:
+        monkeypatch.setattr(Config, "MIC_DEVICE", "Built-in Mic, MME", raising=False)
+        monkeypatch.setattr(Config, "FAVORITE_MIC", "", raising=False)
+        devices = [
+            {"deviceId": "default", "label": "Default"},
+            {"deviceId": "Built-in Mic, MME", "label": "Built-in Mic"},
+        ]
+        calls: list[int] = []
+
+        def list_microphones() -> list[dict[str, str]]:
+            calls.append(1)
+            return [dict(device) for device in devices]
+
+        monkeypatch.setattr(ctl, "list_microphones", list_microphones)
+        monkeypatch.setattr(ctl, "_device_monitor_enabled", True)
+
+        first = ctl.get_settings()
+        assert ctl.get_settings() is first
+        assert json.loads(ctl.get_settings_json())["micDevice"] == "Built-in Mic, MME"
+        assert len(calls) == 1
+
+        devices[1:] = [{"deviceId": "Dock Mic, MME", "label": "Dock Mic"}]
+        await ctl._handle_devices_changed(list(devices))
+
+        assert json.loads(ctl.get_settings_json())["micDevice"] == "Dock Mic, MME"
+        assert len(calls) == 2
+
+        monkeypatch.setattr(ctl, "_device_monitor_enabled", False)
+        ctl._invalidate_settings_cache()
+        ctl.get_settings()
+        ctl.get_settings()
+        assert len(calls) == 4
+    finally:
+        ctl.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_favorite_mic_restore_is_not_hidden_by_a_concurrent_settings_build(monkeypatch: pytest.MonkeyPatch):
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    try:
+        monkeypatch.setenv("SCRIBER_MIC_DEVICE", "Built-in Mic, MME")
+        monkeypatch.setattr(Config, "MIC_DEVICE", "Built-in Mic, MME", raising=False)
+        monkeypatch.setattr(Config, "FAVORITE_MIC", "Dock Mic, MME", raising=False)
+        devices = [
+            {"deviceId": "default", "label": "Default"},
+            {"deviceId": "Built-in Mic, MME", "label": "Built-in Mic"},
+        ]
+        monkeypatch.setattr(ctl, "list_microphones", lambda: [dict(device) for device in devices])
+        monkeypatch.setattr(ctl, "_device_monitor_enabled", True)
+        assert ctl.get_settings()["micDevice"] == "Built-in Mic, MME"
+
+        set_mic_device = Config.set_mic_device
+        raced: list[dict] = []
+
+        def set_mic_device_after_racing_build(device: str) -> None:
+            # A worker-thread settings build lands just before the restore writes Config.
+            raced.append(ctl.get_settings())
+            set_mic_device(device)
+
+        monkeypatch.setattr(Config, "set_mic_device", set_mic_device_after_racing_build)
+        devices.append({"deviceId": "Dock Mic, MME", "label": "Dock Mic"})
+        await ctl._handle_devices_changed(list(devices))
+
+        assert Config.MIC_DEVICE == "Dock Mic, MME"
+        assert len(raced) == 1
+        assert ctl.get_settings() is not raced[0]
+        assert json.loads(ctl.get_settings_json())["micDevice"] == "Dock Mic, MME"
+    finally:
+        ctl.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_list_microphones_dedupes_hostapi_variants(monkeypatch: pytest.MonkeyPatch):
     loop = asyncio.get_running_loop()
@@ -470,6 +547,42 @@ async def test_list_microphones_dedupes_hostapi_variants(monkeypatch: pytest.Mon
         ctl.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_direct_microphone_listing_is_reused_until_refresh(monkeypatch: pytest.MonkeyPatch):
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    try:
+        fake_sd = _install_fake_sounddevice(
+            monkeypatch,
+            devices=[{"name": "Dock Mic, MME", "max_input_channels": 1, "hostapi": 0}],
+            hostapis=[{"name": "MME"}],
+            default_input=0,
+        )
+        enumerations: list[int] = []
+        query_devices = fake_sd.query_devices
+
+        def counting_query_devices(device=None, kind=None):
+            if device is None and kind is None:
+                enumerations.append(1)
+            return query_devices(device=device, kind=kind)
+
+        fake_sd.query_devices = counting_query_devices
+
+        first = ctl.list_microphones()
+        first.append({"deviceId": "caller-owned", "label": "Caller"})
+        second = ctl.list_microphones()
+
+        assert [d["deviceId"] for d in second] == ["default", "Dock Mic, MME"]
+        assert len(enumerations) == 1
+
+        ctl.request_microphone_refresh()
+        ctl.list_microphones()
+
+        assert len(enumerations) == 2
+    finally:
+        ctl.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_list_microphones_trusts_default_only_monitor_cache(monkeypatch: pytest.MonkeyPatch):
     loop = asyncio.get_running_loop()
@@ -234,3 +234,21 @@ def test_overlay_ipc_deadlines_cover_bounded_ui_dispatch(monkeypatch):
     assert deadlines["overlayHide"] == deadlines["overlayPrepare"]
     assert deadlines["overlayStatus"] < deadlines["overlayPrepare"]
     assert deadlines["overlayAudioLevel"] < deadlines["overlayStatus"]
+
+
+def test_overlay_audio_pump_keeps_peak_of_coalesced_levels(monkeypatch):
+    class AliveWorker:
+        def is_alive(self):
+            return True
+
+    pump = native_overlay._OverlayAudioLevelPump()
+    monkeypatch.setattr(pump, "_worker", AliveWorker())
+
+    for level in (0.1, 0.6, 0.2, 1.5):
+        pump.publish(level)
+    assert pump._take_pending() == 1.0
+
+    pump.publish(0.3)
+    pump.publish(0.05)
+    assert pump._take_pending() == 0.3
+    assert pump._take_pending() is None
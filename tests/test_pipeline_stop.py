@@ -15,6 +15,7 @@ from pipecat.frames.frames import (
     InputAudioRawFrame,
     StartFrame,
     TranscriptionFrame,
+    UserAudioRawFrame,
     VADUserStartedSpeakingFrame,
     VADUserStoppedSpeakingFrame,
 )
@@ -382,6 +383,65 @@ def test_analyzer_warmup_instances_are_claimed_once_per_session(monkeypatch):
     assert first_smart_turn is not second_smart_turn
 
 
+def test_analyzer_warmup_builds_nothing_while_vad_segmentation_is_off(monkeypatch):
+    created: list[str] = []
+
+    class _ImmediateThread:
+        def __init__(self, *, target, name, daemon):
+            self.target = target
+
+        def start(self):
+            self.target()
+
+    _AnalyzerCache.clear_cache()
+    monkeypatch.setattr(Config, "SEGMENT_SPEECH_WITH_VAD", False)
+    monkeypatch.setattr(pipeline_module, "HAS_SILERO_VAD", True)
+    monkeypatch.setattr(pipeline_module, "HAS_SMART_TURN", True)
+    monkeypatch.setattr(pipeline_module, "SileroVADAnalyzer", lambda: created.append("vad"))
+    monkeypatch.setattr(pipeline_module, "LocalSmartTurnAnalyzerV3", lambda: created.append("smart_turn"))
+    monkeypatch.setattr(pipeline_module.threading, "Thread", _ImmediateThread)
+
+    try:
+        _AnalyzerCache.prewarm()
+        assert _AnalyzerCache.request_background_replenish() is False
+    finally:
+        _AnalyzerCache.clear_cache()
+
+    assert created == []
+
+
+def test_vad_sub_window_frames_skip_the_analyzer_executor():
+    dispatched: list[bytes] = []
+
+    class _WindowedVadAnalyzer:
+        def __init__(self):
+            self._vad_buffer = b""
+            self._vad_state = "quiet"
+
+        async def analyze_audio(self, buffer: bytes):
+            dispatched.append(self._vad_buffer + buffer)
+            self._vad_buffer = b""
+            self._vad_state = "speaking"
+            return self._vad_state
+
+    analyzer = _WindowedVadAnalyzer()
+    pipeline_module._coalesce_sub_window_vad_audio(analyzer)
+
+    async def run():
+        # Before StartFrame sets the window size every frame reaches Pipecat.
+        assert await analyzer.analyze_audio(b"\x00" * 4) == "speaking"
+        analyzer._vad_frames_num_bytes = 1024
+        analyzer._vad_state = "quiet"
+        states = [await analyzer.analyze_audio(b"\x01" * 256) for _ in range(4)]
+        return states
+
+    states = asyncio.run(run())
+
+    assert states == ["quiet", "quiet", "quiet", "speaking"]
+    assert dispatched == [b"\x00" * 4, b"\x01" * 1024]
+    assert analyzer._vad_buffer == b""
+
+
 def test_analyzer_warmup_refills_with_new_unclaimed_instances(monkeypatch):
     created_vad: list[object] = []
     created_smart_turn: list[object] = []
@@ -2791,6 +2851,29 @@ async def test_pipecat_vad_observer_counts_audio_frames():
     assert len(pushed) == 2
 
 
+@pytest.mark.asyncio
+async def test_pipecat_vad_observer_type_dispatch_keeps_subclass_semantics():
+    observer = PipecatVadSpeechObserver(enabled=True)
+    observer.push_frame = AsyncMock()
+
+    for _ in range(2):
+        await observer.process_frame(
+            UserAudioRawFrame(audio=b"\0" * 320, sample_rate=16000, num_channels=1),
+            FrameDirection.DOWNSTREAM,
+        )
+    await observer.process_frame(VADUserStartedSpeakingFrame(), FrameDirection.DOWNSTREAM)
+    await observer.process_frame(VADUserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM)
+    await observer.process_frame(EndFrame(), FrameDirection.DOWNSTREAM)
+
+    snapshot = observer.snapshot()
+
+    assert snapshot["audioFrameCount"] == 2
+    assert snapshot["speechStartedCount"] == 1
+    assert snapshot["speechStoppedCount"] == 1
+    assert PipecatVadSpeechObserver._frame_kinds[UserAudioRawFrame] == "audio"
+    assert PipecatVadSpeechObserver._frame_kinds[EndFrame] is None
+
+
 @pytest.mark.asyncio
 async def test_pipecat_vad_observer_ignores_upstream_turn_broadcast_duplicates():
     observer = PipecatVadSpeechObserver(enabled=True)
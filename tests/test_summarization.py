@@ -1,6 +1,8 @@
 import inspect
 import json
+import threading
 import traceback
+import types
 
 import pytest
 
@@ -477,6 +479,30 @@ async def test_summarize_text_uses_duration_based_boost(monkeypatch: pytest.Monk
     assert captured_tokens[1] > captured_tokens[0]
 
 
+@pytest.mark.asyncio
+async def test_summarize_text_reuses_cached_summary_only_when_requested(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+
+    async def _fake_openai(prompt: str, _model: str, _max_output_tokens: int) -> str:
+        calls.append(prompt)
+        return _structured_summary(f"call {len(calls)}")
+
+    monkeypatch.setattr(summarization, "_summarize_openai", _fake_openai)
+    monkeypatch.setattr(summarization, "_summary_cache", summarization.OrderedDict())
+    text = _words(300)
+
+    first = await summarization.summarize_text(text, model="gpt-5-mini", reuse_cached=True)
+    reused = await summarization.summarize_text(text, model="gpt-5-mini", reuse_cached=True)
+    regenerated = await summarization.summarize_text(text, model="gpt-5-mini")
+    other_model = await summarization.summarize_text(text, model="gpt-5-nano", reuse_cached=True)
+
+    assert first == reused == _structured_summary("call 1")
+    assert regenerated == _structured_summary("call 2")
+    assert other_model == _structured_summary("call 3")
+    assert len(calls) == 3
+    assert await summarization.summarize_text(text, model="gpt-5-mini", reuse_cached=True) == regenerated
+
+
 @pytest.mark.asyncio
 async def test_summarize_text_projects_markdown_model_drift_to_html(monkeypatch: pytest.MonkeyPatch):
     async def _fake_gemini(_prompt: str, _model: str, _max_output_tokens: int) -> str:
@@ -1089,3 +1115,32 @@ async def test_summarize_gemini_discards_partial_after_repeated_max_tokens(monke
 
     with pytest.raises(RuntimeError, match="MAX_TOKENS"):
         await summarization._summarize_gemini("prompt", "gemini-flash-latest", 3000)
+
+
+@pytest.mark.asyncio
+async def test_summarize_openai_imports_sdk_off_the_event_loop(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(summarization.Config, "OPENAI_API_KEY", "test-key")
+    import_threads: list[threading.Thread] = []
+
+    class _Completions:
+        async def create(self, **_kwargs):
+            message = types.SimpleNamespace(content="zusammenfassung")
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    class _AsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.chat = types.SimpleNamespace(completions=_Completions())
+
+    fake_openai = types.SimpleNamespace(AsyncOpenAI=_AsyncOpenAI, APIError=RuntimeError)
+
+    def _import_module(name: str):
+        assert name == "openai"
+        import_threads.append(threading.current_thread())
+        return fake_openai
+
+    monkeypatch.setattr(summarization.importlib, "import_module", _import_module)
+
+    out = await summarization._summarize_openai("prompt", "gpt-4o-mini", 512)
+
+    assert out == "zusammenfassung"
+    assert import_threads and import_threads[0] is not threading.main_thread()
@@ -47,8 +47,8 @@ async def test_summary_retry_uses_durable_transcript_and_rejects_duplicate_reque
     release = asyncio.Event()
     captured: dict[str, str] = {}
 
-    async def summarize(content: str, model: str, *, duration: str | None = None) -> str:
-        captured.update(content=content, model=model, duration=duration or "")
+    async def summarize(content: str, model: str, *, duration: str | None = None, reuse_cached: bool = False) -> str:
+        captured.update(content=content, model=model, duration=duration or "", reuse_cached=str(reuse_cached))
         started.set()
         await release.wait()
         return "<section><h2>Summary</h2><p>Recovered from the saved transcript.</p></section>"
@@ -86,6 +86,8 @@ async def test_summary_retry_uses_durable_transcript_and_rejects_duplicate_reque
     }
     assert captured["content"] == record.content
     assert captured["duration"] == "08:49"
+    # The record already carries a summary, so the retry is a regenerate and bypasses the cache.
+    assert captured["reuse_cached"] == "False"
     assert record.status == "completed"
     assert record.summary_status == "completed"
     assert record.summary_error == ""
@@ -138,3 +140,52 @@ async def test_summary_retry_failure_keeps_transcript_completed_and_persists_err
     reasons = [call.kwargs["reason"] for call in broadcast.await_args_list]
     assert reasons == ["summary_pending", "summary_failed"]
     assert save_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_returns_completed_summary_without_model_call_unless_forced(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    monkeypatch.delenv("SCRIBER_SESSION_TOKEN", raising=False)
+    controller = ScriberWebController(
+        asyncio.get_running_loop(),
+        job_store=JobStore(db_path=tmp_path / "jobs.db"),
+    )
+    record = _failed_summary_record()
+    record.summary = "<section><h2>Done</h2><p>Existing summary.</p></section>"
+    record.summary_format = "html"
+    record.summary_status = "completed"
+    record.summary_error = ""
+    controller._add_to_history(record)
+    calls: list[bool] = []
+
+    async def summarize(_content: str, _model: str, *, duration: str | None = None, reuse_cached: bool = False) -> str:
+        calls.append(reuse_cached)
+        return "<section><h2>Fresh</h2><p>Regenerated summary.</p></section>"
+
+    monkeypatch.setattr("src.summarization.summarize_text", summarize)
+    monkeypatch.setattr(controller, "_save_transcript_summary_state_async", AsyncMock())
+    monkeypatch.setattr(controller, "_broadcast_history_updated", AsyncMock())
+
+    client = TestClient(TestServer(web_api.create_app(controller)))
+    await client.start_server()
+    try:
+        existing = await client.post(f"/api/transcripts/{record.id}/summarize")
+        existing_payload = await existing.json()
+        forced = await client.post(f"/api/transcripts/{record.id}/summarize?force=1")
+        forced_payload = await forced.json()
+    finally:
+        await client.close()
+
+    assert existing.status == 200
+    assert existing_payload == {
+        "success": True,
+        "summary": "<section><h2>Done</h2><p>Existing summary.</p></section>",
+        "summaryFormat": "html",
+        "cached": True,
+    }
+    assert forced.status == 200
+    assert forced_payload["summary"] == "<section><h2>Fresh</h2><p>Regenerated summary.</p></section>"
+    assert calls == [False]
+    assert record.summary == forced_payload["summary"]
@@ -107,8 +107,8 @@ async def test_assemblyai_live_mic_start_stop_smoke(monkeypatch):
     assert ctl._active_provider is None
     assert ctl._session_id is None
     assert ctl._history
-    assert ctl._history[-1].status == "completed"
-    assert "Live async final transcript" in ctl._history[-1].content
+    assert next(reversed(ctl._history.values())).status == "completed"
+    assert "Live async final transcript" in next(reversed(ctl._history.values())).content
 
 
 @pytest.mark.asyncio
@@ -100,6 +100,31 @@ async def test_hot_path_silent_audio_frame_does_not_mark_audible_audio(tmp_path)
     assert "activation_received_to_first_audible_audio_frame_ms" not in rows[0].segments
 
 
+@pytest.mark.asyncio
+async def test_audio_level_stops_marking_hot_path_after_first_audible_frame(tmp_path):
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop, latency_metrics_store=LatencyMetricsStore(db_path=tmp_path / "metrics.db"))
+    session_id = "session-audio-marker-short-circuit"
+    ctl._session_id = session_id
+    ctl._start_hot_path_tracer(session_id)
+    marked: list[str] = []
+    real_mark = ctl._mark_hot_path
+
+    def record_mark(sid, marker, **kwargs):
+        marked.append(marker)
+        real_mark(sid, marker, **kwargs)
+
+    ctl._mark_hot_path = record_mark
+
+    ctl._on_audio_level(0.0, session_id=session_id)
+    ctl._on_audio_level(0.5, session_id=session_id)
+    ctl._on_audio_level(0.5, session_id=session_id)
+    ctl._on_audio_level(0.0, session_id=session_id)
+
+    assert marked == ["first_audio_frame", "first_audio_frame", "first_audible_audio_frame"]
+    assert ctl._hot_path_has_mark(session_id, "first_audible_audio_frame")
+
+
 @pytest.mark.asyncio
 async def test_hot_path_partial_report_can_be_persisted_without_text_injection(tmp_path):
     loop = asyncio.get_running_loop()
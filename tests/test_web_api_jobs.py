@@ -1,6 +1,7 @@
 import asyncio
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, call, patch
@@ -104,7 +105,7 @@ async def test_file_start_does_not_publish_or_schedule_an_unpersisted_job(monkey
     ):
         await ctl.start_file_transcription(sample_file, "sample.wav")
 
-    assert ctl._history == []
+    assert not ctl._history
     broadcast_mock.assert_not_awaited()
     schedule_mock.assert_not_called()
 
@@ -128,7 +129,7 @@ async def test_youtube_start_does_not_publish_or_schedule_an_unpersisted_job(mon
     ):
         await ctl.start_youtube_transcription({"url": "https://www.youtube.com/watch?v=J_RxOz_ddgs"})
 
-    assert ctl._history == []
+    assert not ctl._history
     broadcast_mock.assert_not_awaited()
     schedule_mock.assert_not_called()
 
@@ -334,7 +335,7 @@ async def test_start_youtube_transcription_rejects_non_youtube_url(tmp_path):
     with pytest.raises(ValueError, match="Unsupported YouTube URL"):
         await ctl.start_youtube_transcription({"url": "http://127.0.0.1:8765/api/runtime/support-bundle"})
 
-    assert ctl._history == []
+    assert not ctl._history
     assert ctl._running_tasks == {}
 
 
@@ -515,6 +516,65 @@ async def test_history_update_merges_pending_change_into_immediate_send() -> Non
     assert "transcriptId" not in payload
 
 
+@pytest.mark.asyncio
+async def test_history_touch_burst_merges_without_spawning_broadcast_tasks() -> None:
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    ctl._history_broadcast_interval = 10.0
+    ctl._history_broadcast_last = time.monotonic()
+    rec = TranscriptRecord(
+        id="burst-update",
+        title="Burst",
+        date="Today",
+        duration="00:01",
+        status="processing",
+        type="file",
+        language="de",
+    )
+
+    with patch.object(ctl, "_broadcast_history_updated", new=AsyncMock()) as broadcast_mock:
+        for _ in range(5):
+            ctl._queue_history_update(rec, "progress")
+        await asyncio.sleep(0)
+
+        broadcast_mock.assert_not_called()
+        assert ctl._history_broadcast_pending_payload["transcriptId"] == "burst-update"
+        assert ctl._history_broadcast_handle is not None
+
+        ctl._history_broadcast_handle.cancel()
+        ctl._history_broadcast_handle = None
+        ctl._history_broadcast_last = time.monotonic() - 20.0
+        ctl._queue_history_update(rec, "progress")
+        await asyncio.sleep(0)
+
+    broadcast_mock.assert_awaited_once_with(record=rec, reason="progress")
+
+
+@pytest.mark.asyncio
+async def test_file_pipeline_callbacks_update_record_and_queue_history() -> None:
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    rec = TranscriptRecord(
+        id="callback-update",
+        title="Callbacks",
+        date="Today",
+        duration="00:01",
+        status="completed",
+        type="youtube",
+        language="de",
+    )
+
+    with patch.object(ctl, "_queue_history_update") as queue_mock:
+        ctl._on_file_pipeline_progress(rec, "Uploading audio...", require_processing=True)
+        rec.status = "processing"
+        ctl._on_file_pipeline_progress(rec, "Processing transcription...", require_processing=True)
+        ctl._on_file_pipeline_transcription(rec, "YouTube", "interim", False)
+        ctl._on_file_pipeline_transcription(rec, "YouTube", "final words", True)
+        await asyncio.sleep(0)
+
+    assert rec.step == "Processing transcription..."
+    assert rec.content_text() == "final words"
+    queue_mock.assert_called_once_with(rec, "progress")
+
+
 @pytest.mark.asyncio
 async def test_shutdown_cancellation_keeps_background_job_resumable(tmp_path):
     store = JobStore(db_path=tmp_path / "jobs.db")
@@ -717,12 +777,14 @@ async def test_transcript_search_does_not_scan_completed_history(monkeypatch):
         language="auto",
     )
 
-    class _NoHistoryScan(list):
+    class _NoHistoryScan(OrderedDict):
         def __iter__(self):
             raise AssertionError("search scanned the complete history")
 
-    ctl._history = _NoHistoryScan()
-    ctl._history_by_id = {active.id: active}
+        def values(self):
+            raise AssertionError("search scanned the complete history")
+
+    ctl._history = _NoHistoryScan({active.id: active})
     ctl._running_tasks = {active.id: object()}
     monkeypatch.setattr(web_api.db, "existing_transcript_ids", lambda _ids: set())
     monkeypatch.setattr(
@@ -913,8 +975,7 @@ async def test_startup_history_does_not_materialize_all_database_metadata(monkey
 
     ctl._load_transcripts_from_db()
 
-    assert ctl._history == []
-    assert ctl._history_by_id == {}
+    assert not ctl._history
 
 
 @pytest.mark.asyncio
@@ -1330,9 +1391,37 @@ async def test_runtime_history_cache_is_bounded_and_idempotent():
     ctl._add_to_history(newest)
 
     assert len(ctl._history) == 25
-    assert sum(item.id == newest.id for item in ctl._history) == 1
-    assert ctl._history_by_id[newest.id] is newest
-    assert records[0].id not in ctl._history_by_id
+    assert next(iter(ctl._history.values())) is newest
+    assert ctl._history[newest.id] is newest
+    assert records[0].id not in ctl._history
+
+
+@pytest.mark.asyncio
+async def test_runtime_history_replaces_reloaded_record_and_removes_by_identity():
+    ctl = ScriberWebController(asyncio.get_running_loop())
+
+    def _record(record_id: str) -> TranscriptRecord:
+        return TranscriptRecord(
+            id=record_id,
+            title="Same",
+            date="Today",
+            duration="00:01",
+            status="completed",
+            type="mic",
+            language="auto",
+        )
+
+    first, second, reloaded_first = _record("a"), _record("b"), _record("a")
+    ctl._add_to_history(first)
+    ctl._add_to_history(second)
+    ctl._add_to_history(reloaded_first)
+
+    assert list(ctl._history.values()) == [reloaded_first, second]
+    assert ctl._history["a"] is reloaded_first
+
+    assert ctl._remove_from_history("a") is reloaded_first
+    assert list(ctl._history) == ["b"]
+    assert ctl._remove_from_history("a") is None
 
 
 @pytest.mark.asyncio
@@ -2632,3 +2721,21 @@ async def test_file_scheduler_does_not_double_count_handled_provider_failure(
     assert persisted is not None
     assert persisted.status == JobStatus.FAILED
     provider_failure.assert_called_once_with("soniox", "provider failed")
+
+
+@pytest.mark.asyncio
+async def test_resumed_record_without_created_at_uses_one_resume_timestamp(tmp_path):
+    store = JobStore(db_path=tmp_path / "jobs.db")
+    ctl = ScriberWebController(asyncio.get_running_loop(), job_store=store)
+    job = web_api.JobRecord(
+        id="job-no-created",
+        transcript_id="resume-no-created",
+        job_type=web_api.JobType.FILE,
+        status=JobStatus.QUEUED,
+        payload={"path": str(tmp_path / "sample.wav"), "title": "Sample"},
+        created_at="",
+    )
+
+    rec = ctl._build_processing_record_from_job(job)
+
+    assert rec.created_at == rec.updated_at
@@ -7,6 +7,7 @@ import sys
 import threading
 import time
 import types
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -617,6 +618,39 @@ async def test_run_server_cancellation_restores_signals_and_cleans_up(monkeypatc
         assert (sig_value, previous_handler) in signal_calls
 
 
+@pytest.mark.asyncio
+async def test_run_server_stops_from_loop_signal_handler(monkeypatch):
+    controller = _RunServerControllerStub()
+    loop = asyncio.get_running_loop()
+    installed: dict[int, object] = {}
+    removed: list[int] = []
+    signal_calls: list[tuple[int, object]] = []
+
+    monkeypatch.setattr(web_api, "ScriberWebController", lambda _loop: controller)
+    monkeypatch.setattr(web_api, "_should_force_process_exit_after_shutdown", lambda: False)
+    monkeypatch.setattr(web_api, "_background_init", AsyncMock())
+    monkeypatch.setattr(web_api.signal, "getsignal", lambda _sig: "previous")
+    monkeypatch.setattr(web_api.signal, "signal", lambda sig, handler: signal_calls.append((int(sig), handler)))
+    monkeypatch.setattr(loop, "add_signal_handler", lambda sig, callback: installed.__setitem__(int(sig), callback))
+    monkeypatch.setattr(loop, "remove_signal_handler", lambda sig: removed.append(int(sig)))
+    monkeypatch.setattr(web_api.web.TCPSite, "start", AsyncMock())
+    monkeypatch.setattr(web_api.web.TCPSite, "stop", AsyncMock())
+
+    task = asyncio.create_task(web_api.run_server("127.0.0.1", 0))
+    for _ in range(100):
+        if int(web_api.signal.SIGTERM) in installed:
+            break
+        await asyncio.sleep(0.01)
+    installed[int(web_api.signal.SIGTERM)]()
+    await asyncio.wait_for(task, timeout=2)
+
+    assert set(installed) == {int(web_api.signal.SIGINT), int(web_api.signal.SIGTERM)}
+    assert sorted(removed) == sorted(installed)
+    # Only the previous handlers are written back; nothing was installed through signal.signal.
+    assert sorted(signal_calls) == sorted((sig, "previous") for sig in installed)
+    assert controller.events[-1] == "close_persistence"
+
+
 def _install_fake_sounddevice_module(
     monkeypatch: pytest.MonkeyPatch,
     *,
@@ -681,6 +715,136 @@ def test_transcript_record_buffers_final_segments_until_content_read():
     assert rec._pending_content_segments == []
 
 
+def test_transcript_record_folds_new_segments_after_each_read():
+    rec = _make_record("incremental-session")
+
+    rec.append_final_text("first")
+    rec.append_final_text("second")
+    assert rec.content_text() == "first\n\nsecond"
+
+    rec.append_final_text("second")
+    rec.append_final_text("third")
+    rec.append_final_text("fourth")
+
+    assert rec.content_text() == "first\n\nsecond\n\nthird\n\nfourth"
+    assert rec._pending_content_segments == []
+
+
+def test_transcript_record_list_payload_is_memoized_until_a_public_field_changes():
+    rec = _make_record("public-memo")
+    rec.append_final_text("hello there")
+
+    first = rec.to_public(include_content=False)
+    record_cls = type(rec)
+    with patch.object(
+        record_cls, "_build_public", autospec=True, side_effect=record_cls._build_public
+    ) as build_mock:
+        second = rec.to_public(include_content=False)
+        build_mock.assert_not_called()
+
+        assert second == first
+        assert second is not first
+        second["title"] = "caller-owned"
+        assert rec.to_public(include_content=False)["title"] == "Live Mic"
+
+        rec.step = "Transcribing..."
+        assert rec.to_public(include_content=False)["step"] == "Transcribing..."
+        rec.append_final_text("more words")
+        assert rec.to_public(include_content=False)["preview"].startswith("hello there more")
+        assert build_mock.call_count == 2
+
+
+def test_transcript_record_uses_slots():
+    rec = _make_record("slots")
+
+    assert not hasattr(rec, "__dict__")
+    with pytest.raises(AttributeError):
+        rec.not_a_field = "x"
+
+
+def test_transcript_record_public_date_parses_created_at_once():
+    rec = _make_record("date-cache")
+    rec.created_at = "2020-01-02T03:04:05"
+
+    assert rec.to_public(include_content=False)["date"] == "2020-01-02"
+    cached = rec._created_at_parsed
+    assert rec.to_public(include_content=False)["date"] == "2020-01-02"
+    assert rec._created_at_parsed is cached
+
+    rec.created_at = "2021-05-06T07:08:09Z"
+    assert rec.to_public(include_content=False)["date"] == "2021-05-06"
+
+    rec.created_at = "not-a-date"
+    rec.date = "Stored label"
+    assert rec.to_public(include_content=False)["date"] == "Stored label"
+
+
+def test_date_labels_reuse_today_within_a_second(monkeypatch):
+    real_datetime = web_api.datetime
+    clock = [50.0]
+    now_calls: list[object] = []
+
+    class _FixedDatetime:
+        @staticmethod
+        def now(tz=None):
+            now_calls.append(tz)
+            return real_datetime(2030, 6, 15, 12, 0, tzinfo=tz)
+
+    monkeypatch.setattr(web_api, "datetime", _FixedDatetime)
+    monkeypatch.setattr(web_api.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(web_api, "_date_label_today_cache", (float("-inf"), None, None, None))
+
+    assert web_api._format_date_label(real_datetime(2030, 6, 15, 9, 5, 30)) == "Today, 09:05"
+    assert web_api._format_date_label(real_datetime(2030, 6, 14, 23, 59)) == "Yesterday"
+    assert web_api._format_date_label(real_datetime(2030, 6, 1, 8, 0)) == "2030-06-01"
+    assert now_calls == [None]
+
+    aware = real_datetime(2030, 6, 15, 7, 45, tzinfo=web_api.UTC)
+    assert web_api._format_date_label(aware) == "Today, 07:45"
+    assert now_calls == [None, web_api.UTC]
+
+    clock[0] += web_api._DATE_LABEL_TODAY_REUSE_SECONDS
+    web_api._format_date_label(aware)
+    assert now_calls == [None, web_api.UTC, web_api.UTC]
+
+
+def test_transcript_record_fragment_burst_reuses_timestamp(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(web_api.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(web_api, "_now_iso_cache", (float("-inf"), ""))
+    rec = _make_record("timestamp-burst")
+
+    rec.append_final_text("first")
+    first_stamp = rec.updated_at
+    clock[0] += web_api._NOW_ISO_REUSE_SECONDS / 2
+    rec.append_final_text("second")
+
+    assert rec.updated_at == first_stamp
+
+    clock[0] += web_api._NOW_ISO_REUSE_SECONDS
+    later = web_api.datetime(2030, 1, 2, 3, 4, 5)
+    monkeypatch.setattr(web_api, "datetime", types.SimpleNamespace(now=lambda: later))
+    rec.append_final_text("third")
+
+    assert rec.updated_at == "2030-01-02T03:04:05"
+
+
+def test_transcript_record_summary_transitions_do_not_reuse_burst_timestamp(monkeypatch):
+    stale = "2000-01-01T00:00:00"
+    monkeypatch.setattr(web_api, "_now_iso_cache", (time.monotonic(), stale))
+    rec = _make_record("summary-stamp")
+
+    for transition in (
+        rec.mark_summary_pending,
+        lambda: rec.mark_summary_completed("<p>done</p>"),
+        lambda: rec.mark_summary_failed("boom"),
+    ):
+        transition()
+        assert rec.summary_updated_at == rec.updated_at
+        assert rec.updated_at != stale
+        assert rec.updated_at >= rec.created_at
+
+
 def test_audio_diagnostics_silence_requires_no_pipecat_vad_speech():
     quiet = {
         "audioLevelSampleCount": 8,
@@ -1206,6 +1370,182 @@ async def test_update_settings_debounces_env_persistence(monkeypatch, tmp_path):
     ctl.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_update_settings_skips_side_effects_when_payload_matches_current(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    monkeypatch.setenv("SCRIBER_SETTINGS_PERSIST_DEBOUNCE_SEC", "60")
+    monkeypatch.setattr(web_api.Config, "LANGUAGE", "en")
+    persist_mock = MagicMock()
+    monkeypatch.setattr(web_api.Config, "persist_settings_files", persist_mock)
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    broadcast = AsyncMock()
+    monkeypatch.setattr(ctl, "broadcast", broadcast)
+    register_hotkeys = MagicMock()
+    monkeypatch.setattr(ctl, "register_hotkeys", register_hotkeys)
+    # Controller init may already schedule a settings-file migration; watch the update path only.
+    schedule_persist = MagicMock(wraps=ctl._schedule_settings_persist)
+    monkeypatch.setattr(ctl, "_schedule_settings_persist", schedule_persist)
+    # The no-op check reads the cached snapshot, which is kept only with the device monitor on.
+    monkeypatch.setattr(ctl, "_device_monitor_enabled", True)
+    monkeypatch.setattr(ctl, "list_microphones", lambda: [{"deviceId": "default"}])
+    current = ctl.get_settings()
+
+    settings = await ctl.update_settings(
+        {"language": "en", "hotkey": current["hotkey"], "apiKeys": {"openai": current["apiKeys"]["openai"]}}
+    )
+
+    assert settings is current
+    broadcast.assert_not_awaited()
+    register_hotkeys.assert_not_called()
+    schedule_persist.assert_not_called()
+
+    await ctl.update_settings({"language": "de"})
+
+    broadcast.assert_awaited_once_with({"type": "settings_updated"})
+    schedule_persist.assert_called_once_with()
+    ctl.shutdown()
+    assert persist_mock.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_settings_rejects_bad_retention_before_applying_other_fields(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    monkeypatch.setattr(web_api.Config, "POST_PROCESSING_PROMPT", "keep me")
+    monkeypatch.setattr(web_api.Config, "YOUTUBE_PREFER_CAPTIONS", False)
+    monkeypatch.setattr(web_api.Config, "persist_settings_files", MagicMock())
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    schedule_persist = MagicMock()
+    monkeypatch.setattr(ctl, "_schedule_settings_persist", schedule_persist)
+
+    with pytest.raises(ValueError, match="whole number of days"):
+        await ctl.update_settings(
+            {
+                "postProcessingPrompt": "changed",
+                "youtubePreferCaptions": True,
+                "meetingAudioRetentionDays": "soon",
+            }
+        )
+
+    assert web_api.Config.POST_PROCESSING_PROMPT == "keep me"
+    assert web_api.Config.YOUTUBE_PREFER_CAPTIONS is False
+    schedule_persist.assert_not_called()
+    ctl.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_update_settings_persists_explicit_pick_of_resolved_mic(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    monkeypatch.setenv("SCRIBER_SETTINGS_PERSIST_DEBOUNCE_SEC", "60")
+    monkeypatch.setenv("SCRIBER_MIC_DEVICE", "default")
+    monkeypatch.setenv("SCRIBER_FAVORITE_MIC", "")
+    monkeypatch.setattr(web_api.Config, "MIC_DEVICE", "default")
+    monkeypatch.setattr(web_api.Config, "FAVORITE_MIC", "")
+    monkeypatch.setattr(web_api.Config, "persist_settings_files", MagicMock())
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    monkeypatch.setattr(ctl, "list_microphones", lambda: [{"deviceId": "default"}, {"deviceId": "USB Mic"}])
+    monkeypatch.setattr(ctl, "_device_monitor_enabled", True)
+    monkeypatch.setattr(ctl, "broadcast", AsyncMock())
+    schedule_persist = MagicMock(wraps=ctl._schedule_settings_persist)
+    monkeypatch.setattr(ctl, "_schedule_settings_persist", schedule_persist)
+    # With no stored choice the UI shows the first available mic.
+    assert ctl.get_settings()["micDevice"] == "USB Mic"
+
+    await ctl.update_settings({"micDevice": "USB Mic"})
+
+    assert web_api.Config.MIC_DEVICE == "USB Mic"
+    schedule_persist.assert_called_once_with()
+    ctl.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload", "attribute"),
+    [
+        ({"postProcessingModel": web_api.Config.DEFAULT_POST_PROCESSING_MODEL}, "POST_PROCESSING_MODEL"),
+        ({"postProcessingPrompt": web_api.Config._DEFAULT_POST_PROCESSING_PROMPT}, "POST_PROCESSING_PROMPT"),
+        ({"apiKeys": {"azureMaiRegion": "northeurope"}}, "AZURE_MAI_REGION"),
+        ({"apiKeys": {"azureMaiModel": "mai-transcribe-1.5"}}, "AZURE_MAI_MODEL"),
+    ],
+)
+async def test_update_settings_stores_an_explicit_save_of_a_displayed_default(
+    monkeypatch, tmp_path, payload, attribute
+):
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    monkeypatch.setenv("SCRIBER_SETTINGS_PERSIST_DEBOUNCE_SEC", "60")
+    monkeypatch.setattr(web_api.Config, attribute, "")
+    monkeypatch.setattr(web_api.Config, "persist_settings_files", MagicMock())
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    monkeypatch.setattr(ctl, "list_microphones", lambda: [{"deviceId": "default"}])
+    monkeypatch.setattr(ctl, "_device_monitor_enabled", True)
+    monkeypatch.setattr(ctl, "broadcast", AsyncMock())
+    schedule_persist = MagicMock(wraps=ctl._schedule_settings_persist)
+    monkeypatch.setattr(ctl, "_schedule_settings_persist", schedule_persist)
+    ctl.get_settings()
+
+    await ctl.update_settings(payload)
+
+    assert getattr(web_api.Config, attribute)
+    schedule_persist.assert_called_once_with()
+    ctl.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_settings_persist_debounce_is_capped_during_continuous_saves(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    monkeypatch.setenv("SCRIBER_SETTINGS_PERSIST_DEBOUNCE_SEC", "2")
+    monkeypatch.setattr(web_api, "_SETTINGS_PERSIST_MAX_DELAY_SECONDS", 5.0)
+    persist_mock = MagicMock()
+    monkeypatch.setattr(web_api.Config, "persist_settings_files", persist_mock)
+    real_loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(real_loop)
+    # Drop any startup migration timer so the burst starts from a clean slate.
+    ctl._cancel_settings_persist_timer()
+    ctl._settings_persist_pending = False
+    ctl._settings_persist_first_pending_at = None
+
+    class _FakeClockLoop:
+        def __init__(self) -> None:
+            self.now = 100.0
+            self.delays: list[float] = []
+
+        def time(self) -> float:
+            return self.now
+
+        def call_later(self, delay, _callback, *_args):
+            self.delays.append(delay)
+            return MagicMock()
+
+        def is_closed(self) -> bool:
+            return False
+
+    fake_loop = _FakeClockLoop()
+    ctl._loop = fake_loop
+    try:
+        for now in (100.0, 103.0, 104.0, 106.0):
+            fake_loop.now = now
+            ctl._schedule_settings_persist()
+        # Each save restarts the 2 s debounce, but never past first_pending_at + 5 s.
+        assert fake_loop.delays == [2.0, 2.0, 1.0, 0.0]
+        assert ctl._settings_persist_first_pending_at == 100.0
+
+        ctl._flush_settings_persist_sync()
+        persist_mock.assert_called_once_with()
+        assert ctl._settings_persist_first_pending_at is None
+
+        fake_loop.now = 110.0
+        ctl._schedule_settings_persist()
+        assert fake_loop.delays[-1] == 2.0
+    finally:
+        ctl._loop = real_loop
+    ctl.shutdown()
+    assert ctl._settings_persist_pending is False
+
+
 @pytest.mark.asyncio
 async def test_settings_persistence_retries_after_transient_write_failure(monkeypatch, tmp_path):
     monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
@@ -1214,6 +1554,7 @@ async def test_settings_persistence_retries_after_transient_write_failure(monkey
     monkeypatch.setenv("SCRIBER_SETTINGS_PERSIST_RETRY_SEC", "0.05")
     persist_mock = MagicMock(side_effect=[OSError("disk temporarily busy"), None])
     monkeypatch.setattr(web_api.Config, "persist_settings_files", persist_mock)
+    monkeypatch.setattr(web_api.Config, "LANGUAGE", "de")
     ctl = ScriberWebController(asyncio.get_running_loop())
 
     await ctl.update_settings({"language": "en"})
@@ -1398,6 +1739,7 @@ async def test_update_settings_flushes_pending_persist_on_shutdown(monkeypatch,
     monkeypatch.setenv("SCRIBER_SETTINGS_PERSIST_DEBOUNCE_SEC", "60")
     persist_mock = MagicMock()
     monkeypatch.setattr(web_api.Config, "persist_settings_files", persist_mock)
+    monkeypatch.setattr(web_api.Config, "LANGUAGE", "en")
     loop = asyncio.get_running_loop()
     ctl = ScriberWebController(loop)
 
@@ -2959,6 +3301,100 @@ async def test_broadcast_skips_serialization_without_clients():
         await ctl.broadcast({"type": "status", "status": "Idle"})
 
 
+@pytest.mark.asyncio
+async def test_broadcast_sends_one_encoded_text_frame_to_every_client():
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    frames: list[tuple[bytes, object]] = []
+
+    class _FrameSocket:
+        closed = False
+
+        async def send_frame(self, message, opcode):
+            frames.append((message, opcode))
+
+    await ctl.add_client(_FrameSocket())
+    await ctl.add_client(_FrameSocket())
+
+    await ctl.broadcast({"type": "status", "status": "Größe", "listening": False})
+
+    assert len(frames) == 2
+    assert frames[0][0] is frames[1][0]
+    assert {opcode for _message, opcode in frames} == {web_api.WSMsgType.TEXT}
+    assert json.loads(frames[0][0].decode("utf-8"))["status"] == "Größe"
+
+
+def test_json_bytes_encoder_prefers_orjson_and_falls_back_to_stdlib(monkeypatch):
+    payload = {"type": "status", "status": "Größe"}
+
+    monkeypatch.setattr(web_api, "HAS_ORJSON", False)
+    assert web_api._encode_json_bytes(payload) == b'{"type": "status", "status": "Gr\\u00f6\\u00dfe"}'
+
+    fake_orjson = types.SimpleNamespace(dumps=lambda value, option=0: b"fast")
+    monkeypatch.setattr(web_api, "HAS_ORJSON", True)
+    monkeypatch.setattr(web_api, "orjson", fake_orjson)
+    assert web_api._encode_json_bytes(payload) == b"fast"
+
+    def reject(_value, option=0):
+        raise TypeError("Dict key must be str")
+
+    fake_orjson.dumps = reject
+    assert json.loads(web_api._encode_json_bytes({1: "one"})) == {"1": "one"}
+
+
+@pytest.mark.parametrize("has_orjson", [False, True])
+def test_json_response_escapes_lone_surrogates(monkeypatch, has_orjson):
+    if has_orjson and web_api.orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(web_api, "HAS_ORJSON", has_orjson)
+
+    response = web_api._json_response({"title": "a\udc80b"})
+
+    assert response.status == 200
+    assert json.loads(response.body) == {"title": "a\udc80b"}
+    with pytest.raises(TypeError):
+        web_api._encode_json_bytes({"at": datetime(2030, 1, 2)})
+
+
+@pytest.mark.asyncio
+async def test_broadcast_prunes_dead_clients_without_a_registry_lock():
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    live = MagicMock(spec=web_api.web.WebSocketResponse, closed=False)
+    live.send_frame = AsyncMock()
+    dead = MagicMock(spec=web_api.web.WebSocketResponse, closed=True)
+    await ctl.add_client(live)
+    await ctl.add_client(dead)
+
+    await ctl.broadcast({"type": "status", "status": "Ready", "listening": False})
+
+    assert live.send_frame.await_count == 1
+    assert ctl._clients == {live}
+    assert dead not in ctl._client_send_locks
+    assert ctl._has_ws_clients()
+
+    await ctl.remove_client(live)
+    await ctl.broadcast({"type": "status", "status": "Ready", "listening": False})
+
+    assert live.send_frame.await_count == 1
+    assert not ctl._has_ws_clients()
+
+
+@pytest.mark.asyncio
+async def test_single_client_broadcast_sends_without_gathering_tasks():
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    ws = MagicMock(spec=web_api.web.WebSocketResponse, closed=False)
+    ws.send_frame = AsyncMock()
+    await ctl.add_client(ws)
+
+    with patch.object(web_api.asyncio, "gather", side_effect=AssertionError("gather used")):
+        await ctl.broadcast({"type": "status", "status": "Ready", "listening": False})
+
+    ws.send_frame.assert_awaited_once()
+    assert ctl._clients == {ws}
+
+
 @pytest.mark.asyncio
 async def test_audio_level_skips_broadcast_work_without_clients_or_overlay():
     loop = asyncio.get_running_loop()
@@ -2986,9 +3422,12 @@ async def test_audio_level_broadcast_is_throttled_to_sixty_hz():
     ctl._session_id = "s1"
     ctl._client_count = 1
     isolated_loop = MagicMock()
+    # A responsive loop runs each wakeup before the next meter tick.
+    isolated_loop.call_soon_threadsafe.side_effect = lambda callback, *args: callback(*args)
 
     with (
         patch.object(ctl, "_update_input_warning"),
+        patch.object(ctl, "_enqueue_audio_broadcast") as enqueue_mock,
         patch.object(ctl, "_loop", isolated_loop),
         patch("src.web_api.time.monotonic", side_effect=[100.0, 100.01, 100.02]),
     ):
@@ -2997,6 +3436,68 @@ async def test_audio_level_broadcast_is_throttled_to_sixty_hz():
         ctl._on_audio_level(0.04, session_id="s1")
 
     assert isolated_loop.call_soon_threadsafe.call_count == 2
+    assert [call.args[0]["rms"] for call in enqueue_mock.call_args_list] == [0.02, 0.04]
+
+
+@pytest.mark.asyncio
+async def test_audio_level_ticks_share_one_wakeup_while_loop_lags():
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    ctl._session_id = "s1"
+    ctl._client_count = 1
+    isolated_loop = MagicMock()
+
+    with (
+        patch.object(ctl, "_update_input_warning"),
+        patch.object(ctl, "_enqueue_audio_broadcast") as enqueue_mock,
+        patch.object(ctl, "_loop", isolated_loop),
+        patch("src.web_api.time.monotonic", side_effect=[100.0, 100.02, 100.04]),
+    ):
+        ctl._on_audio_level(0.02, session_id="s1")
+        ctl._on_audio_level(0.03, session_id="s1")
+        ctl._on_audio_level(0.04, session_id="s1")
+
+        assert isolated_loop.call_soon_threadsafe.call_count == 1
+        callback, *args = isolated_loop.call_soon_threadsafe.call_args.args
+        callback(*args)
+
+    enqueue_mock.assert_called_once()
+    assert enqueue_mock.call_args.args[0]["rms"] == 0.04
+    assert ctl._audio_level_inbox is None
+    assert ctl._audio_level_wakeup_pending is False
+
+
+@pytest.mark.asyncio
+async def test_audio_level_written_during_take_schedules_its_own_wakeup():
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    ctl._session_id = "s1"
+    ctl._client_count = 1
+    isolated_loop = MagicMock()
+    delivered: list[float] = []
+
+    def enqueue(payload):
+        delivered.append(payload["rms"])
+        if len(delivered) == 1:
+            # The audio thread publishes a newer level right after the take.
+            ctl._on_audio_level(0.05, session_id="s1")
+
+    with (
+        patch.object(ctl, "_update_input_warning"),
+        patch.object(ctl, "_enqueue_audio_broadcast", side_effect=enqueue),
+        patch.object(ctl, "_loop", isolated_loop),
+        patch("src.web_api.time.monotonic", side_effect=[100.0, 100.1]),
+    ):
+        ctl._on_audio_level(0.02, session_id="s1")
+        first_wakeup = isolated_loop.call_soon_threadsafe.call_args.args[0]
+        first_wakeup()
+
+        assert isolated_loop.call_soon_threadsafe.call_count == 2
+        assert ctl._audio_level_inbox["rms"] == 0.05
+        isolated_loop.call_soon_threadsafe.call_args.args[0]()
+
+    assert delivered == [0.02, 0.05]
+    assert ctl._audio_level_inbox is None
 
 
 @pytest.mark.asyncio
@@ -3027,6 +3528,30 @@ async def test_audio_level_broadcast_coalesces_pending_payloads():
     assert delivered == [0.1, 0.3]
 
 
+@pytest.mark.asyncio
+async def test_audio_level_ticks_reuse_one_writer_task_until_idle(monkeypatch):
+    monkeypatch.setattr(web_api, "_AUDIO_BROADCAST_WRITER_IDLE_SECONDS", 0.05)
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    delivered: list[float] = []
+
+    async def record_broadcast(payload):
+        delivered.append(float(payload["rms"]))
+
+    with patch.object(ctl, "broadcast", side_effect=record_broadcast):
+        ctl._enqueue_audio_broadcast({"type": "audio_level", "rms": 0.1})
+        writer = ctl._audio_broadcast_task
+        await asyncio.sleep(0.01)
+        ctl._enqueue_audio_broadcast({"type": "audio_level", "rms": 0.2})
+        await asyncio.sleep(0.01)
+
+        assert ctl._audio_broadcast_task is writer
+        assert delivered == [0.1, 0.2]
+
+        await asyncio.wait_for(writer, timeout=1.0)
+
+    assert ctl._audio_broadcast_task is None
+
+
 @pytest.mark.asyncio
 async def test_transcript_broadcast_coalesces_interim_but_preserves_finals():
     ctl = ScriberWebController(asyncio.get_running_loop())
@@ -3135,6 +3660,70 @@ async def test_control_broadcast_coalesces_latest_payload_per_event_type():
     ]
 
 
+@pytest.mark.asyncio
+async def test_control_broadcast_collapses_same_tick_status_burst():
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    delivered: list[str] = []
+
+    async def record_broadcast(payload):
+        delivered.append(str(payload["value"]))
+
+    with patch.object(ctl, "broadcast", side_effect=record_broadcast):
+        ctl._enqueue_control_broadcast({"type": "status", "value": "Stopping..."})
+        ctl._enqueue_control_broadcast({"type": "status", "value": "Transcribing..."})
+        ctl._enqueue_control_broadcast({"type": "status", "value": "Stopped"})
+        await ctl._control_broadcast_task
+
+    assert delivered == ["Stopped"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_status_skips_redundant_control_broadcasts():
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    delivered: list[str] = []
+
+    async def record_broadcast(payload):
+        delivered.append(str(payload["status"]))
+
+    with patch.object(ctl, "broadcast", side_effect=record_broadcast):
+        ctl._set_status("Listening")
+        ctl._set_status("Listening")
+        await asyncio.sleep(0)
+        await ctl._control_broadcast_task
+        await ctl._broadcast_transient_status("No speech detected", session_id=None)
+        ctl._set_status("Listening")
+        await asyncio.sleep(0)
+        await ctl._control_broadcast_task
+
+    assert delivered == ["Listening", "No speech detected", "Listening"]
+
+
+@pytest.mark.asyncio
+async def test_on_loop_callbacks_schedule_without_threadsafe_wakeup():
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+    delivered: list[str] = []
+
+    with (
+        patch.object(
+            ctl,
+            "_enqueue_control_broadcast",
+            side_effect=lambda payload: delivered.append(payload["status"]),
+        ) as enqueue,
+        patch.object(loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe) as threadsafe,
+    ):
+        ctl._set_status("Listening")
+        await asyncio.sleep(0)
+        assert delivered == ["Listening"]
+        threadsafe.assert_not_called()
+
+        await asyncio.to_thread(ctl._set_status, "Stopped")
+        await asyncio.sleep(0)
+
+    assert delivered == ["Listening", "Stopped"]
+    assert [call.args[0] for call in threadsafe.call_args_list].count(enqueue) == 1
+
+
 @pytest.mark.asyncio
 async def test_audio_level_updates_overlay_without_ws_clients():
     loop = asyncio.get_running_loop()
@@ -3186,7 +3775,7 @@ async def test_on_pipeline_done_persists_failed_live_session():
     assert rec.status == "failed"
     assert ctl._current is None
     assert ctl._session_id is None
-    assert rec in ctl._history
+    assert rec in ctl._history.values()
     save_mock.assert_awaited_once_with(rec)
 
 
@@ -3268,7 +3857,7 @@ async def test_completed_live_mic_session_is_persisted_and_searchable(monkeypatc
 
     assert stop_error is None
     assert rec.status == "completed"
-    assert rec in ctl._history
+    assert rec in ctl._history.values()
 
     listed = await ctl.list_transcripts(transcript_type="mic", include_content=False)
     assert listed["total"] == 1
@@ -3367,7 +3956,7 @@ async def test_stop_listening_marks_failed_when_stop_raises():
         in rec.content
     )
     assert ctl._status == "Error"
-    assert rec in ctl._history
+    assert rec in ctl._history.values()
 
 
 @pytest.mark.asyncio
@@ -3404,7 +3993,7 @@ async def test_stop_listening_suppresses_timeout_after_quiet_recording(monkeypat
     assert "[Error]" not in rec.content
     assert not error_payloads
     assert ctl._status == "Stopped"
-    assert rec in ctl._history
+    assert rec in ctl._history.values()
 
 
 class _SlowStopPipeline:
@@ -3521,7 +4110,7 @@ async def test_start_listening_missing_provider_key_returns_error_without_histor
     assert ctl.get_state()["recordingState"] == "idle"
     assert ctl._current is None
     assert ctl._pipeline_task is None
-    assert ctl._history == []
+    assert not ctl._history
     assert ctl._live_mic_start_in_progress_generation is None
     assert ctl._hot_path_tracers == {}
     pipeline_mock.assert_not_called()
@@ -4584,3 +5173,48 @@ async def test_toggle_hotkey_poll_loop_triggers_only_on_rising_edge():
         await asyncio.gather(task, return_exceptions=True)
 
     dispatch_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_hotkey_poller_parks_on_keyboard_hook_until_key_activity(monkeypatch):
+    loop = asyncio.get_running_loop()
+    ctl = ScriberWebController(loop)
+
+    class _HookingKeyboardStub:
+        def __init__(self) -> None:
+            self.callback = None
+
+        def hook(self, callback):
+            self.callback = callback
+            return callback
+
+        def unhook(self, handle) -> None:
+            assert handle is self.callback
+            self.callback = None
+
+    keyboard = _HookingKeyboardStub()
+    ctl._keyboard = keyboard
+    ctl._install_keyboard_wakeup_hook(keyboard)
+
+    # Idle pollers park on the hook wakeup and consume it.
+    tick = asyncio.create_task(ctl._await_hotkey_poll_tick(False))
+    await asyncio.sleep(0)
+    assert not tick.done()
+    keyboard.callback(object())
+    await tick
+    assert not ctl._hotkey_key_event.is_set()
+
+    # A stalled hook only delays the next poll by the backstop interval.
+    monkeypatch.setattr(web_api, "_HOTKEY_IDLE_POLL_BACKSTOP_SECONDS", 0)
+    await ctl._await_hotkey_poll_tick(False)
+
+    # Held keys and hookless setups keep the fixed tick and leave the wakeup alone.
+    monkeypatch.setattr(web_api, "_HOTKEY_POLL_INTERVAL_SECONDS", 0)
+    ctl._hotkey_key_event.set()
+    await ctl._await_hotkey_poll_tick(True)
+    assert ctl._hotkey_key_event.is_set()
+
+    ctl._remove_keyboard_wakeup_hook()
+    assert keyboard.callback is None
+    await ctl._await_hotkey_poll_tick(False)
+    assert ctl._hotkey_key_event.is_set()
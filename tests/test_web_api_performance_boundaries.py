@@ -181,3 +181,25 @@ async def test_cancelled_shutdown_audio_release_observes_cleanup_boundary():
     with pytest.raises(asyncio.CancelledError):
         await asyncio.wait_for(release_task, timeout=1.0)
     assert store.released == [_audio_claim()]
+
+
+def test_media_duration_probe_reuses_result_until_file_changes(monkeypatch, tmp_path):
+    media = tmp_path / "upload.wav"
+    media.write_bytes(b"RIFF0000")
+    probes: list[str] = []
+
+    def _fake_ffprobe(path):
+        probes.append(path.name)
+        return 12.5 if len(probes) == 1 else 30.0
+
+    monkeypatch.setattr(web_api, "_media_duration_cache", {})
+    monkeypatch.setattr(web_api, "_run_ffprobe_duration_seconds", _fake_ffprobe)
+
+    assert web_api._probe_media_duration_seconds(media) == 12.5
+    assert web_api._probe_media_duration_seconds(media) == 12.5
+    assert probes == ["upload.wav"]
+
+    media.write_bytes(b"RIFF00000000")
+    assert web_api._probe_media_duration_seconds(media) == 30.0
+    assert len(probes) == 2
+    assert web_api._probe_media_duration_seconds(tmp_path / "missing.wav") is None
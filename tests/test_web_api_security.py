@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 import sys
 import time
@@ -23,6 +24,18 @@ def test_safe_upload_filename_sanitizes_invalid_chars():
     assert ">" not in out
 
 
+def test_safe_upload_filename_replaces_control_and_reserved_chars():
+    assert web_api._safe_upload_filename('a:b*c?"d|e\x00f\x1fg\x7f.wav ..') == "a_b_c__d_e_f_g\x7f.wav"
+
+
+def test_safe_upload_filename_prefixes_windows_reserved_stems():
+    assert web_api._safe_upload_filename("con.wav") == "_con.wav"
+    assert web_api._safe_upload_filename("LPT1") == "_LPT1"
+    assert web_api._safe_upload_filename("nul.tar.gz") == "nul.tar.gz"
+    assert web_api._safe_upload_filename(".hidden") == ".hidden"
+    assert web_api._safe_upload_filename("console.wav") == "console.wav"
+
+
 def test_safe_upload_filename_bounds_length_and_preserves_extension():
     out = web_api._safe_upload_filename(f"{'a' * 400}.mp3")
 
@@ -30,6 +43,60 @@ def test_safe_upload_filename_bounds_length_and_preserves_extension():
     assert out.endswith(".mp3")
 
 
+def test_hotkey_normalization_round_trips_modifier_aliases():
+    assert web_api._normalize_hotkey_for_backend("Control + Option + Cmd + D") == "ctrl+alt+windows+d"
+    assert web_api._normalize_hotkey_for_backend(" Shift +  + F12 ") == "shift+f12"
+    assert web_api._normalize_hotkey_for_backend("") == ""
+    assert web_api._hotkey_to_display("ctrl+alt+windows+d") == "Ctrl + Alt + Meta + D"
+    assert web_api._hotkey_to_display("win+shift+space") == "Meta + Shift + space"
+    assert web_api._hotkey_to_display("") == ""
+
+
+def test_server_loop_factory_uses_uvloop_only_off_windows(monkeypatch):
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.new_event_loop = lambda: None
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+    monkeypatch.setattr(web_api.os, "name", "posix")
+    assert web_api._server_loop_factory() is fake_uvloop.new_event_loop
+
+    monkeypatch.setattr(web_api.os, "name", "nt")
+    assert web_api._server_loop_factory() is None
+
+    monkeypatch.setattr(web_api.os, "name", "posix")
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert web_api._server_loop_factory() is None
+
+
+def test_json_response_shim_matches_aiohttp_json_response_headers():
+    response = web_api._json_response({"message": "Gr\u00fc\u00dfe", "items": [1, 2]}, status=409)
+
+    assert response.status == 409
+    assert response.content_type == "application/json"
+    assert response.charset == "utf-8"
+    assert json.loads(response.body) == {"message": "Gr\u00fc\u00dfe", "items": [1, 2]}
+
+
+def test_settings_setter_tables_name_existing_config_setters():
+    for _key, setter_name in (*web_api._SETTINGS_PLAIN_SETTERS, *web_api._SETTINGS_BOOL_SETTERS):
+        assert callable(getattr(web_api.Config, setter_name))
+    for _key, attr, _env_var in web_api._SETTINGS_TEXT_ATTRIBUTES:
+        assert hasattr(web_api.Config, attr)
+    for service in web_api._SETTINGS_API_KEY_SERVICES:
+        assert service in web_api.Config.SERVICE_API_KEY_MAP
+    for _key, attr, _env_var, _blank_default in web_api._SETTINGS_API_KEY_ATTRIBUTES:
+        assert hasattr(web_api.Config, attr)
+
+
+def test_format_duration_labels_short_and_long_recordings():
+    assert web_api._format_duration(-5) == "00:00"
+    assert web_api._format_duration(0.9) == "00:00"
+    assert web_api._format_duration(59.99) == "00:59"
+    assert web_api._format_duration(3599) == "59:59"
+    assert web_api._format_duration(3600) == "1:00:00"
+    assert web_api._format_duration(3 * 3600 + 62) == "3:01:02"
+
+
 def test_origin_allowed_defaults(monkeypatch):
     monkeypatch.delenv("SCRIBER_ALLOWED_ORIGINS", raising=False)
     assert web_api._origin_allowed("http://localhost:3000")
@@ -53,12 +120,35 @@ def test_origin_allowed_from_env(monkeypatch):
     assert web_api._origin_allowed("https://changed.example")
     assert not web_api._origin_allowed("https://example.com")
 
+    monkeypatch.setenv("SCRIBER_ALLOWED_ORIGINS", "https://trailing.example/")
+    assert web_api._parse_allowed_origins() == frozenset({"https://trailing.example"})
+    assert web_api._origin_allowed("https://trailing.example")
+
 
 def test_origin_allowed_wildcard(monkeypatch):
     monkeypatch.setenv("SCRIBER_ALLOWED_ORIGINS", "*")
     assert web_api._origin_allowed("https://any.example")
 
 
+def test_default_origin_verdict_is_parsed_once_per_origin(monkeypatch):
+    monkeypatch.delenv("SCRIBER_ALLOWED_ORIGINS", raising=False)
+    monkeypatch.setattr(web_api, "_default_origin_verdicts", {})
+    parsed: list[str] = []
+    real_urlparse = web_api.urlparse
+
+    def counting_urlparse(value, *args, **kwargs):
+        parsed.append(value)
+        return real_urlparse(value, *args, **kwargs)
+
+    monkeypatch.setattr(web_api, "urlparse", counting_urlparse)
+
+    for _ in range(3):
+        assert web_api._origin_allowed("http://localhost:5173")
+        assert not web_api._origin_allowed("https://evil.example")
+
+    assert parsed == ["http://localhost:5173", "https://evil.example"]
+
+
 def test_safe_youtube_thumbnail_url_allows_only_youtube_thumbnail_hosts():
     assert (
         web_api._safe_youtube_thumbnail_url("https://i.ytimg.com/vi/abc123/hqdefault.jpg")
@@ -1077,6 +1167,26 @@ async def test_session_token_middleware_protects_ws_settings_and_transcript_rout
     assert settings_with_query_token.status == 200
 
 
+@pytest.mark.asyncio
+async def test_ws_handshake_declines_permessage_deflate(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRIBER_SESSION_TOKEN", "secret")
+    monkeypatch.setenv("SCRIBER_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRIBER_DISABLE_DEVICE_MONITOR", "1")
+    ctl = ScriberWebController(asyncio.get_running_loop())
+    client = TestClient(TestServer(web_api.create_app(ctl)))
+    await client.start_server()
+    try:
+        websocket = await client.ws_connect("/ws?scriberToken=secret", compress=15)
+        try:
+            assert (await websocket.receive_json())["type"] == "state"
+            assert websocket.compress == 0
+        finally:
+            await websocket.close()
+    finally:
+        await client.close()
+        ctl.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_session_token_middleware_protects_local_model_routes(monkeypatch, tmp_path):
     monkeypatch.setenv("SCRIBER_SESSION_TOKEN", "secret")
@@ -1178,6 +1288,13 @@ async def test_tauri_origin_can_fetch_health(monkeypatch, tmp_path):
         assert response.status == 200
         assert response.headers["Access-Control-Allow-Origin"] == "http://tauri.localhost"
         assert response.headers["Access-Control-Allow-Credentials"] == "true"
+        assert response.headers["Vary"] == "Origin"
+        assert response.headers["Access-Control-Allow-Methods"] == "GET,POST,PUT,PATCH,DELETE,OPTIONS"
+
+        anonymous = await client.get("/api/health")
+        assert anonymous.headers["Access-Control-Allow-Origin"] == "*"
+        assert "Access-Control-Allow-Credentials" not in anonymous.headers
+        assert "X-Scriber-Token" in anonymous.headers["Access-Control-Allow-Headers"]
     finally:
         await client.close()
         ctl.shutdown()